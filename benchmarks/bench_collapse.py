@@ -0,0 +1,59 @@
+"""
+Benchmark collapse_networks() on a synthetic 1M-prefix IPv4 table.
+
+The table mixes whole /24 blocks split into siblings, covered
+more-specifics and random noise, similar to aggregated customer lists.
+
+Usage:
+    python -m benchmarks.bench_collapse [prefixes]
+"""
+
+import ipaddress
+import random
+import sys
+import time
+
+from netsome.types import IPv4Network
+from netsome.utils import collapse_networks
+
+
+def synthetic_table(size: int, seed: int = 0) -> list[IPv4Network]:
+    rnd = random.Random(seed)
+    networks: list[IPv4Network] = []
+    while len(networks) < size:
+        base = rnd.randrange(2**24) << 8
+        kind = rnd.random()
+        if kind < 0.4:
+            # /24 split into sibling /26s
+            networks += (IPv4Network.from_int(base + i * 64, 26) for i in range(4))
+        elif kind < 0.6:
+            # /24 with a covered more-specific
+            networks.append(IPv4Network.from_int(base, 24))
+            networks.append(IPv4Network.from_int(base + 128, 25))
+        else:
+            prefixlen = rnd.randint(16, 32)
+            addr = base & (2**32 - 2 ** (32 - prefixlen))
+            networks.append(IPv4Network.from_int(addr, prefixlen))
+
+    rnd.shuffle(networks)
+    return networks[:size]
+
+
+def main() -> None:
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    networks = synthetic_table(size)
+
+    start = time.perf_counter()
+    collapsed = collapse_networks(networks)
+    elapsed = time.perf_counter() - start
+    print(f"netsome   {size} -> {len(collapsed)} prefixes: {elapsed:.2f}s")
+
+    stdlib = [ipaddress.IPv4Network(str(network)) for network in networks]
+    start = time.perf_counter()
+    expected = list(ipaddress.collapse_addresses(stdlib))
+    elapsed = time.perf_counter() - start
+    print(f"ipaddress {size} -> {len(expected)} prefixes: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
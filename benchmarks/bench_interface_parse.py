@@ -0,0 +1,75 @@
+"""
+Benchmark Interface name classification.
+
+Names are generated like the interface column of "show interfaces" dumps
+of a mixed fleet: mostly canonical names of physical ports, with some
+subinterfaces, logical interfaces and abbreviations. The previous parser,
+one re.match() per dialect in turn, is compared against the combined
+pattern used by Interface.
+
+Usage:
+    python -m benchmarks.bench_interface_parse [count]
+"""
+
+import random
+import re
+import sys
+import time
+
+from netsome import constants as c
+from netsome.types import Interface
+
+
+def legacy_match(string: str):
+    for tp, pattern in c.IFACE_PATTERNS.items():
+        if match := re.match(pattern, string):
+            groups = match.groupdict()
+            return tp, groups["value"], groups.get("sub")
+
+    return None
+
+
+def names(count: int) -> list[str]:
+    rnd = random.Random(0)
+
+    def port() -> str:
+        return f"{rnd.randrange(1, 9)}/{rnd.randrange(2)}/{rnd.randrange(1, 49)}"
+
+    makers = (
+        (30, lambda: f"GigabitEthernet{port()}"),
+        (20, lambda: f"Ethernet{port()}"),
+        (10, lambda: f"FastEthernet0/{rnd.randrange(1, 49)}"),
+        (10, lambda: f"xe{port()}"),
+        (5, lambda: f"ce{port()}"),
+        (5, lambda: f"GigabitEthernet{port()}.{rnd.randrange(1, 4095)}"),
+        (5, lambda: f"Gi{port()}"),
+        (5, lambda: f"Vlan{rnd.randrange(1, 4095)}"),
+        (4, lambda: f"Port-channel{rnd.randrange(1, 128)}"),
+        (3, lambda: f"Loopback{rnd.randrange(8)}"),
+        (3, lambda: f"mgmt{rnd.randrange(2)}"),
+    )
+    weights = [weight for weight, _ in makers]
+    funcs = [func for _, func in makers]
+    return [rnd.choices(funcs, weights)[0]() for _ in range(count)]
+
+
+def measure(func, items: list[str]) -> float:
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return (time.perf_counter() - start) / len(items) * 1e9
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    items = names(count)
+    assert all(Interface._match(name) == legacy_match(name) for name in items[:10_000])
+
+    print(f"{count} names")
+    print(f"  per-dialect loop   {measure(legacy_match, items):6.0f} ns")
+    print(f"  combined pattern   {measure(Interface._match, items):6.0f} ns")
+    print(f"  Interface()        {measure(Interface, items):6.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
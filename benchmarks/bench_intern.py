@@ -0,0 +1,61 @@
+"""
+Benchmark memory and time of interning repeated values.
+
+Builds a list of ASNs and IPv4 addresses drawn from a small set of hot
+values, like the AS paths and next hops of a routing table, once with
+the constructors and once through intern().
+
+Usage:
+    python -m benchmarks.bench_intern [count]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from netsome._converters import ipv4 as convs
+from netsome.types import ASN
+from netsome.types import IPv4Address
+
+
+def build(factory, values: list) -> tuple[float, float]:
+    # ns per value, timed without tracing, and bytes per value of the list
+    start = time.perf_counter()
+    objs = [factory(value) for value in values]
+    elapsed = time.perf_counter() - start
+    del objs
+
+    tracemalloc.start()
+    try:
+        objs = [factory(value) for value in values]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(objs) == len(values)
+    return elapsed / len(values) * 1e9, size / len(values)
+
+
+def report(name: str, values: list, cls) -> None:
+    print(name)
+    for label, factory in (("constructor", cls), ("intern()", cls.intern)):
+        ns, size = build(factory, values)
+        print(f"  {label:12} {ns:6.0f} ns {size:6.1f} B")
+    print(f"  {cls.intern_pool!r}")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rnd = random.Random(0)
+
+    asns = [rnd.randrange(64512, 64512 + 1000) for _ in range(count)]
+    report("ASN (1000 distinct)", asns, ASN)
+
+    hops = [convs.int_to_address(rnd.getrandbits(32)) for _ in range(500)]
+    addresses = [rnd.choice(hops) for _ in range(count)]
+    report("IPv4Address (500 distinct)", addresses, IPv4Address)
+
+
+if __name__ == "__main__":
+    main()
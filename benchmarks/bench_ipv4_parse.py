@@ -0,0 +1,61 @@
+"""
+Benchmark IPv4 address and network parsing from strings.
+
+Compares the previous multi-pass pipeline (validate every octet, then
+convert) against the single-pass parser used by the constructors, with
+the standard library ipaddress module as a reference.
+
+Usage:
+    python -m benchmarks.bench_ipv4_parse [count]
+"""
+
+import ipaddress
+import random
+import sys
+import time
+
+from netsome._converters import ipv4 as convs
+from netsome.types import IPv4Address
+from netsome.types import IPv4Network
+from netsome.validators import ipv4 as valids
+
+
+def legacy(address: str) -> int:
+    octets = address.split(".")
+    if len(octets) != 4:
+        raise ValueError(address)
+    for octet in octets:
+        valids.validate_octet_str(octet)
+    return convs.address_to_int(address)
+
+
+def measure(func, items: list[str]) -> float:
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return (time.perf_counter() - start) / len(items) * 1e9
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rnd = random.Random(0)
+    addresses = [convs.int_to_address(rnd.getrandbits(32)) for _ in range(count)]
+    networks = [
+        convs.int_to_address(rnd.getrandbits(24) << 8) + "/24" for _ in range(count)
+    ]
+
+    print(f"legacy pipeline           {measure(legacy, addresses):7.0f} ns")
+    print(f"IPv4Address()             {measure(IPv4Address, addresses):7.0f} ns")
+    print(
+        f"ipaddress.IPv4Address()   "
+        f"{measure(ipaddress.IPv4Address, addresses):7.0f} ns"
+    )
+    print(f"IPv4Network()             {measure(IPv4Network, networks):7.0f} ns")
+    print(
+        f"ipaddress.IPv4Network()   "
+        f"{measure(ipaddress.IPv4Network, networks):7.0f} ns"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark IPv6 address parsing and formatting.
+
+Compares the previous pipeline (validate, then convert with a second set
+of splits; format through group strings and a compression pass) against
+the single-pass parser and the table driven RFC 5952 formatter, with the
+standard library ipaddress module as a reference.
+
+Usage:
+    python -m benchmarks.bench_ipv6_parse [count]
+"""
+
+import ipaddress
+import random
+import sys
+import time
+
+from netsome import constants as c
+from netsome._converters import ipv6 as convs
+from netsome.types import IPv6Address
+from netsome.types import IPv6Network
+
+
+def _legacy_groups(string: str) -> list[str]:
+    if "::" in string:
+        if string.count("::") > 1:
+            raise ValueError(string)
+        head, tail = string.split("::")
+        left = [group for group in head.split(":") if group] if head else []
+        right = [group for group in tail.split(":") if group] if tail else []
+        if len(left) + len(right) >= c.IPV6.GROUPS_COUNT:
+            raise ValueError(string)
+        return left + ["0"] * (8 - len(left) - len(right)) + right
+
+    groups = string.split(":")
+    if len(groups) != c.IPV6.GROUPS_COUNT:
+        raise ValueError(string)
+    return groups
+
+
+def legacy_parse(string: str) -> int:
+    # validator pass: split and check every group
+    for group in _legacy_groups(string.lower()):
+        if not group or len(group) > 4:
+            raise ValueError(string)
+        if not c.IPV6.GROUP_MIN <= int(group, 16) <= c.IPV6.GROUP_MAX:
+            raise ValueError(string)
+
+    # converter pass: split and convert every group again
+    number = 0
+    for i, group in enumerate(_legacy_groups(string.lower())):
+        value = int(group, 16)
+        if not c.IPV6.GROUP_MIN <= value <= c.IPV6.GROUP_MAX:
+            raise ValueError(string)
+        number |= value << ((c.IPV6.GROUPS_COUNT - 1 - i) * c.IPV6.BITS_PER_GROUP)
+    return number
+
+
+def legacy_format(number: int) -> str:
+    groups = [
+        f"{number >> (16 * (c.IPV6.GROUPS_COUNT - 1 - i)) & 0xFFFF:x}"
+        for i in range(c.IPV6.GROUPS_COUNT)
+    ]
+    groups = ":".join(groups).split(":")
+
+    best_start, best_len, start, length = -1, 0, -1, 0
+    for i, group in enumerate([*groups, "x"]):
+        if group == "0":
+            start, length = (i, 1) if start == -1 else (start, length + 1)
+        else:
+            if length > best_len:
+                best_start, best_len = start, length
+            start, length = -1, 0
+
+    if best_len < 2:
+        return ":".join(groups)
+
+    left = ":".join(groups[:best_start])
+    right = ":".join(groups[best_start + best_len :])
+    return f"{left}::{right}"
+
+
+def measure(func, items: list, rounds: int = 3) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for item in items:
+            func(item)
+        timings.append(time.perf_counter() - start)
+    return min(timings) / len(items) * 1e9
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rnd = random.Random(0)
+    numbers = []
+    for _ in range(count):
+        number = 0
+        for _ in range(c.IPV6.GROUPS_COUNT):
+            number = number << 16 | rnd.choice((0, 0, 1, rnd.getrandbits(16)))
+        numbers.append(number)
+
+    addresses = [convs.int_to_address(number) for number in numbers]
+    networks = [f"{convs.int_to_address(n & convs.NETMASKS[64])}/64" for n in numbers]
+
+    print("parse")
+    print(f"  legacy pipeline           {measure(legacy_parse, addresses):7.0f} ns")
+    print(
+        f"  parse_address()           {measure(convs.parse_address, addresses):7.0f} ns"
+    )
+    print(f"  IPv6Address()             {measure(IPv6Address, addresses):7.0f} ns")
+    print(
+        f"  ipaddress.IPv6Address()   "
+        f"{measure(ipaddress.IPv6Address, addresses):7.0f} ns"
+    )
+    print(f"  IPv6Network()             {measure(IPv6Network, networks):7.0f} ns")
+    print(
+        f"  ipaddress.IPv6Network()   "
+        f"{measure(ipaddress.IPv6Network, networks):7.0f} ns"
+    )
+
+    objects = [ipaddress.IPv6Address(number) for number in numbers]
+    print("format")
+    print(f"  legacy formatter          {measure(legacy_format, numbers):7.0f} ns")
+    print(
+        f"  int_to_address()          {measure(convs.int_to_address, numbers):7.0f} ns"
+    )
+    print(f"  str(ipaddress)            {measure(str, objects):7.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
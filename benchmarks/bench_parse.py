@@ -0,0 +1,82 @@
+"""
+Benchmark parse() dispatch against the previous exception cascade.
+
+The cascade tried every constructor in turn and suppressed the errors,
+so inputs in the last listed format paid for every failed attempt.
+Inputs here are picked from the formats late in those lists.
+
+Usage:
+    python -m benchmarks.bench_parse [count]
+"""
+
+import contextlib
+import sys
+import time
+
+import netsome
+from netsome.types import ASN
+from netsome.types import IPv4Network
+from netsome.types import MacAddress
+
+
+def cascade(*fmts):
+    def parse(value):
+        for fmt in fmts:
+            with contextlib.suppress(Exception):
+                return fmt(value)
+        raise ValueError(value)
+
+    return parse
+
+
+CASES = (
+    (
+        "IPv4Network",
+        "10.1.2/24",
+        cascade(
+            IPv4Network,
+            IPv4Network.from_address,
+            IPv4Network.from_cidr,
+            IPv4Network.from_octets,
+        ),
+        IPv4Network.parse,
+    ),
+    (
+        "MacAddress",
+        "0011.2233.4455",
+        cascade(
+            MacAddress,
+            MacAddress.from_dashed,
+            MacAddress.from_coloned,
+            MacAddress.from_dotted,
+            MacAddress.from_int,
+        ),
+        MacAddress.parse,
+    ),
+    (
+        "ASN",
+        "4200000000",
+        cascade(ASN, ASN.from_asdot, ASN.from_asdotplus, ASN.from_asplain),
+        ASN.parse,
+    ),
+)
+
+
+def measure(func, value, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        func(value)
+    return (time.perf_counter() - start) / count * 1e9
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    for name, value, legacy, parse in CASES:
+        print(f"{name:<12} {value!r}")
+        print(f"  cascade      {measure(legacy, value, count):7.0f} ns")
+        print(f"  parse()      {measure(parse, value, count):7.0f} ns")
+        print(f"  parse_any()  {measure(netsome.parse_any, value, count):7.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark the LRU parse cache on a stream of repeated strings.
+
+Strings are drawn from a few thousand distinct values, like the
+addresses, MACs and interface names of a syslog stream, and parsed with
+the parse cache disabled and enabled.
+
+Usage:
+    python -m benchmarks.bench_parse_cache [count]
+"""
+
+import random
+import sys
+import time
+
+import netsome
+from netsome._converters import ipv4 as convs
+from netsome.types import Interface
+from netsome.types import IPv4Address
+from netsome.types import IPv4Network
+from netsome.types import IPv6Address
+from netsome.types import MacAddress
+
+
+DISTINCT = 2000
+
+
+def stream(count: int, make) -> list[str]:
+    rnd = random.Random(0)
+    values = [make(rnd) for _ in range(DISTINCT)]
+    return [rnd.choice(values) for _ in range(count)]
+
+
+def measure(cls, strings: list[str]) -> float:
+    start = time.perf_counter()
+    for string in strings:
+        cls(string)
+    return (time.perf_counter() - start) / len(strings) * 1e9
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    cases = (
+        (IPv4Address, lambda rnd: convs.int_to_address(rnd.getrandbits(32))),
+        (IPv6Address, lambda rnd: f"2001:db8::{rnd.getrandbits(16):x}:1"),
+        (IPv4Network, lambda rnd: f"10.{rnd.randrange(256)}.{rnd.randrange(256)}.0/24"),
+        (MacAddress, lambda rnd: f"{rnd.getrandbits(48):012x}"),
+        (
+            Interface,
+            lambda rnd: rnd.choice(("GigabitEthernet", "Gi", "FastEthernet", "Fa"))
+            + f"{rnd.randrange(8)}/{rnd.randrange(48)}",
+        ),
+    )
+    for cls, make in cases:
+        strings = stream(count, make)
+        netsome.enable_parse_cache(False)
+        disabled = measure(cls, strings)
+        netsome.enable_parse_cache()
+        enabled = measure(cls, strings)
+        hit_rate = netsome.parse_cache_stats()[cls.__name__]["hit_rate"]
+        print(
+            f"{cls.__name__:12} disabled {disabled:6.0f} ns"
+            + f"  enabled {enabled:6.0f} ns  hit rate {hit_rate:.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark covering and covered queries over a large prefix collection.
+
+Prefixes are generated like a full IPv4 table: mostly /24s, with /16-/23
+aggregates and some /8-/15s, so prefixes nest. A loop over
+contains_subnet() is compared against PrefixIndex queries.
+
+Usage:
+    python -m benchmarks.bench_prefix_index [count]
+"""
+
+import random
+import sys
+import time
+
+from netsome.tables import PrefixIndex
+from netsome.types import IPv4Network
+
+
+def prefixes(count: int) -> list[IPv4Network]:
+    rnd = random.Random(0)
+    lengths = (8, 12, 16, 19, 20, 22, 23, 24, 24, 24, 24, 24)
+    networks = []
+    for _ in range(count):
+        prefixlen = rnd.choice(lengths)
+        addr = rnd.getrandbits(32) >> (32 - prefixlen) << (32 - prefixlen)
+        networks.append(IPv4Network.from_int(addr, prefixlen))
+    return networks
+
+
+def measure(func, queries: list[IPv4Network]) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        for _ in func(query):
+            pass
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 900_000
+    networks = prefixes(count)
+    queries = prefixes(1000)[:20]
+
+    start = time.perf_counter()
+    index = PrefixIndex(networks)
+    print(f"{count} prefixes, build {time.perf_counter() - start:.2f} s")
+
+    def loop_covered_by(query):
+        return (n for n in networks if n == query or query.contains_subnet(n))
+
+    def loop_covering(query):
+        return (n for n in networks if n == query or n.contains_subnet(query))
+
+    print(f"  covered_by loop    {measure(loop_covered_by, queries):10.0f} us")
+    print(f"  covered_by index   {measure(index.covered_by, queries):10.0f} us")
+    print(f"  covering loop      {measure(loop_covering, queries):10.0f} us")
+    print(f"  covering index     {measure(index.covering, queries):10.0f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark random sampling and permuted iteration of network hosts.
+
+random.sample() over a materialized host list is compared against
+IPv4Network.sample(), which picks indexes of the lazy hosts() range, and
+the rate of permuted_hosts() is compared against plain hosts() iteration.
+
+Usage:
+    python -m benchmarks.bench_sample [prefixlen]
+"""
+
+import random
+import sys
+import time
+
+from netsome.types import IPv4Network
+from netsome.types import IPv6Network
+
+
+def measure(func, repeat: int = 5) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main() -> None:
+    prefixlen = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    net = IPv4Network(f"10.0.0.0/{prefixlen}")
+    net6 = IPv6Network("2001:db8::/64")
+
+    def sample_list():
+        return random.sample(list(net.hosts()), 1000)
+
+    def iterate(hosts):
+        return lambda: sum(1 for _ in hosts())
+
+    print(f"IPv4 /{prefixlen}, {net.hosts().size} hosts, k=1000")
+    print(f"  random.sample(list)  {measure(sample_list):8.2f} ms")
+    print(f"  sample()             {measure(lambda: net.sample(1000)):8.2f} ms")
+    print("IPv6 /64, k=1000")
+    print(f"  sample()             {measure(lambda: net6.sample(1000)):8.2f} ms")
+    print(f"IPv4 /{prefixlen}, full iteration")
+    print(f"  hosts()              {measure(iterate(net.hosts), 1):8.2f} ms")
+    print(f"  permuted_hosts()     {measure(iterate(net.permuted_hosts), 1):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Benchmark subnets() of a /8 into /24s.
+
+Compares the library path, which builds subnets with trusted constructors,
+against building the same networks through the validating from_int(), both
+as is and inside netsome.trusted().
+
+Usage:
+    python -m benchmarks.bench_subnets [rounds]
+"""
+
+import sys
+import time
+
+import netsome
+from netsome.types import IPv4Network
+
+
+def validated(network: IPv4Network, prefixlen: int) -> list[IPv4Network]:
+    start, current = network.as_tuple()
+    step = 1 << (32 - prefixlen)
+    stop = start + (1 << (32 - current))
+    return [IPv4Network.from_int(addr, prefixlen) for addr in range(start, stop, step)]
+
+
+def best(func, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    network = IPv4Network("10.0.0.0/8")
+
+    def trusted() -> None:
+        with netsome.trusted():
+            validated(network, 24)
+
+    print(f"from_int()           {best(lambda: validated(network, 24), rounds):.3f}s")
+    print(f"from_int() trusted   {best(trusted, rounds):.3f}s")
+    print(
+        f"subnets()            {best(lambda: list(network.subnets(24)), rounds):.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
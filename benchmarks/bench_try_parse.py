@@ -0,0 +1,78 @@
+"""
+Benchmark filtering log tokens with try_parse()/is_valid().
+
+Tokens are 90% invalid (words, numbers, near misses) and 10% valid,
+like the tokens of a log line. Catching constructor exceptions is
+compared against the non-raising APIs.
+
+Usage:
+    python -m benchmarks.bench_try_parse [count]
+"""
+
+import random
+import sys
+import time
+
+from netsome._converters import ipv4 as convs
+from netsome.types import IPv4Address
+from netsome.types import MacAddress
+
+
+INVALID = (
+    "GET",
+    "/index.html",
+    "HTTP/1.1",
+    "200",
+    "1532",
+    "-",
+    "Mozilla/5.0",
+    "10.0.0.256",
+    "10.0.0",
+    "2024-01-01T00:00:00",
+    "session=3fa85f64",
+    "aa:bb:cc:dd:ee",
+)
+
+
+def tokens(count: int, valid) -> list[str]:
+    rnd = random.Random(0)
+    return [
+        valid(rnd) if rnd.random() < 0.1 else rnd.choice(INVALID) for _ in range(count)
+    ]
+
+
+def catching(factory):
+    def parse(value):
+        try:
+            return factory(value)
+        except (TypeError, ValueError):
+            return None
+
+    return parse
+
+
+def measure(func, items: list[str]) -> float:
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return (time.perf_counter() - start) / len(items) * 1e9
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    addresses = tokens(count, lambda rnd: convs.int_to_address(rnd.getrandbits(32)))
+    print("IPv4Address")
+    print(f"  try/except   {measure(catching(IPv4Address), addresses):6.0f} ns")
+    print(f"  try_parse()  {measure(IPv4Address.try_parse, addresses):6.0f} ns")
+    print(f"  is_valid()   {measure(IPv4Address.is_valid, addresses):6.0f} ns")
+
+    macs = tokens(count, lambda rnd: f"{rnd.getrandbits(48):012x}")
+    print("MacAddress.parse")
+    print(f"  try/except   {measure(catching(MacAddress.parse), macs):6.0f} ns")
+    print(f"  try_parse()  {measure(MacAddress.try_parse, macs):6.0f} ns")
+    print(f"  is_valid()   {measure(MacAddress.is_valid, macs):6.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark validate_many() over an inventory-like export.
+
+Rows are IPv4 networks with 5% invalid values. Serial validation is
+compared against worker processes.
+
+Usage:
+    python -m benchmarks.bench_validate_many [rows] [workers]
+"""
+
+import os
+import random
+import sys
+import time
+
+from netsome._converters import ipv4 as convs
+from netsome.validators import validate_many
+
+
+def rows(count: int) -> list[str]:
+    rnd = random.Random(0)
+    result = []
+    for _ in range(count):
+        network = convs.int_to_address(rnd.getrandbits(24) << 8) + "/24"
+        if rnd.random() < 0.05:
+            network = network.replace("/24", rnd.choice(("/8", "/33", "")))
+        result.append(network)
+    return result
+
+
+def measure(count: int, **kwargs) -> tuple[float, int]:
+    values = rows(count)
+    start = time.perf_counter()
+    errors = sum(1 for _ in validate_many("ipv4_network", values, **kwargs))
+    return time.perf_counter() - start, errors
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+
+    elapsed, errors = measure(count)
+    print(f"serial        {elapsed:.2f}s  {errors} errors")
+    elapsed, errors = measure(count, workers=workers)
+    print(f"{workers} workers     {elapsed:.2f}s  {errors} errors")
+
+
+if __name__ == "__main__":
+    main()
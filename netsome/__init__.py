@@ -0,0 +1,12 @@
+from netsome._parse_cache import enable_parse_cache
+from netsome._parse_cache import parse_cache_stats
+from netsome._parsing import parse_any
+from netsome._trust import trusted
+
+
+__all__ = [
+    "enable_parse_cache",
+    "parse_any",
+    "parse_cache_stats",
+    "trusted",
+]
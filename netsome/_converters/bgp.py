@@ -32,3 +32,44 @@ def asplain_to_community(number: int) -> str:
 def community_to_asplain(string: str) -> int:
     asn, value = map(int, string.split(c.DELIMITERS.COLON, maxsplit=1))
     return asn * c.BYTES.TWO + value
+
+
+def _parse_decimal(string: str, max_value: int) -> int | None:
+    if not (string.isascii() and string.isdigit()):
+        return None
+
+    number = int(string)
+    return number if number <= max_value else None
+
+
+def parse_asplain(string: str) -> int | None:
+    """ASN from asplain decimal string, None if invalid."""
+    return _parse_decimal(string, c.BGP.ASN_MAX)
+
+
+def parse_asdotplus(string: str) -> int | None:
+    """ASN from "HIGH.LOW" asdot+ string, None if invalid."""
+    high_order, dot, low_order = string.partition(c.DELIMITERS.DOT)
+    if not dot:
+        return None
+
+    high = _parse_decimal(high_order, c.BGP.ASN_ORDER_MAX)
+    low = _parse_decimal(low_order, c.BGP.ASN_ORDER_MAX)
+    if high is None or low is None:
+        return None
+
+    return high * c.BYTES.TWO + low
+
+
+def parse_community(string: str) -> int | None:
+    """Community as 32-bit int from "ASN:VALUE" string, None if invalid."""
+    asn, colon, value = string.partition(c.DELIMITERS.COLON)
+    if not colon:
+        return None
+
+    high = _parse_decimal(asn, c.BGP.ASN_ORDER_MAX)
+    low = _parse_decimal(value, c.BGP.ASN_ORDER_MAX)
+    if high is None or low is None:
+        return None
+
+    return high * c.BYTES.TWO + low
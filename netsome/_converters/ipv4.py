@@ -1,6 +1,75 @@
 from netsome import constants as c
 
 
+_ADDRESS_MAX = c.IPV4.ADDRESS_MAX.value
+
+# netmask and hostmask of every prefixlen, indexed by prefixlen
+NETMASKS = tuple(
+    _ADDRESS_MAX ^ (_ADDRESS_MAX >> prefixlen)
+    for prefixlen in range(c.IPV4.PREFIXLEN_MAX + 1)
+)
+HOSTMASKS = tuple(netmask ^ _ADDRESS_MAX for netmask in NETMASKS)
+
+# canonical decimal form of every octet, leading zeros are not allowed
+_OCTETS = {str(octet): octet for octet in range(c.IPV4.OCTET_MAX + 1)}
+
+
+def parse_octet(string: str) -> int | None:
+    """Value of a canonical decimal octet, None if string is not one."""
+    return _OCTETS.get(string)
+
+
+def parse_address(string: str) -> int | None:
+    """
+    Validate and convert dotted decimal address in a single pass.
+
+    Every octet is checked and converted by one lookup in the table of
+    canonical octet strings, so the string is split once and no exception
+    is raised for invalid input.
+
+    Returns:
+        Address as int, None if string is not a valid address
+    """
+    parts = string.split(c.DELIMITERS.DOT)
+    if len(parts) != c.IPV4.OCTETS_COUNT:
+        return None
+
+    get = _OCTETS.get
+    a, b, c_, d = get(parts[0]), get(parts[1]), get(parts[2]), get(parts[3])
+    if a is None or b is None or c_ is None or d is None:
+        return None
+
+    return a << 24 | b << 16 | c_ << 8 | d
+
+
+def parse_prefixlen(string: str) -> int | None:
+    """Prefix length from decimal string, None if invalid."""
+    if not (string.isascii() and string.isdigit()):
+        return None
+
+    prefixlen = int(string)
+    return prefixlen if prefixlen <= c.IPV4.PREFIXLEN_MAX else None
+
+
+def parse_cidr(string: str) -> tuple[int, int] | None:
+    """
+    Validate and convert "address/prefixlen" string in a single pass.
+
+    Returns:
+        Address as int and prefixlen, None if string is not a valid CIDR
+    """
+    addr, slash, prefixlen = string.partition(c.DELIMITERS.SLASH)
+    if not slash:
+        return None
+
+    number = parse_address(addr)
+    length = parse_prefixlen(prefixlen)
+    if number is None or length is None:
+        return None
+
+    return number, length
+
+
 def address_to_int(string: str) -> int:
     octets = map(int, string.split(c.DELIMITERS.DOT, maxsplit=3))
     return int.from_bytes(octets, byteorder="big")
@@ -1,186 +1,174 @@
+import re
+import struct
+
 from netsome import constants as c
+from netsome._converters import ipv4
+
+
+_ADDRESS_MAX = c.IPV6.ADDRESS_MAX.value
+_GROUPS_COUNT = c.IPV6.GROUPS_COUNT.value
+
+# netmask and hostmask of every prefixlen, indexed by prefixlen
+NETMASKS = tuple(
+    _ADDRESS_MAX ^ (_ADDRESS_MAX >> prefixlen)
+    for prefixlen in range(c.IPV6.PREFIXLEN_MAX + 1)
+)
+HOSTMASKS = tuple(netmask ^ _ADDRESS_MAX for netmask in NETMASKS)
+
+# colon separated groups of 1-4 hex digits with at most one "::",
+# group count is checked separately
+_GROUP = "[0-9a-fA-F]{1,4}"
+_GROUPS = f"(?:{_GROUP}(?::{_GROUP})*)?"
+_match_groups = re.compile(f"{_GROUPS}(?:::{_GROUPS})?").fullmatch
+
+# low bit of every 16-bit group and the multiplier gathering those bits
+# into one byte, group 0 ends up in the most significant bit
+_GROUP_LOW_BITS = sum(1 << (16 * i) for i in range(_GROUPS_COUNT))
+_GATHER = sum(1 << (112 - 15 * i) for i in range(_GROUPS_COUNT))
+
+_unpack_groups = struct.Struct(f">{_GROUPS_COUNT}H").unpack
+
+
+def _longest_zero_run(zeros: int) -> tuple[int, int]:
+    # RFC 5952: the longest run of at least two zero groups, first one on tie
+    best_start = best_stop = 0
+    start = None
+    for i in range(_GROUPS_COUNT + 1):
+        if i < _GROUPS_COUNT and zeros >> (_GROUPS_COUNT - 1 - i) & 1:
+            if start is None:
+                start = i
+        elif start is not None:
+            if i - start > max(best_stop - best_start, 1):
+                best_start, best_stop = start, i
+            start = None
+
+    return best_start, best_stop
+
+
+def _format_template(zeros: int) -> tuple[str, int, int]:
+    start, stop = _longest_zero_run(zeros)
+    if start == stop:
+        return ":".join(["%x"] * _GROUPS_COUNT), _GROUPS_COUNT, _GROUPS_COUNT
+
+    left = ":".join(["%x"] * start)
+    right = ":".join(["%x"] * (_GROUPS_COUNT - stop))
+    return f"{left}::{right}", start, stop
+
+
+# RFC 5952 format string and the skipped zero run for every combination
+# of zero groups, indexed by a byte with a bit set for every zero group
+_TEMPLATES = tuple(_format_template(zeros) for zeros in range(1 << _GROUPS_COUNT))
+_EXPANDED = ":".join(["%04x"] * _GROUPS_COUNT)
+
+
+def parse_address(string: str) -> int | None:
+    """
+    Validate and convert IPv6 address string in a single pass.
+
+    Accepts every RFC 4291 text form: full, "::" compressed and with the
+    low 32 bits written as an embedded dotted decimal IPv4 address after
+    any leading groups. The whole form, group sizes and hex digits are
+    checked by one regex match, the groups are then converted by a single
+    int() call and no exception is raised for invalid input.
+
+    Returns:
+        Address as int, None if string is not a valid address
+    """
+    if c.DELIMITERS.DOT in string:
+        head, _, tail = string.rpartition(c.DELIMITERS.COLON)
+        low = ipv4.parse_address(tail)
+        if not head or low is None:
+            return None
+
+        # embedded address stands for the last two groups
+        high = parse_address(f"{head}:0:0")
+        return None if high is None else high | low
+
+    if _match_groups(string) is None:
+        return None
+
+    head, compressed, tail = string.partition("::")
+    if compressed:
+        left = head.split(c.DELIMITERS.COLON) if head else []
+        right = tail.split(c.DELIMITERS.COLON) if tail else []
+        missing = _GROUPS_COUNT - len(left) - len(right)
+        if missing < 1:
+            return None
+
+        groups = left + ["0"] * missing + right
+    else:
+        groups = string.split(c.DELIMITERS.COLON)
+        if len(groups) != _GROUPS_COUNT:
+            return None
+
+    return int("".join([group.zfill(4) for group in groups]), 16)
+
+
+def parse_prefixlen(string: str) -> int | None:
+    """Prefix length from decimal string, None if invalid."""
+    if not (string.isascii() and string.isdigit()):
+        return None
+
+    prefixlen = int(string)
+    return prefixlen if prefixlen <= c.IPV6.PREFIXLEN_MAX else None
+
+
+def parse_cidr(string: str) -> tuple[int, int] | None:
+    """
+    Validate and convert "address/prefixlen" string in a single pass.
+
+    Returns:
+        Address as int and prefixlen, None if string is not a valid CIDR
+    """
+    addr, slash, prefixlen = string.partition(c.DELIMITERS.SLASH)
+    if not slash:
+        return None
+
+    number = parse_address(addr)
+    length = parse_prefixlen(prefixlen)
+    if number is None or length is None:
+        return None
+
+    return number, length
 
 
 def address_to_int(string: str) -> int:
     """Convert IPv6 address string to 128-bit integer."""
-    string = string.lower()
-
-    # Handle IPv4-mapped IPv6 addresses (::ffff:192.0.2.1)
-    if "." in string:
-        return _handle_ipv4_mapped(string)
-
-    # Handle :: compression or regular format
-    groups = _parse_address_groups(string)
-
-    # Convert groups to integer
-    return _groups_to_int(groups)
-
-
-def _handle_ipv4_mapped(string: str) -> int:
-    """Handle IPv4-mapped IPv6 addresses."""
-    if string.startswith("::ffff:"):
-        ipv4_part = string[7:]  # Remove '::ffff:'
-        ipv4_octets = ipv4_part.split(".")
-        if len(ipv4_octets) == 4:
-            ipv4_int = int.from_bytes(
-                bytes(int(octet) for octet in ipv4_octets), byteorder="big"
-            )
-            return (0xFFFF << 32) + ipv4_int
-    raise ValueError(
-        f"Unsupported IPv4-mapped format: {string}. "
-        + "Only '::ffff:x.x.x.x' format is supported (e.g., '::ffff:192.0.2.1')"
-    )
-
-
-def _parse_address_groups(string: str) -> list[str]:
-    """Parse IPv6 address string into groups."""
-    if "::" in string:
-        return _handle_compression(string)
-    else:
-        return _handle_regular_format(string)
-
-
-def _handle_compression(string: str) -> list[str]:
-    """Handle :: compression in IPv6 address."""
-    if string.count("::") > 1:
-        raise ValueError(
-            f"Invalid address '{string}': multiple '::' compressions found. "
-            + "Only one '::' is allowed per address"
-        )
-
-    parts = string.split("::")
-    left_groups = parts[0].split(":") if parts[0] else []
-    right_groups = parts[1].split(":") if parts[1] else []
-
-    # Remove empty strings from splitting
-    left_groups = [g for g in left_groups if g]
-    right_groups = [g for g in right_groups if g]
-
-    # Calculate missing groups
-    missing_groups = c.IPV6.GROUPS_COUNT - len(left_groups) - len(right_groups)
-    if missing_groups < 0:
-        raise ValueError(
-            f"Invalid address '{string}': too many groups. "
-            + f"Expected at most {c.IPV6.GROUPS_COUNT} groups"
-        )
-
-    # Reconstruct full groups list
-    return left_groups + ["0"] * missing_groups + right_groups
-
-
-def _handle_regular_format(string: str) -> list[str]:
-    """Handle regular IPv6 address format without compression."""
-    groups = string.split(":")
-    if len(groups) != c.IPV6.GROUPS_COUNT:
-        raise ValueError(
-            f"Invalid number of groups: {len(groups)}, "
-            + f"expected: {c.IPV6.GROUPS_COUNT}"
-        )
-    return groups
-
-
-def _groups_to_int(groups: list[str]) -> int:
-    """Convert list of hex groups to integer."""
-    result = 0
-    for i, group in enumerate(groups):
-        if not group:
-            group = "0"
-        if len(group) > 4:
-            raise ValueError(
-                f"Invalid IPv6 group '{group}': groups must be 1-4 hexadecimal digits"
-            )
-
-        try:
-            group_int = int(group, 16)
-        except ValueError:
-            raise ValueError(
-                f"Invalid IPv6 group '{group}': "
-                + "must contain only hexadecimal digits (0-9, a-f)"
-            )
-
-        if not (c.IPV6.GROUP_MIN <= group_int <= c.IPV6.GROUP_MAX):
-            raise ValueError(
-                f"Invalid IPv6 group value {group_int}: "
-                + f"must be between {c.IPV6.GROUP_MIN} and {c.IPV6.GROUP_MAX}"
-            )
-
-        result |= group_int << ((c.IPV6.GROUPS_COUNT - 1 - i) * c.IPV6.BITS_PER_GROUP)
-
-    return result
+    number = parse_address(string)
+    if number is None:
+        raise ValueError(f'Provided value "{string}" is invalid IPv6 address')
+
+    return number
 
 
 def int_to_address(number: int) -> str:
-    """Convert 128-bit integer to IPv6 address string."""
-    if not (c.IPV6.ADDRESS_MIN <= number <= c.IPV6.ADDRESS_MAX):
+    """
+    Convert 128-bit integer to RFC 5952 IPv6 address string.
+
+    Zero groups are found without splitting the address: every 16-bit group
+    is OR-folded into its low bit and one multiplication gathers those bits
+    into a byte. The byte selects a precomputed format string with the
+    longest zero run already replaced by "::".
+    """
+    if not (0 <= number <= _ADDRESS_MAX):
         raise ValueError(f"Address integer out of range: {number}")
 
-    # Extract groups
-    groups: list[str] = []
-    for i in range(c.IPV6.GROUPS_COUNT):
-        shift = (c.IPV6.GROUPS_COUNT - 1 - i) * c.IPV6.BITS_PER_GROUP
-        group = (number >> shift) & c.IPV6.GROUP_MAX
-        groups.append(f"{group:x}")
-
-    # Apply compression rules
-    return _compress_address(":".join(groups))
-
-
-def _compress_address(address: str) -> str:
-    """Apply IPv6 compression rules to address string."""
-    groups = address.split(":")
-
-    # Find the longest sequence of consecutive zero groups
-    max_zero_start = -1
-    max_zero_length = 0
-    current_zero_start = -1
-    current_zero_length = 0
-
-    for i, group in enumerate(groups):
-        if group == "0":
-            if current_zero_start == -1:
-                current_zero_start = i
-                current_zero_length = 1
-            else:
-                current_zero_length += 1
-        else:
-            if current_zero_length > max_zero_length:
-                max_zero_start = current_zero_start
-                max_zero_length = current_zero_length
-            current_zero_start = -1
-            current_zero_length = 0
-
-    # Check final sequence
-    if current_zero_length > max_zero_length:
-        max_zero_start = current_zero_start
-        max_zero_length = current_zero_length
-
-    # Apply compression if we found a sequence of 2 or more zeros
-    if max_zero_length >= 2:
-        left = groups[:max_zero_start]
-        right = groups[max_zero_start + max_zero_length :]
-
-        if not left and not right:
-            return "::"
-        elif not left:
-            return "::" + ":".join(right)
-        elif not right:
-            return ":".join(left) + "::"
-        else:
-            return ":".join(left) + "::" + ":".join(right)
-
-    return address
+    folded = number | number >> 8
+    folded |= folded >> 4
+    folded |= folded >> 2
+    folded |= folded >> 1
+    nonzero = (folded & _GROUP_LOW_BITS) * _GATHER >> 112 & 0xFF
 
+    template, start, stop = _TEMPLATES[nonzero ^ 0xFF]
+    groups = _unpack_groups(number.to_bytes(16, byteorder="big"))
+    return template % (groups[:start] + groups[stop:])
 
-def expand_address(address: str) -> str:
-    """Expand IPv6 address to full form without compression."""
-    # Convert to int and back to get standardized form
-    addr_int = address_to_int(address)
 
-    # Extract groups and format with leading zeros
-    groups: list[str] = []
-    for i in range(c.IPV6.GROUPS_COUNT):
-        shift = (c.IPV6.GROUPS_COUNT - 1 - i) * c.IPV6.BITS_PER_GROUP
-        group = (addr_int >> shift) & c.IPV6.GROUP_MAX
-        groups.append(f"{group:04x}")
+def int_to_expanded(number: int) -> str:
+    """Convert 128-bit integer to full IPv6 address string without compression."""
+    return _EXPANDED % _unpack_groups(number.to_bytes(16, byteorder="big"))
+
 
-    return ":".join(groups)
+def expand_address(address: str) -> str:
+    """Expand IPv6 address to full form without compression."""
+    return int_to_expanded(address_to_int(address))
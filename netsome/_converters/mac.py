@@ -0,0 +1,13 @@
+import re
+
+
+# MAC-48 as 12 hex digits without delimiters
+_match_address = re.compile("[0-9a-fA-F]{12}").fullmatch
+
+
+def parse_address(string: str) -> int | None:
+    """MAC address from 12 hex digits string, None if invalid."""
+    if _match_address(string) is None:
+        return None
+
+    return int(string, 16)
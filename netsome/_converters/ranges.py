@@ -0,0 +1,75 @@
+import collections.abc as cabc
+
+
+def range_to_cidrs(
+    start: int,
+    stop: int,
+    width: int,
+) -> cabc.Generator[tuple[int, int], None, None]:
+    """
+    Convert half-open address range [start, stop) to the minimal CIDR cover.
+
+    Every step emits the largest block that is both aligned at `start`
+    (trailing zeros) and fits into the rest of the range (bit length),
+    so the work is O(1) per emitted (address, prefixlen) pair.
+    """
+    while start < stop:
+        size = start & -start or 1 << width
+        fit = 1 << ((stop - start).bit_length() - 1)
+        if size > fit:
+            size = fit
+
+        yield start, width - size.bit_length() + 1
+        start += size
+
+
+def merge_ranges(ranges: cabc.Iterable[tuple[int, int]]) -> list[int]:
+    """
+    Merge half-open ranges into a flat sorted list of boundaries.
+
+    Result is [start0, stop0, start1, stop1, ...] where overlapping and
+    adjacent ranges are joined, so boundaries are strictly increasing.
+    """
+    bounds: list[int] = []
+    for start, stop in sorted(ranges):
+        if bounds and start <= bounds[-1]:
+            if stop > bounds[-1]:
+                bounds[-1] = stop
+        else:
+            bounds += (start, stop)
+
+    return bounds
+
+
+def combine_bounds(
+    left: list[int],
+    right: list[int],
+    op: cabc.Callable[[bool, bool], bool],
+) -> list[int]:
+    """
+    Linear merge of two boundary lists produced by merge_ranges().
+
+    `op` tells whether a point belongs to the result given its membership
+    in left and right, e.g. operator.or_ gives the union.
+    """
+    result: list[int] = []
+    inside = False
+    i = j = 0
+    len_left, len_right = len(left), len(right)
+    while i < len_left or j < len_right:
+        if j == len_right or (i < len_left and left[i] <= right[j]):
+            point = left[i]
+        else:
+            point = right[j]
+
+        if i < len_left and left[i] == point:
+            i += 1
+        if j < len_right and right[j] == point:
+            j += 1
+
+        # odd count of passed boundaries means inside a range
+        if op(bool(i & 1), bool(j & 1)) != inside:
+            inside = not inside
+            result.append(point)
+
+    return result
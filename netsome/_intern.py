@@ -0,0 +1,115 @@
+import contextlib
+import threading
+import typing as t
+import weakref
+
+
+T = t.TypeVar("T")
+
+
+class InternPool(t.Generic[T]):
+    """
+    Bounded pool of canonical objects keyed by their int value.
+
+    Values are held weakly, an object leaves the pool as soon as nothing
+    else references it. While an object is in the pool every lookup of its
+    key returns that very object, so equal interned objects are identical.
+    Once the pool holds `maxsize` live objects new values are returned
+    without being interned.
+
+    Args:
+        maxsize: Maximum number of live interned objects
+
+    Examples:
+        >>> ASN.intern(65000) is ASN.intern(65000)
+        True
+        >>> ASN.intern_pool.hits, ASN.intern_pool.misses
+        (1, 1)
+    """
+
+    __slots__ = ("_refs", "_maxsize", "_lock", "hits", "misses")
+
+    def __init__(self, maxsize: int = 2**16) -> None:
+        # plain dict of weak references, a WeakValueDictionary lookup
+        # costs a python level call
+        self._refs: dict[int, weakref.KeyedRef] = {}
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        """Shrinking does not evict, the pool only stops growing."""
+        if not isinstance(value, int):
+            raise TypeError(
+                f'Provided invalid value "{value=}" of type "{type(value)}", '
+                + "int expected"
+            )
+
+        if value < 0:
+            raise ValueError(f'Provided invalid value "{value=}", must be >= 0')
+
+        self._maxsize = value
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: int) -> T | None:
+        """Interned object for key, None on a miss."""
+        ref = self._refs.get(key)
+        if ref is not None:
+            obj = ref()
+            if obj is not None:
+                self.hits += 1
+                return obj
+
+        self.misses += 1
+        return None
+
+    def add(self, key: int, obj: T) -> T:
+        """
+        Intern obj under key if the pool is not full.
+
+        Returns:
+            Interned object, the one added by another thread meanwhile wins
+        """
+        with self._lock:
+            ref = self._refs.get(key)
+            if ref is not None:
+                interned = ref()
+                if interned is not None:
+                    return interned
+
+            if len(self._refs) < self._maxsize:
+                self._refs[key] = weakref.KeyedRef(obj, self._remove, key)
+
+        return obj
+
+    def _remove(self, ref: weakref.KeyedRef) -> None:
+        # called when an interned object dies, key may hold a newer one
+        with contextlib.suppress(KeyError):
+            if self._refs[ref.key] is ref:
+                del self._refs[ref.key]
+
+    def clear(self) -> None:
+        """Drop all interned objects and reset counters."""
+        with self._lock:
+            self._refs.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(size={len(self)}, maxsize={self._maxsize},"
+            + f" hits={self.hits}, misses={self.misses})"
+        )
@@ -0,0 +1,166 @@
+import collections
+import collections.abc as cabc
+import threading
+import typing as t
+
+
+T = t.TypeVar("T")
+
+
+class ParseCache(t.Generic[T]):
+    """
+    Thread-safe LRU cache of parse results keyed by the input string.
+
+    Sits in front of a string constructor and stores what its parser
+    returned, so a repeated string skips parsing and validation. Objects
+    are still created per call, only immutable parse results are shared.
+    Invalid strings are not cached. Disabled caches pass every call
+    straight to the parser.
+
+    Args:
+        name: Name of the cached type, key of parse_cache_stats()
+        maxsize: Maximum number of cached strings
+
+    Examples:
+        >>> IPv4Address.parse_cache.enabled = True
+        >>> IPv4Address("10.0.0.1") == IPv4Address("10.0.0.1")
+        True
+        >>> IPv4Address.parse_cache.hits
+        1
+    """
+
+    __slots__ = ("name", "enabled", "_maxsize", "_results", "_lock", "hits", "misses")
+
+    def __init__(self, name: str, maxsize: int = 4096) -> None:
+        self._results: collections.OrderedDict[str, T] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.name = name
+        self.enabled = False
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        if not isinstance(value, int):
+            raise TypeError(
+                f'Provided invalid value "{value=}" of type "{type(value)}", '
+                + "int expected"
+            )
+
+        if value < 0:
+            raise ValueError(f'Provided invalid value "{value=}", must be >= 0')
+
+        with self._lock:
+            self._maxsize = value
+            while len(self._results) > value:
+                self._results.popitem(last=False)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def lookup(self, string: str, parse: cabc.Callable[[str], T]) -> T:
+        """Parse result of string, parse is called on a miss only."""
+        if not self.enabled or not isinstance(string, str):
+            return parse(string)
+
+        with self._lock:
+            result = self._results.get(string)
+            if result is not None:
+                self._results.move_to_end(string)
+                self.hits += 1
+                return result
+
+        # parse outside of the lock, errors propagate and are not cached
+        result = parse(string)
+        with self._lock:
+            self.misses += 1
+            self._results[string] = result
+            if len(self._results) > self._maxsize:
+                self._results.popitem(last=False)
+
+        return result
+
+    def clear(self) -> None:
+        """Drop cached results and reset counters."""
+        with self._lock:
+            self._results.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, t.Any]:
+        return {
+            "enabled": self.enabled,
+            "size": len(self),
+            "maxsize": self._maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+        }
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}("{self.name}", enabled={self.enabled},'
+            + f" size={len(self)}, maxsize={self._maxsize},"
+            + f" hits={self.hits}, misses={self.misses})"
+        )
+
+
+_CACHES: dict[str, ParseCache[t.Any]] = {}
+
+
+def register(name: str, maxsize: int = 4096) -> ParseCache[t.Any]:
+    cache: ParseCache[t.Any] = ParseCache(name, maxsize)
+    _CACHES[name] = cache
+    return cache
+
+
+def enable_parse_cache(enabled: bool = True, **maxsizes: int) -> None:
+    """
+    Enable or disable the parse caches of all types at runtime.
+
+    Disabling drops cached results. Keyword arguments set size limits of
+    single caches, e.g. enable_parse_cache(Interface=10_000).
+
+    Raises:
+        ValueError: If a keyword is not a cached type name
+
+    Examples:
+        >>> netsome.enable_parse_cache(IPv4Address=50_000, MacAddress=10_000)
+        >>> netsome.enable_parse_cache(False)
+    """
+    unknown = maxsizes.keys() - _CACHES.keys()
+    if unknown:
+        raise ValueError(
+            f'Unknown parse cache "{sorted(unknown)}", '
+            + f"expected one of {sorted(_CACHES)}"
+        )
+
+    for name, maxsize in maxsizes.items():
+        _CACHES[name].maxsize = maxsize
+
+    for cache in _CACHES.values():
+        cache.enabled = enabled
+        if not enabled:
+            cache.clear()
+
+
+def parse_cache_stats() -> dict[str, dict[str, t.Any]]:
+    """
+    Counters of every parse cache by type name.
+
+    Examples:
+        >>> netsome.parse_cache_stats()["Interface"]
+        {'enabled': True, 'size': 812, 'maxsize': 4096, 'hits': 99188,
+         'misses': 812, 'hit_rate': 0.99188}
+    """
+    return {name: cache.stats() for name, cache in _CACHES.items()}
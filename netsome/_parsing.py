@@ -0,0 +1,110 @@
+import typing as t
+
+from netsome import constants as c
+from netsome.types.bgp import ASN
+from netsome.types.ipv4 import IPv4Address
+from netsome.types.ipv4 import IPv4Network
+from netsome.types.ipv6 import IPv6Address
+from netsome.types.ipv6 import IPv6Network
+from netsome.types.mac import MacAddress
+
+
+Parsed: t.TypeAlias = (
+    IPv4Address | IPv4Network | IPv6Address | IPv6Network | MacAddress | ASN
+)
+
+# asplain fits into 10 decimal digits, a MAC address is 12 hex digits
+_ASPLAIN_DIGITS_MAX = len(str(c.BGP.ASN_MAX.value))
+
+
+def _is_decimal(string: str) -> bool:
+    return string.isascii() and string.isdigit()
+
+
+def _classify_coloned(string: str, colons: int) -> t.Callable[[str], Parsed]:
+    # IPv6 without "::" has 7 colons, or 6 with an embedded IPv4 address
+    if (
+        "::" not in string
+        and colons != c.IPV6.GROUPS_COUNT - 1
+        and c.DELIMITERS.DOT not in string
+    ):
+        return MacAddress.from_coloned
+
+    if c.DELIMITERS.SLASH in string:
+        return IPv6Network
+
+    return IPv6Address
+
+
+def _classify(string: str) -> t.Callable[[str], Parsed]:
+    colons = string.count(c.DELIMITERS.COLON)
+    if colons:
+        return _classify_coloned(string, colons)
+
+    if c.DELIMITERS.SLASH in string:
+        return IPv4Network.parse
+
+    if c.DELIMITERS.DASH in string:
+        return MacAddress.from_dashed
+
+    dots = string.count(c.DELIMITERS.DOT)
+    if dots:
+        if _is_decimal(string.replace(c.DELIMITERS.DOT, "")):
+            if dots == c.IPV4.OCTETS_COUNT - 1:
+                return IPv4Address
+            if dots == 1:
+                return ASN.from_asdotplus
+        return MacAddress.from_dotted
+
+    if _is_decimal(string) and len(string) <= _ASPLAIN_DIGITS_MAX:
+        return ASN.from_asplain
+
+    return MacAddress
+
+
+def parse_any(value: str) -> Parsed:
+    """
+    Parse a string into the matching netsome type.
+
+    The type is picked from delimiter counts and character classes of the
+    string, so only one constructor runs and a valid value never costs an
+    exception. Addresses win over networks: "10.0.0.1" is an IPv4Address
+    while "10.0.0.0/8" and shorthand forms like "10/8" are IPv4Network.
+
+    Recognized formats:
+        - IPv4Address: "192.0.2.1"
+        - IPv4Network: "192.0.2.0/24", "10/8"
+        - IPv6Address: "2001:db8::1", "::ffff:192.0.2.1"
+        - IPv6Network: "2001:db8::/32"
+        - MacAddress: "00:11:22:33:44:55", "00-11-22-33-44-55",
+          "0011.2233.4455", "001122334455"
+        - ASN: "65000" (asplain), "1.10" (asdot+)
+
+    Args:
+        value: String to parse
+
+    Returns:
+        Instance of IPv4Address, IPv4Network, IPv6Address, IPv6Network,
+        MacAddress or ASN
+
+    Raises:
+        TypeError: If value is not a string
+        ValueError: If value is not a valid value of the detected type
+
+    Examples:
+        >>> parse_any("2001:db8::/32")
+        IPv6Network("2001:db8::/32")
+        >>> parse_any("00:11:22:33:44:55")
+        MacAddress("001122334455")
+        >>> parse_any("65000")
+        ASN(65000)
+    """
+    if not isinstance(value, str):
+        raise TypeError(
+            f'Provided invalid value "{value=}" of type "{type(value)}", str expected'
+        )
+
+    try:
+        return _classify(value)(value)
+    except (TypeError, ValueError) as err:
+        raise ValueError(f'Unable to parse "{value}" of type "{type(value)}"') from err
@@ -0,0 +1,31 @@
+import collections.abc as cabc
+import contextlib
+import contextvars
+
+
+_TRUSTED = contextvars.ContextVar("netsome_trusted", default=False)
+
+
+def is_trusted() -> bool:
+    return _TRUSTED.get()
+
+
+@contextlib.contextmanager
+def trusted() -> cabc.Generator[None, None, None]:
+    """
+    Skip validation of int values passed to from_int() constructors.
+
+    Meant for loading data that was already validated, e.g. integers stored
+    by netsome itself. Invalid values passed while trusted produce broken
+    objects instead of errors. The flag is a context variable, so it only
+    affects the current thread or asyncio task.
+
+    Examples:
+        >>> with netsome.trusted():
+        ...     addresses = [IPv4Address.from_int(row) for row in rows]
+    """
+    token = _TRUSTED.set(True)
+    try:
+        yield
+    finally:
+        _TRUSTED.reset(token)
@@ -64,6 +64,12 @@ class VLAN(enum.IntEnum):
     VID_DEFAULT = 1
 
 
+class VLAN_RANGE_STYLES(str, enum.Enum):
+    CISCO = "cisco"
+    ARISTA = "arista"
+    JUNIPER = "juniper"
+
+
 class BGP(enum.IntEnum):
     ASN_MIN = 0
     ASN_MAX = BYTES.FOUR - 1
@@ -81,6 +87,24 @@ class MAC(enum.IntEnum):
     ADDRESS64_MAX = BYTES.EIGHT - 1
 
 
+class VALIDATION_KINDS(str, enum.Enum):
+    IPV4_ADDRESS = "ipv4_address"
+    IPV4_NETWORK = "ipv4_network"
+    IPV6_ADDRESS = "ipv6_address"
+    IPV6_NETWORK = "ipv6_network"
+    MAC = "mac"
+    VLAN = "vlan"
+    ASN = "asn"
+    INTERFACE = "interface"
+
+
+class VALIDATION_ERRORS(str, enum.Enum):
+    TYPE = "type"
+    FORMAT = "format"
+    RANGE = "range"
+    HOST_BITS = "host_bits"
+
+
 class IFACE_VAL_PATTERN(enum.Enum):
     VAL = re.compile(r"(?P<value>\d+)")
     VAL_EXTENDED = re.compile(rf"{VAL.pattern[:-1]}" + r"((\/\d+)?){1,2})")
@@ -164,3 +188,21 @@ IFACE_PATTERNS = {
         re.IGNORECASE,
     ),
 }
+
+# all dialects of IFACE_PATTERNS in one alternation tried in the same order,
+# so a name is classified by a single regex run; every dialect is a group
+# named after its type, with value and sub groups prefixed by the type name
+IFACE_PATTERN = re.compile(
+    "^(?:"
+    + "|".join(
+        f"(?P<{tp.name}>"
+        + pattern.pattern.removeprefix("^")
+        .removesuffix("$")
+        .replace("?P<value>", f"?P<{tp.name}_value>")
+        .replace("?P<sub>", f"?P<{tp.name}_sub>")
+        + ")"
+        for tp, pattern in IFACE_PATTERNS.items()
+    )
+    + ")$",
+    re.IGNORECASE,
+)
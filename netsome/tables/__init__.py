@@ -0,0 +1,22 @@
+"""
+Lookup tables package providing structures for bulk queries over networks.
+
+The package includes:
+- IPv4PrefixTable: DIR-24-8 longest-prefix-match table for IPv4 networks
+- IPv6PrefixTable: path-compressed multibit trie for IPv6 networks
+- PrefixIndex: sorted interval index for covering and covered queries
+
+Tables store networks by their integer form and answer queries without
+scanning the stored networks one by one.
+"""
+
+from netsome.tables.index import PrefixIndex
+from netsome.tables.ipv4 import IPv4PrefixTable
+from netsome.tables.ipv6 import IPv6PrefixTable
+
+
+__all__ = [
+    "IPv4PrefixTable",
+    "IPv6PrefixTable",
+    "PrefixIndex",
+]
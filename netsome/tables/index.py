@@ -0,0 +1,195 @@
+# pyright: strict, reportUnnecessaryIsInstance=false, reportUnreachable=false
+
+import array
+import bisect
+import collections.abc as cabc
+import typing as t
+
+from netsome import constants as c
+from netsome.types.ipv4 import IPv4Network
+from netsome.types.ipv6 import IPv6Network
+
+
+Network = t.TypeVar("Network", IPv4Network, IPv6Network)
+
+_WIDTHS: dict[type[t.Any], int] = {
+    IPv4Network: c.IPV4.PREFIXLEN_MAX.value,
+    IPv6Network: c.IPV6.PREFIXLEN_MAX.value,
+}
+
+# a prefix is stored as one int, address above prefixlen, so int order is
+# (address, prefixlen) order: a prefix sorts before everything it covers
+_LEN_BITS = 8
+_LEN_MASK = (1 << _LEN_BITS) - 1
+
+
+class PrefixIndex(t.Generic[Network]):
+    """
+    Read-only index of IPv4 or IPv6 networks for covering and covered queries.
+
+    Networks are kept as a sorted array of (address, prefixlen) keys. Since
+    two prefixes are either nested or disjoint, the prefixes covered by a
+    network are one contiguous run of the array found by two binary searches,
+    and every prefix stores the position of the closest prefix covering it,
+    so covering prefixes are a walk up that chain. Queries cost O(log n + k)
+    for k results and yield results lazily.
+
+    Duplicate networks are stored once. The index is built once, create a
+    new one to change its contents.
+
+    Args:
+        networks: IPv4Network or IPv6Network objects, all of the same type
+
+    Raises:
+        TypeError: If an item is not a network or types are mixed
+
+    Examples:
+        >>> index = PrefixIndex(IPv4Network(net) for net in routes)
+        >>> list(index.covered_by(IPv4Network("10.0.0.0/8")))
+        [IPv4Network("10.0.0.0/8"), IPv4Network("10.1.0.0/16")]
+        >>> list(index.covering(IPv4Network("10.1.2.0/24")))
+        [IPv4Network("10.1.0.0/16"), IPv4Network("10.0.0.0/8")]
+    """
+
+    __slots__ = ("_cls", "_width", "_keys", "_parents")
+
+    def __init__(self, networks: cabc.Iterable[Network] = ()) -> None:
+        # type of the stored networks, None until the first one
+        self._cls: t.Any = None
+        self._width = 0
+        keys: set[int] = set()
+        for network in networks:
+            if self._cls is None:
+                self._check_network(network)
+                self._cls = type(network)
+                self._width = _WIDTHS[self._cls]
+            elif not isinstance(network, self._cls):
+                raise TypeError(
+                    f'Unable to process value "{network}" of type "{type(network)}"'
+                )
+
+            addr, prefixlen = network.as_tuple()
+            keys.add(addr << _LEN_BITS | prefixlen)
+
+        self._keys = sorted(keys)
+        self._parents = self._link(self._keys)
+
+    def _link(self, keys: list[int]) -> "array.array[int]":
+        # position of the closest covering prefix of every prefix, -1 for
+        # none; the stack holds the chain of prefixes covering the current one
+        parents = array.array("q", bytes(8 * len(keys)))
+        stack: list[tuple[int, int]] = []
+        for pos, key in enumerate(keys):
+            addr = key >> _LEN_BITS
+            while stack and stack[-1][1] < addr:
+                stack.pop()
+
+            parents[pos] = stack[-1][0] if stack else -1
+            stack.append((pos, addr | self._hostmask(key & _LEN_MASK)))
+
+        return parents
+
+    def _hostmask(self, prefixlen: int) -> int:
+        return (1 << (self._width - prefixlen)) - 1
+
+    def _check_network(self, network: t.Any) -> None:
+        if not isinstance(network, self._cls or (IPv4Network, IPv6Network)):
+            raise TypeError(
+                f'Unable to process value "{network}" of type "{type(network)}"'
+            )
+
+    def _build(self, key: int) -> Network:
+        return self._cls._from_int_unchecked(key >> _LEN_BITS, key & _LEN_MASK)
+
+    def covered_by(
+        self,
+        network: Network,
+        strict: bool = False,
+    ) -> cabc.Iterator[Network]:
+        """
+        Stored networks inside the network, in sorted order.
+
+        Args:
+            network: Network to query
+            strict: Exclude the network itself, yield more-specifics only
+
+        Raises:
+            TypeError: If network is not of the stored type
+        """
+        self._check_network(network)
+        if not self._keys:
+            return
+
+        addr, prefixlen = network.as_tuple()
+        last = addr | self._hostmask(prefixlen)
+        keys = self._keys
+        first = addr << _LEN_BITS | (prefixlen + 1 if strict else prefixlen)
+        lo = bisect.bisect_left(keys, first)
+        hi = bisect.bisect_right(keys, last << _LEN_BITS | _LEN_MASK, lo)
+        for pos in range(lo, hi):
+            yield self._build(keys[pos])
+
+    def covering(
+        self,
+        network: Network,
+        strict: bool = False,
+    ) -> cabc.Iterator[Network]:
+        """
+        Stored networks containing the network, most specific first.
+
+        Args:
+            network: Network to query
+            strict: Exclude the network itself, yield less-specifics only
+
+        Raises:
+            TypeError: If network is not of the stored type
+        """
+        self._check_network(network)
+        if not self._keys:
+            return
+
+        addr, prefixlen = network.as_tuple()
+        last = addr | self._hostmask(prefixlen)
+        key = addr << _LEN_BITS | prefixlen
+        keys = self._keys
+        parents = self._parents
+
+        # every covering prefix covers the closest preceding one too, so all
+        # of them are on its chain; the chain may start with prefixes that
+        # are disjoint from the network
+        pos = (bisect.bisect_left if strict else bisect.bisect_right)(keys, key) - 1
+        while pos >= 0:
+            key = keys[pos]
+            start = key >> _LEN_BITS
+            if start <= addr and last <= start | self._hostmask(key & _LEN_MASK):
+                yield self._build(key)
+            pos = parents[pos]
+
+    def overlapping(self, network: Network) -> cabc.Iterator[Network]:
+        """
+        Stored networks sharing any address with the network, in sorted order.
+
+        Raises:
+            TypeError: If network is not of the stored type
+        """
+        yield from reversed(list(self.covering(network, strict=True)))
+        yield from self.covered_by(network)
+
+    def __iter__(self) -> cabc.Iterator[Network]:
+        for key in self._keys:
+            yield self._build(key)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, network: t.Any) -> bool:
+        if self._cls is None or not isinstance(network, self._cls):
+            return False
+
+        addr, prefixlen = network.as_tuple()
+        key = addr << _LEN_BITS | prefixlen
+        pos = bisect.bisect_left(self._keys, key)
+        return pos < len(self._keys) and self._keys[pos] == key
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<{len(self)} prefixes>)"
@@ -0,0 +1,362 @@
+# pyright: strict, reportUnnecessaryIsInstance=false, reportUnreachable=false
+
+import array
+import collections.abc as cabc
+import typing as t
+
+from netsome import constants as c
+from netsome.types.ipv4 import IPv4Address
+from netsome.types.ipv4 import IPv4Network
+from netsome.validators import ipv4 as valids
+
+
+# first level is indexed by the top 24 bits of an address,
+# second level chunks cover the remaining 8 bits
+_TBL24_BITS = 24
+_CHUNK_BITS = c.IPV4.PREFIXLEN_MAX - _TBL24_BITS
+_CHUNK_SIZE = 1 << _CHUNK_BITS
+_CHUNK_MASK = _CHUNK_SIZE - 1
+
+# entries with this bit set point to a second level chunk
+_POINTER = 1 << 31
+
+# prefixlen marker for first level entries that point to a chunk,
+# greater than any real prefixlen so pointers are never overwritten
+_PLEN_POINTER = c.IPV4.PREFIXLEN_MAX + 1
+
+_NO_ROUTE = 0
+
+# per prefixlen translate tables for the stored prefixlens:
+# zero marks entries a route may overwrite on insert
+_KEEP_LONGER = tuple(
+    bytes(int(plen > prefixlen) for plen in range(256))
+    for prefixlen in range(c.IPV4.PREFIXLEN_MIN, c.IPV4.PREFIXLEN_MAX + 1)
+)
+# and entries installed by a route that is being removed
+_KEEP_OTHER = tuple(
+    bytes(int(plen != prefixlen) for plen in range(256))
+    for prefixlen in range(c.IPV4.PREFIXLEN_MIN, c.IPV4.PREFIXLEN_MAX + 1)
+)
+
+
+def _to_int(address: IPv4Address | int) -> int:
+    if isinstance(address, IPv4Address):
+        return int(address)
+
+    valids.validate_address_int(address)
+    return address
+
+
+class IPv4PrefixTable:
+    """
+    Longest-prefix-match table for IPv4 networks.
+
+    The table uses the DIR-24-8 layout: a first level array indexed by the
+    top 24 bits of an address and second level chunks of 256 entries for
+    prefixes longer than /24. Any lookup is resolved with at most two array
+    reads, independently of the number of stored prefixes.
+
+    Every prefix is associated with a value, by default the network itself.
+
+    Args:
+        items: Optional iterable of (network, value) pairs to build the table from
+
+    Raises:
+        TypeError: If a key is not an IPv4Network
+
+    Examples:
+        >>> table = IPv4PrefixTable()
+        >>> table.insert(IPv4Network("10.0.0.0/8"), "core")
+        >>> table.insert(IPv4Network("10.1.0.0/16"), "dc1")
+        >>> table.lookup(IPv4Address("10.1.2.3"))
+        'dc1'
+        >>> table.lookup(IPv4Address("10.2.0.1"))
+        'core'
+        >>> table.lookup_many([167837953, 167903233])
+        ['dc1', 'core']
+    """
+
+    def __init__(
+        self,
+        items: cabc.Iterable[tuple[IPv4Network, t.Any]] | None = None,
+    ) -> None:
+        # prefix as int tuple -> slot in self._values
+        self._routes: dict[tuple[int, int], int] = {}
+        self._values: list[t.Any] = [None]
+        self._free_slots: list[int] = []
+
+        # allocated on first insert, a fresh table costs nothing
+        self._tbl24 = array.array("I")
+        self._plen24 = bytearray()
+
+        self._tbllong = array.array("I")
+        self._plenlong = bytearray()
+        self._free_chunks: list[int] = []
+
+        if items is not None:
+            # shorter prefixes first, so every insert is a plain overwrite
+            for network, value in sorted(items, key=lambda item: item[0].prefixlen):
+                self.insert(network, value)
+
+    def _check_network(self, network: IPv4Network) -> tuple[int, int]:
+        if not isinstance(network, IPv4Network):
+            raise TypeError(
+                f'Unable to process value "{network}" of type "{type(network)}"'
+            )
+
+        return network.as_tuple()
+
+    def _allocate(self) -> None:
+        size = 1 << _TBL24_BITS
+        self._tbl24 = array.array("I", bytes(size * self._tbl24.itemsize))
+        self._plen24 = bytearray(size)
+
+    def _allocate_chunk(self, entry: int, prefixlen: int) -> int:
+        if self._free_chunks:
+            chunk = self._free_chunks.pop()
+            start = chunk << _CHUNK_BITS
+            self._tbllong[start : start + _CHUNK_SIZE] = array.array(
+                "I", (entry,) * _CHUNK_SIZE
+            )
+            self._plenlong[start : start + _CHUNK_SIZE] = bytes((prefixlen,)) * (
+                _CHUNK_SIZE
+            )
+            return chunk
+
+        chunk = len(self._tbllong) >> _CHUNK_BITS
+        self._tbllong.extend((entry,) * _CHUNK_SIZE)
+        self._plenlong.extend(bytes((prefixlen,)) * _CHUNK_SIZE)
+        return chunk
+
+    @staticmethod
+    def _fill(
+        entries: "array.array[int]",
+        plens: bytearray,
+        start: int,
+        stop: int,
+        keep: bytes,
+        entry: int,
+        prefixlen: int,
+    ) -> None:
+        # overwrite every run of entries in [start, stop) not marked in `keep`
+        mask = plens[start:stop].translate(keep)
+        size = stop - start
+        pos = mask.find(0)
+        while pos != -1:
+            end = mask.find(1, pos)
+            if end == -1:
+                end = size
+
+            count = end - pos
+            entries[start + pos : start + end] = array.array("I", (entry,)) * count
+            plens[start + pos : start + end] = bytes((prefixlen,)) * count
+            pos = mask.find(0, end)
+
+    def _update(
+        self,
+        addr: int,
+        prefixlen: int,
+        keep: bytes,
+        entry: int,
+        new_prefixlen: int,
+    ) -> None:
+        if prefixlen <= _TBL24_BITS:
+            start = addr >> _CHUNK_BITS
+            stop = start + (1 << (_TBL24_BITS - prefixlen))
+            self._fill(
+                self._tbl24, self._plen24, start, stop, keep, entry, new_prefixlen
+            )
+
+            # chunks below the prefix hold their own copies of covering routes
+            idx = self._plen24.find(_PLEN_POINTER, start, stop)
+            while idx != -1:
+                chunk_start = (self._tbl24[idx] ^ _POINTER) << _CHUNK_BITS
+                self._fill(
+                    self._tbllong,
+                    self._plenlong,
+                    chunk_start,
+                    chunk_start + _CHUNK_SIZE,
+                    keep,
+                    entry,
+                    new_prefixlen,
+                )
+                idx = self._plen24.find(_PLEN_POINTER, idx + 1, stop)
+            return
+
+        idx = addr >> _CHUNK_BITS
+        head = self._tbl24[idx]
+        if not head & _POINTER:
+            chunk = self._allocate_chunk(head, self._plen24[idx])
+            self._tbl24[idx] = chunk | _POINTER
+            self._plen24[idx] = _PLEN_POINTER
+        else:
+            chunk = head ^ _POINTER
+
+        start = (chunk << _CHUNK_BITS) | (addr & _CHUNK_MASK)
+        stop = start + (1 << (c.IPV4.PREFIXLEN_MAX - prefixlen))
+        self._fill(
+            self._tbllong, self._plenlong, start, stop, keep, entry, new_prefixlen
+        )
+
+        chunk_start = chunk << _CHUNK_BITS
+        plens = self._plenlong[chunk_start : chunk_start + _CHUNK_SIZE]
+        if max(plens) <= _TBL24_BITS:
+            # no long prefixes left, the whole chunk is one covering route
+            self._tbl24[idx] = self._tbllong[chunk_start]
+            self._plen24[idx] = plens[0]
+            self._free_chunks.append(chunk)
+
+    def _parent(self, addr: int, prefixlen: int) -> tuple[int, int]:
+        m = c.IPV4.ADDRESS_MAX
+        for plen in range(prefixlen - 1, c.IPV4.PREFIXLEN_MIN - 1, -1):
+            slot = self._routes.get((addr & (m ^ (m >> plen)), plen))
+            if slot is not None:
+                return slot, plen
+
+        return _NO_ROUTE, c.IPV4.PREFIXLEN_MIN
+
+    def insert(self, network: IPv4Network, value: t.Any = None) -> None:
+        """
+        Add a network to the table or replace the value of an existing one.
+
+        Args:
+            network: Network to add
+            value: Value returned by lookups matching this network,
+                   the network itself if omitted
+        """
+        key = self._check_network(network)
+        if value is None:
+            value = network
+
+        slot = self._routes.get(key)
+        if slot is not None:
+            self._values[slot] = value
+            return
+
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._values[slot] = value
+        else:
+            slot = len(self._values)
+            self._values.append(value)
+
+        if not self._tbl24:
+            self._allocate()
+
+        self._routes[key] = slot
+        addr, prefixlen = key
+        self._update(addr, prefixlen, _KEEP_LONGER[prefixlen], slot, prefixlen)
+
+    def remove(self, network: IPv4Network) -> None:
+        """
+        Remove a network from the table.
+
+        Addresses covered by the network fall back to the next
+        longest matching prefix.
+
+        Raises:
+            KeyError: If the network is not in the table
+        """
+        key = self._check_network(network)
+        slot = self._routes.pop(key)
+        self._values[slot] = None
+        self._free_slots.append(slot)
+
+        addr, prefixlen = key
+        parent, parent_prefixlen = self._parent(addr, prefixlen)
+        self._update(addr, prefixlen, _KEEP_OTHER[prefixlen], parent, parent_prefixlen)
+
+    def get(self, network: IPv4Network, default: t.Any = None) -> t.Any:
+        """Exact match: value stored for the network or default."""
+        slot = self._routes.get(self._check_network(network))
+        if slot is None:
+            return default
+
+        return self._values[slot]
+
+    def lookup(self, address: IPv4Address | int, default: t.Any = None) -> t.Any:
+        """
+        Longest-prefix match for a single address.
+
+        Args:
+            address: Address object or its integer value
+            default: Value to return if no network covers the address
+
+        Returns:
+            Value of the longest network containing the address or default
+
+        Raises:
+            TypeError: If address is not an IPv4Address or int
+            ValueError: If integer address is out of range
+        """
+        address = _to_int(address)
+        if not self._tbl24:
+            return default
+
+        entry = self._tbl24[address >> _CHUNK_BITS]
+        if entry & _POINTER:
+            entry = self._tbllong[
+                ((entry ^ _POINTER) << _CHUNK_BITS) | (address & _CHUNK_MASK)
+            ]
+
+        if entry == _NO_ROUTE:
+            return default
+
+        return self._values[entry]
+
+    def lookup_many(
+        self,
+        addresses: cabc.Iterable[IPv4Address | int],
+        default: t.Any = None,
+    ) -> list[t.Any]:
+        """
+        Longest-prefix match for a batch of addresses.
+
+        Same as calling lookup() for every address, but resolves the whole
+        batch in one tight loop without per-call overhead.
+
+        Returns:
+            List of matched values in the order of addresses
+        """
+        if not self._tbl24:
+            return [self.lookup(address, default) for address in addresses]
+
+        tbl24 = self._tbl24
+        tbllong = self._tbllong
+        values = self._values
+        addr_max = c.IPV4.ADDRESS_MAX.value
+        bits, mask, pointer = _CHUNK_BITS, _CHUNK_MASK, _POINTER
+
+        result: list[t.Any] = []
+        append = result.append
+        for address in addresses:
+            if not (isinstance(address, int) and 0 <= address <= addr_max):
+                address = _to_int(address)
+
+            entry = tbl24[address >> bits]
+            if entry & pointer:
+                entry = tbllong[((entry ^ pointer) << bits) | (address & mask)]
+
+            append(values[entry] if entry else default)
+
+        return result
+
+    def items(self) -> cabc.Iterator[tuple[IPv4Network, t.Any]]:
+        for (addr, prefixlen), slot in self._routes.items():
+            yield IPv4Network._from_int_unchecked(addr, prefixlen), self._values[slot]
+
+    def __iter__(self) -> cabc.Iterator[IPv4Network]:
+        for addr, prefixlen in self._routes:
+            yield IPv4Network._from_int_unchecked(addr, prefixlen)
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    def __contains__(self, network: t.Any) -> bool:
+        if not isinstance(network, IPv4Network):
+            return False
+
+        return network.as_tuple() in self._routes
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<{len(self)} prefixes>)"
@@ -0,0 +1,382 @@
+# pyright: strict, reportUnnecessaryIsInstance=false, reportUnreachable=false
+
+import collections.abc as cabc
+import functools
+import sys
+import typing as t
+
+from netsome import constants as c
+from netsome.types.ipv6 import IPv6Address
+from netsome.types.ipv6 import IPv6Network
+from netsome.validators import ipv6 as valids
+
+
+_WIDTH = c.IPV6.PREFIXLEN_MAX.value
+
+STRIDE_MIN = 1
+STRIDE_MAX = 8
+STRIDE_DEFAULT = 8
+
+
+@functools.lru_cache(maxsize=None)
+def _match_masks(stride: int) -> tuple[int, ...]:
+    # for every stride chunk value: bitmap of internal prefix positions
+    # (heap order, position = 1 << local_len | local_bits) matching the chunk
+    return tuple(
+        sum(
+            1 << ((1 << length) | (chunk >> (stride - length)))
+            for length in range(stride)
+        )
+        for chunk in range(1 << stride)
+    )
+
+
+def _to_int(address: IPv6Address | int) -> int:
+    if isinstance(address, IPv6Address):
+        return int(address)
+
+    valids.validate_address_int(address)
+    return address
+
+
+class _Node:
+    """
+    Tree Bitmap trie node covering prefix lengths [depth, depth + stride).
+
+    Prefixes inside the stride are kept in the internal bitmap, child nodes
+    in the external bitmap; values and children are stored densely and
+    addressed by popcount rank. `key` holds all address bits above `depth`,
+    so a child may sit several strides below its parent (path compression).
+    """
+
+    __slots__ = ("depth", "key", "internal", "external", "results", "children")
+
+    def __init__(self, depth: int, key: int) -> None:
+        self.depth = depth
+        self.key = key
+        self.internal = 0
+        self.external = 0
+        self.results: list[t.Any] = []
+        self.children: list[_Node] = []
+
+    def sizeof(self) -> int:
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self.key)
+            + sys.getsizeof(self.internal)
+            + sys.getsizeof(self.external)
+            + sys.getsizeof(self.results)
+            + sys.getsizeof(self.children)
+        )
+
+
+class IPv6PrefixTable:
+    """
+    Longest-prefix-match table for IPv6 networks.
+
+    The table is a multibit trie in the Tree Bitmap style: every node consumes
+    `stride` address bits and keeps both its prefixes and its children in
+    bitmaps. Nodes without prefixes and with a single child are skipped
+    (path compression), so a lookup visits at most 128 / stride + 1 nodes
+    regardless of the table size, and usually far fewer.
+
+    Every prefix is associated with a value, by default the network itself.
+
+    Args:
+        items: Optional iterable of (network, value) pairs to build the table from
+        stride: Number of address bits consumed per trie node (1-8)
+
+    Raises:
+        TypeError: If a key is not an IPv6Network or stride is not an int
+        ValueError: If stride is out of range
+
+    Examples:
+        >>> table = IPv6PrefixTable()
+        >>> table.insert(IPv6Network("2001:db8::/32"), "isp")
+        >>> table.insert(IPv6Network("2001:db8:1::/48"), "site")
+        >>> table.lookup(IPv6Address("2001:db8:1::1"))
+        'site'
+        >>> table.lookup(IPv6Address("2001:db8:2::1"))
+        'isp'
+        >>> table.node_count
+        3
+    """
+
+    def __init__(
+        self,
+        items: cabc.Iterable[tuple[IPv6Network, t.Any]] | None = None,
+        stride: int = STRIDE_DEFAULT,
+    ) -> None:
+        if not isinstance(stride, int):
+            raise TypeError(
+                f'Provided invalid value "{stride=}" of type "{type(stride)}",'
+                + " int expected"
+            )
+
+        if not (STRIDE_MIN <= stride <= STRIDE_MAX):
+            raise ValueError(
+                f'Value "{stride}" must be in range {STRIDE_MIN}-{STRIDE_MAX}'
+            )
+
+        self._stride = stride
+        self._mask = (1 << stride) - 1
+        self._match = _match_masks(stride)
+        self._root = _Node(0, 0)
+        self._len = 0
+        self._node_count = 1
+
+        if items is not None:
+            for network, value in items:
+                self.insert(network, value)
+
+    @property
+    def stride(self) -> int:
+        return self._stride
+
+    @property
+    def node_count(self) -> int:
+        """Number of trie nodes, including the root."""
+        return self._node_count
+
+    def memory_usage(self) -> int:
+        """Approximate size of the trie structure in bytes, stored values excluded."""
+        size = sys.getsizeof(self)
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            size += node.sizeof()
+            stack.extend(node.children)
+
+        return size
+
+    def _check_network(self, network: IPv6Network) -> tuple[int, int]:
+        if not isinstance(network, IPv6Network):
+            raise TypeError(
+                f'Unable to process value "{network}" of type "{type(network)}"'
+            )
+
+        return network.as_tuple()
+
+    def _chunk(self, addr: int, depth: int) -> int:
+        # `stride` address bits starting at `depth`, zero padded past the last bit
+        return (addr << self._stride >> (_WIDTH - depth)) & self._mask
+
+    def _position(self, addr: int, prefixlen: int) -> tuple[int, int]:
+        # node depth and internal bitmap position of the prefix
+        depth = prefixlen - prefixlen % self._stride
+        length = prefixlen - depth
+        bits = self._chunk(addr, depth) >> (self._stride - length)
+        return depth, (1 << length) | bits
+
+    @staticmethod
+    def _rank(bitmap: int, pos: int) -> int:
+        return (bitmap & ((1 << pos) - 1)).bit_count()
+
+    def _link(self, parent: _Node, child: _Node) -> None:
+        chunk = self._chunk(child.key << (_WIDTH - child.depth), parent.depth)
+        rank = self._rank(parent.external, chunk)
+        parent.external |= 1 << chunk
+        parent.children.insert(rank, child)
+
+    def _find(self, addr: int, prefixlen: int) -> list[tuple[_Node, int]]:
+        # path of (node, chunk taken) down to the node holding the prefix,
+        # empty if there is no such node
+        depth, _ = self._position(addr, prefixlen)
+        path: list[tuple[_Node, int]] = []
+        node = self._root
+        while node.depth < depth:
+            chunk = self._chunk(addr, node.depth)
+            if not node.external >> chunk & 1:
+                return []
+
+            path.append((node, chunk))
+            node = node.children[self._rank(node.external, chunk)]
+            if node.depth > depth or addr >> (_WIDTH - node.depth) != node.key:
+                return []
+
+        path.append((node, -1))
+        return path
+
+    def insert(self, network: IPv6Network, value: t.Any = None) -> None:
+        """
+        Add a network to the table or replace the value of an existing one.
+
+        Args:
+            network: Network to add
+            value: Value returned by lookups matching this network,
+                   the network itself if omitted
+        """
+        addr, prefixlen = self._check_network(network)
+        if value is None:
+            value = network
+
+        depth, pos = self._position(addr, prefixlen)
+        node = self._root
+        while node.depth < depth:
+            chunk = self._chunk(addr, node.depth)
+            if not node.external >> chunk & 1:
+                # nothing below, hang the target node right here
+                child = _Node(depth, addr >> (_WIDTH - depth))
+                self._link(node, child)
+                self._node_count += 1
+                node = child
+                break
+
+            rank = self._rank(node.external, chunk)
+            child = node.children[rank]
+            diff = (addr >> (_WIDTH - child.depth)) ^ child.key
+            if child.depth <= depth and not diff:
+                node = child
+                continue
+
+            # paths diverge inside the compressed edge, split it
+            common = child.depth - diff.bit_length()
+            split = min(common - common % self._stride, depth)
+            middle = _Node(split, addr >> (_WIDTH - split))
+            node.children[rank] = middle
+            self._link(middle, child)
+            self._node_count += 1
+            node = middle
+
+        rank = self._rank(node.internal, pos)
+        if node.internal >> pos & 1:
+            node.results[rank] = value
+            return
+
+        node.internal |= 1 << pos
+        node.results.insert(rank, value)
+        self._len += 1
+
+    def remove(self, network: IPv6Network) -> None:
+        """
+        Remove a network from the table.
+
+        Raises:
+            KeyError: If the network is not in the table
+        """
+        addr, prefixlen = self._check_network(network)
+        _, pos = self._position(addr, prefixlen)
+        path = self._find(addr, prefixlen)
+        if not path or not path[-1][0].internal >> pos & 1:
+            raise KeyError(network)
+
+        node = path[-1][0]
+        del node.results[self._rank(node.internal, pos)]
+        node.internal ^= 1 << pos
+        self._len -= 1
+
+        # drop empty nodes bottom-up and compress prefix-less single-child ones
+        for i in range(len(path) - 1, 0, -1):
+            node = path[i][0]
+            parent, chunk = path[i - 1]
+            if node.internal or len(node.children) > 1:
+                break
+
+            rank = self._rank(parent.external, chunk)
+            self._node_count -= 1
+            if node.children:
+                parent.children[rank] = node.children[0]
+                break
+
+            del parent.children[rank]
+            parent.external ^= 1 << chunk
+
+    def get(self, network: IPv6Network, default: t.Any = None) -> t.Any:
+        """Exact match: value stored for the network or default."""
+        addr, prefixlen = self._check_network(network)
+        _, pos = self._position(addr, prefixlen)
+        path = self._find(addr, prefixlen)
+        if not path:
+            return default
+
+        node = path[-1][0]
+        if not node.internal >> pos & 1:
+            return default
+
+        return node.results[self._rank(node.internal, pos)]
+
+    def lookup(self, address: IPv6Address | int, default: t.Any = None) -> t.Any:
+        """
+        Longest-prefix match for a single address.
+
+        Args:
+            address: Address object or its integer value
+            default: Value to return if no network covers the address
+
+        Returns:
+            Value of the longest network containing the address or default
+
+        Raises:
+            TypeError: If address is not an IPv6Address or int
+            ValueError: If integer address is out of range
+        """
+        addr = _to_int(address)
+        stride = self._stride
+        mask = self._mask
+        match = self._match
+
+        result = default
+        node = self._root
+        while True:
+            chunk = (addr << stride >> (_WIDTH - node.depth)) & mask
+            internal = node.internal
+            if hits := internal & match[chunk]:
+                pos = hits.bit_length() - 1
+                result = node.results[(internal & ((1 << pos) - 1)).bit_count()]
+
+            external = node.external
+            if not external >> chunk & 1:
+                return result
+
+            node = node.children[(external & ((1 << chunk) - 1)).bit_count()]
+            if addr >> (_WIDTH - node.depth) != node.key:
+                return result
+
+    def lookup_many(
+        self,
+        addresses: cabc.Iterable[IPv6Address | int],
+        default: t.Any = None,
+    ) -> list[t.Any]:
+        """Longest-prefix match for a batch of addresses."""
+        lookup = self.lookup
+        return [lookup(address, default) for address in addresses]
+
+    def items(self) -> cabc.Iterator[tuple[IPv6Network, t.Any]]:
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            internal = node.internal
+            rank = 0
+            while internal:
+                pos = (internal & -internal).bit_length() - 1
+                internal &= internal - 1
+
+                length = pos.bit_length() - 1
+                prefix = (node.key << length) | (pos ^ (1 << length))
+                prefixlen = node.depth + length
+                yield (
+                    IPv6Network._from_int_unchecked(
+                        prefix << (_WIDTH - prefixlen), prefixlen
+                    ),
+                    node.results[rank],
+                )
+                rank += 1
+
+            stack.extend(reversed(node.children))
+
+    def __iter__(self) -> cabc.Iterator[IPv6Network]:
+        for network, _ in self.items():
+            yield network
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __contains__(self, network: t.Any) -> bool:
+        if not isinstance(network, IPv6Network):
+            return False
+
+        sentinel = object()
+        return self.get(network, sentinel) is not sentinel
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<{len(self)} prefixes>)"
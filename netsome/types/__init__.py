@@ -2,11 +2,13 @@
 Network types package providing classes for handling common networking objects.
 
 The package includes classes for:
-- IPv4 and IPv6 addresses and networks
+- IPv4 and IPv6 addresses, networks and address ranges
+- Sets of IPv4 and IPv6 addresses
 - MAC addresses (48-bit and 64-bit)
 - BGP AS numbers and communities
-- VLAN IDs
+- VLAN IDs and sets of VLAN IDs
 - Network interface names
+- Lazy sequence views of subnets and hosts
 
 All types provide proper validation, comparison operations, and string representations.
 Consistent interfaces enable seamless integration into network automation workflows.
@@ -15,26 +17,38 @@ Consistent interfaces enable seamless integration into network automation workfl
 from netsome.types.bgp import ASN
 from netsome.types.bgp import Community
 from netsome.types.interfaces import Interface
+from netsome.types.ipset import IPSet
 from netsome.types.ipv4 import IPv4Address
 from netsome.types.ipv4 import IPv4Interface
 from netsome.types.ipv4 import IPv4Network
+from netsome.types.ipv4 import IPv4Range
 from netsome.types.ipv6 import IPv6Address
 from netsome.types.ipv6 import IPv6Interface
 from netsome.types.ipv6 import IPv6Network
+from netsome.types.ipv6 import IPv6Range
 from netsome.types.mac import MacAddress
+from netsome.types.views import HostRange
+from netsome.types.views import SubnetView
 from netsome.types.vlans import VID
+from netsome.types.vlans import VlanSet
 
 
 __all__ = [
     "ASN",
     "Community",
+    "HostRange",
     "Interface",
+    "IPSet",
     "IPv4Address",
     "IPv4Interface",
     "IPv4Network",
+    "IPv4Range",
     "IPv6Address",
     "IPv6Interface",
     "IPv6Network",
+    "IPv6Range",
     "MacAddress",
+    "SubnetView",
     "VID",
+    "VlanSet",
 ]
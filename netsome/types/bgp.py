@@ -1,6 +1,7 @@
 import contextlib
 import typing as t
 
+from netsome import _intern
 from netsome import constants as c
 from netsome._converters import bgp as convs
 from netsome.validators import bgp as valids
@@ -37,6 +38,11 @@ class ASN:
     MAX = c.BGP.ASN_MAX
     ORDER_MAX = c.BGP.ASN_ORDER_MAX
 
+    __slots__ = ("_number", "__weakref__")
+
+    # opt-in pool of canonical instances, see intern()
+    intern_pool: t.ClassVar[_intern.InternPool["ASN"]] = _intern.InternPool()
+
     def __init__(self, number: int) -> None:
         valids.validate_asplain(number)
         self._number = number
@@ -45,6 +51,29 @@ class ASN:
     def number(self) -> int:
         return self._number
 
+    @classmethod
+    def intern(cls, value: "int | ASN") -> "ASN":
+        """
+        Canonical instance for the number, equal interned ASNs are identical.
+
+        A passed instance becomes the canonical one if the number is not
+        interned yet.
+        """
+        if isinstance(value, cls):
+            number = value._number
+        else:
+            valids.validate_asplain(value)
+            number = value
+
+        interned = cls.intern_pool.get(number)
+        if interned is not None:
+            return interned
+
+        if not isinstance(value, cls):
+            value = cls(number)
+
+        return cls.intern_pool.add(number, value)
+
     @classmethod
     def from_asdot(cls, string: str) -> "ASN":
         valids.validate_asdot(string)
@@ -57,23 +86,52 @@ class ASN:
 
     @classmethod
     def from_asplain(cls, string: str) -> "ASN":
+        valids.validate_asplain_str(string)
         return cls(int(string))
 
     @classmethod
     def parse(cls, value: t.Any) -> "ASN":
-        from_fmts = (
-            cls,
-            cls.from_asdot,
-            cls.from_asdotplus,
-            cls.from_asplain,
-        )
-
-        for fmt in from_fmts:
-            with contextlib.suppress(Exception):
+        # format is picked by type and delimiter, only the matching
+        # constructor runs
+        fmt: t.Callable[[t.Any], ASN] | None = None
+        if isinstance(value, int):
+            fmt = cls
+        elif isinstance(value, str):
+            if c.DELIMITERS.DOT in value:
+                fmt = cls.from_asdotplus
+            else:
+                fmt = cls.from_asplain
+
+        if fmt is not None:
+            with contextlib.suppress(TypeError, ValueError):
                 return fmt(value)
 
         raise ValueError(f'Unable to parse "{value}" of type "{type(value)}"')
 
+    @classmethod
+    def try_parse(cls, value: t.Any) -> "ASN | None":
+        """
+        Same as parse(), but returns None instead of raising.
+
+        Strings are accepted in canonical form only, as in parse(): plain
+        decimal digits, no signs, whitespace or underscores.
+        """
+        number: int | None = None
+        if isinstance(value, int):
+            number = value if c.BGP.ASN_MIN <= value <= c.BGP.ASN_MAX else None
+        elif isinstance(value, str):
+            if c.DELIMITERS.DOT in value:
+                number = convs.parse_asdotplus(value)
+            else:
+                number = convs.parse_asplain(value)
+
+        return None if number is None else cls(number)
+
+    @classmethod
+    def is_valid(cls, value: t.Any) -> bool:
+        """True if try_parse() would succeed, never raises."""
+        return cls.try_parse(value) is not None
+
     def to_asdot(self) -> str:
         return convs.asplain_to_asdot(self._number)
 
@@ -90,6 +148,9 @@ class ASN:
         return self.to_asplain()
 
     def __eq__(self, other: t.Any) -> bool:
+        if other is self:
+            return True
+
         if not isinstance(other, self.__class__):
             return NotImplemented
 
@@ -148,6 +209,11 @@ class Community:
         4259840100
     """
 
+    __slots__ = ("_number", "__weakref__")
+
+    # opt-in pool of canonical instances, see intern()
+    intern_pool: t.ClassVar[_intern.InternPool["Community"]] = _intern.InternPool()
+
     def __init__(self, number: int) -> None:
         valids.validate_asplain(number)
         self._number = number
@@ -156,11 +222,40 @@ class Community:
     def number(self) -> int:
         return self._number
 
+    @classmethod
+    def intern(cls, value: "int | Community") -> "Community":
+        """Canonical instance for the number, same rules as ASN.intern()."""
+        if isinstance(value, cls):
+            number = value._number
+        else:
+            valids.validate_asplain(value)
+            number = value
+
+        interned = cls.intern_pool.get(number)
+        if interned is not None:
+            return interned
+
+        if not isinstance(value, cls):
+            value = cls(number)
+
+        return cls.intern_pool.add(number, value)
+
     @classmethod
     def from_str(cls, string: str) -> "Community":
         valids.validate_community(string)
         return cls(convs.community_to_asplain(string))
 
+    @classmethod
+    def try_parse(cls, string: str) -> "Community | None":
+        """Same as from_str(), but returns None instead of raising."""
+        number = convs.parse_community(string) if isinstance(string, str) else None
+        return None if number is None else cls(number)
+
+    @classmethod
+    def is_valid(cls, string: str) -> bool:
+        """True if string is a valid "ASN:VALUE" community, never raises."""
+        return isinstance(string, str) and convs.parse_community(string) is not None
+
     def __int__(self) -> int:
         return self._number
 
@@ -168,6 +263,9 @@ class Community:
         return convs.asplain_to_community(self._number)
 
     def __eq__(self, other: t.Any) -> bool:
+        if other is self:
+            return True
+
         if not isinstance(other, self.__class__):
             return NotImplemented
 
@@ -1,10 +1,37 @@
-import functools
-import re
 import typing as t
 
+from netsome import _parse_cache
 from netsome import constants as c
 
 
+# type and names of value and sub groups of every dialect of IFACE_PATTERN
+_DIALECTS = {
+    tp.name: (
+        tp,
+        f"{tp.name}_value",
+        f"{tp.name}_sub" if f"{tp.name}_sub" in c.IFACE_PATTERN.groupindex else None,
+    )
+    for tp in c.IFACE_PATTERNS
+}
+
+# types sort in declaration order
+_TYPE_RANKS = {tp: rank for rank, tp in enumerate(c.IFACE_TYPES)}
+
+Parsed: t.TypeAlias = tuple[c.IFACE_TYPES, str, str | None]
+SortKey: t.TypeAlias = tuple[int, tuple[int, ...], int]
+
+
+def _sort_key(tp: c.IFACE_TYPES, value: str, sub: str | None) -> SortKey:
+    # natural order: type rank, port numbers as ints, subinterface or -1,
+    # so "1/0/2" < "1/0/10" and a port sorts before its subinterfaces
+    ports, _, _ = value.partition(c.DELIMITERS.DOT)
+    return (
+        _TYPE_RANKS[tp],
+        tuple(map(int, ports.split(c.DELIMITERS.SLASH))),
+        -1 if sub is None else int(sub),
+    )
+
+
 class Interface:
     """
     Represents a network interface name.
@@ -32,17 +59,61 @@ class Interface:
 
     IFACE_NAMES = c.IFACE_NAMES
     IFACE_PATTERNS = c.IFACE_PATTERNS
+    IFACE_PATTERN = c.IFACE_PATTERN
 
-    def __init__(self, string: str):
-        self._type, self._value, self._sub = self.parse_string(string)
+    # parsed parts, their precomputed hash and sort key and lazily cached
+    # canonical name
+    __slots__ = ("_type", "_value", "_sub", "_hash", "_key", "_canonical_name")
 
-    def parse_string(self, string: str) -> tuple[c.IFACE_TYPES, str, str | None]:
-        for tp, pattern in self.IFACE_PATTERNS.items():
-            if match := re.match(pattern, string):
-                groups = match.groupdict()
-                return tp, groups["value"], groups.get("sub")
+    # opt-in LRU cache of parsed strings, see netsome.enable_parse_cache()
+    parse_cache: t.ClassVar[_parse_cache.ParseCache[Parsed]] = _parse_cache.register(
+        "Interface"
+    )
 
-        raise ValueError(f'Unable to parse "{string}" of type "{type(string)}"')
+    def __init__(self, string: str):
+        self._populate(self.parse_cache.lookup(string, self.parse_string))
+
+    def _populate(self, parsed: Parsed) -> None:
+        self._type, self._value, self._sub = parsed
+        self._hash = hash(parsed)
+        self._key = _sort_key(*parsed)
+        self._canonical_name: str | None = None
+
+    @classmethod
+    def _from_parsed(cls, parsed: Parsed) -> "Interface":
+        # for parts valid by construction, skips parsing
+        obj = cls.__new__(cls)
+        obj._populate(parsed)
+        return obj
+
+    def parse_string(self, string: str) -> Parsed:
+        parsed = self._match(string)
+        if parsed is None:
+            raise ValueError(f'Unable to parse "{string}" of type "{type(string)}"')
+
+        return parsed
+
+    @classmethod
+    def _match(cls, string: str) -> Parsed | None:
+        # one run of the combined pattern, the dialect group that matched
+        # is the last one closed
+        match = cls.IFACE_PATTERN.match(string)
+        if match is None:
+            return None
+
+        tp, value, sub = _DIALECTS[match.lastgroup]
+        return tp, match[value], match[sub] if sub else None
+
+    @classmethod
+    def try_parse(cls, string: str) -> "Interface | None":
+        """Same as the constructor, but returns None instead of raising."""
+        parsed = cls._match(string) if isinstance(string, str) else None
+        return None if parsed is None else cls._from_parsed(parsed)
+
+    @classmethod
+    def is_valid(cls, string: str) -> bool:
+        """True if string is a known interface name, never raises."""
+        return isinstance(string, str) and cls._match(string) is not None
 
     @property
     def type(self) -> c.IFACE_TYPES:
@@ -56,18 +127,25 @@ class Interface:
     def sub(self) -> str | None:
         return self._sub
 
-    @functools.cached_property
+    @property
+    def sort_key(self) -> SortKey:
+        """Natural order key: type rank, port numbers and subinterface as ints."""
+        return self._key
+
+    @property
     def canonical_name(self) -> str:
-        full_name, _ = self.IFACE_NAMES[self._type]
-        return f"{full_name}{self._value}"
+        if self._canonical_name is None:
+            full_name, _ = self.IFACE_NAMES[self._type]
+            self._canonical_name = f"{full_name}{self._value}"
+        return self._canonical_name
 
-    @functools.cached_property
+    @property
     def abbreviated_name(self) -> str:
         _, short_name = self.IFACE_NAMES[self._type]
         return f"{short_name}{self._value}"
 
     def __hash__(self) -> int:
-        return hash((self._type, self._value, self._sub))
+        return self._hash
 
     def __str__(self) -> str:
         return self.canonical_name
@@ -84,3 +162,27 @@ class Interface:
             and (self._value == other._value)
             and (self._sub == other._sub)
         )
+
+    def __lt__(self, other: t.Any) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return self._key < other._key
+
+    def __le__(self, other: t.Any) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return self._key <= other._key
+
+    def __gt__(self, other: t.Any) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return self._key > other._key
+
+    def __ge__(self, other: t.Any) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return self._key >= other._key
@@ -0,0 +1,227 @@
+# pyright: strict, reportUnnecessaryIsInstance=false, reportUnreachable=false
+
+import bisect
+import collections.abc as cabc
+import operator
+import typing as t
+
+from netsome import constants as c
+from netsome._converters import ranges as convs
+from netsome.types.ipv4 import IPv4Address
+from netsome.types.ipv4 import IPv4Network
+from netsome.types.ipv6 import IPv6Address
+from netsome.types.ipv6 import IPv6Network
+
+
+IPSetItem: t.TypeAlias = IPv4Address | IPv4Network | IPv6Address | IPv6Network
+
+
+def _difference(left: bool, right: bool) -> bool:
+    return left and not right
+
+
+class IPSet:
+    """
+    Represents a set of IPv4 and IPv6 addresses.
+
+    Addresses are stored as sorted, merged integer intervals per address family,
+    never one by one, so sets spanning whole networks stay small. Set operations
+    are linear merges of the interval lists and membership tests are binary
+    searches.
+
+    Args:
+        items: Iterable of IPv4/IPv6 addresses and networks
+
+    Raises:
+        TypeError: If an item is not an address or network
+
+    Examples:
+        >>> allow = IPSet([IPv4Network("10.0.0.0/8")])
+        >>> deny = IPSet([IPv4Network("10.1.0.0/16"), IPv4Address("10.2.0.1")])
+        >>> IPv4Address("10.1.0.1") in allow - deny
+        False
+        >>> list(IPSet([IPv4Network("10.0.0.0/25"), IPv4Network("10.0.0.128/25")]))
+        [IPv4Network("10.0.0.0/24")]
+    """
+
+    __slots__ = ("_v4", "_v6")
+
+    def __init__(self, items: cabc.Iterable[IPSetItem] = ()) -> None:
+        v4: list[tuple[int, int]] = []
+        v6: list[tuple[int, int]] = []
+        for item in items:
+            if isinstance(item, (IPv4Network, IPv6Network)):
+                start, prefixlen = item.as_tuple()
+                width = item.netaddress.PREFIXLEN_MAX
+                ranges = v4 if isinstance(item, IPv4Network) else v6
+                ranges.append((start, start + (1 << (width - prefixlen))))
+            elif isinstance(item, IPv4Address):
+                v4.append((int(item), int(item) + 1))
+            elif isinstance(item, IPv6Address):
+                v6.append((int(item), int(item) + 1))
+            else:
+                raise TypeError(
+                    f'Unable to process value "{item}" of type "{type(item)}"'
+                )
+
+        # half-open interval boundaries: [start0, stop0, start1, stop1, ...]
+        self._v4 = convs.merge_ranges(v4)
+        self._v6 = convs.merge_ranges(v6)
+
+    @classmethod
+    def try_parse(cls, items: cabc.Iterable[IPSetItem]) -> "IPSet | None":
+        """Same as the constructor, but returns None instead of raising."""
+        if not isinstance(items, cabc.Iterable):
+            return None
+
+        items = list(items)
+        for item in items:
+            if not isinstance(
+                item, (IPv4Address, IPv4Network, IPv6Address, IPv6Network)
+            ):
+                return None
+
+        return cls(items)
+
+    @classmethod
+    def is_valid(cls, items: cabc.Iterable[IPSetItem]) -> bool:
+        """True if every item is an address or network, never raises."""
+        return cls.try_parse(items) is not None
+
+    @classmethod
+    def _from_bounds(cls, v4: list[int], v6: list[int]) -> "IPSet":
+        obj = cls.__new__(cls)
+        obj._v4 = v4
+        obj._v6 = v6
+        return obj
+
+    def _combine(
+        self,
+        other: "IPSet",
+        op: cabc.Callable[[bool, bool], bool],
+    ) -> "IPSet":
+        return self._from_bounds(
+            convs.combine_bounds(self._v4, other._v4, op),
+            convs.combine_bounds(self._v6, other._v6, op),
+        )
+
+    def union(self, other: "IPSet") -> "IPSet":
+        return self._combine(other, operator.or_)
+
+    def intersection(self, other: "IPSet") -> "IPSet":
+        return self._combine(other, operator.and_)
+
+    def difference(self, other: "IPSet") -> "IPSet":
+        return self._combine(other, _difference)
+
+    def symmetric_difference(self, other: "IPSet") -> "IPSet":
+        return self._combine(other, operator.xor)
+
+    def isdisjoint(self, other: "IPSet") -> bool:
+        return not self.intersection(other)
+
+    def issubset(self, other: "IPSet") -> bool:
+        return not self.difference(other)
+
+    def issuperset(self, other: "IPSet") -> bool:
+        return not other.difference(self)
+
+    @property
+    def size(self) -> int:
+        """Number of addresses in the set."""
+        bounds = self._v4 + self._v6
+        return sum(bounds[1::2]) - sum(bounds[::2])
+
+    def networks(self) -> cabc.Generator[IPv4Network | IPv6Network, None, None]:
+        """Minimal CIDR cover of the set, IPv4 networks first, in sorted order."""
+        for bounds, width, cls in (
+            (self._v4, c.IPV4.PREFIXLEN_MAX.value, IPv4Network),
+            (self._v6, c.IPV6.PREFIXLEN_MAX.value, IPv6Network),
+        ):
+            for i in range(0, len(bounds), 2):
+                for addr, prefixlen in convs.range_to_cidrs(
+                    bounds[i], bounds[i + 1], width
+                ):
+                    yield cls._from_int_unchecked(addr, prefixlen)
+
+    def __iter__(self) -> cabc.Iterator[IPv4Network | IPv6Network]:
+        return self.networks()
+
+    def __contains__(self, item: IPSetItem) -> bool:
+        if isinstance(item, (IPv4Network, IPv6Network)):
+            start, prefixlen = item.as_tuple()
+            last = start + (1 << (item.netaddress.PREFIXLEN_MAX - prefixlen)) - 1
+            bounds = self._v4 if isinstance(item, IPv4Network) else self._v6
+        elif isinstance(item, (IPv4Address, IPv6Address)):
+            start = last = int(item)
+            bounds = self._v4 if isinstance(item, IPv4Address) else self._v6
+        else:
+            raise TypeError(f'Unable to process value "{item}" of type "{type(item)}"')
+
+        # odd insertion point means start lies inside an interval
+        idx = bisect.bisect_right(bounds, start)
+        return bool(idx & 1) and last < bounds[idx]
+
+    def __bool__(self) -> bool:
+        return bool(self._v4 or self._v6)
+
+    def __or__(self, other: t.Any) -> "IPSet":
+        if not isinstance(other, IPSet):
+            return NotImplemented
+
+        return self.union(other)
+
+    def __and__(self, other: t.Any) -> "IPSet":
+        if not isinstance(other, IPSet):
+            return NotImplemented
+
+        return self.intersection(other)
+
+    def __sub__(self, other: t.Any) -> "IPSet":
+        if not isinstance(other, IPSet):
+            return NotImplemented
+
+        return self.difference(other)
+
+    def __xor__(self, other: t.Any) -> "IPSet":
+        if not isinstance(other, IPSet):
+            return NotImplemented
+
+        return self.symmetric_difference(other)
+
+    def __le__(self, other: t.Any) -> bool:
+        if not isinstance(other, IPSet):
+            return NotImplemented
+
+        return self.issubset(other)
+
+    def __ge__(self, other: t.Any) -> bool:
+        if not isinstance(other, IPSet):
+            return NotImplemented
+
+        return self.issuperset(other)
+
+    def __lt__(self, other: t.Any) -> bool:
+        if not isinstance(other, IPSet):
+            return NotImplemented
+
+        return self != other and self.issubset(other)
+
+    def __gt__(self, other: t.Any) -> bool:
+        if not isinstance(other, IPSet):
+            return NotImplemented
+
+        return self != other and self.issuperset(other)
+
+    def __eq__(self, other: t.Any) -> bool:
+        if not isinstance(other, IPSet):
+            return NotImplemented
+
+        return self._v4 == other._v4 and self._v6 == other._v6
+
+    def __hash__(self) -> int:
+        return hash((tuple(self._v4), tuple(self._v6)))
+
+    def __repr__(self) -> str:
+        networks = ", ".join(map(repr, self))
+        return f"{self.__class__.__name__}([{networks}])"
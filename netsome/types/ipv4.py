@@ -2,14 +2,45 @@
 
 import collections.abc as cabc
 import contextlib
-import functools
 import typing as t
 
+from netsome import _intern
+from netsome import _parse_cache
+from netsome import _trust
 from netsome import constants as c
 from netsome._converters import ipv4 as convs
+from netsome._converters import ranges
+from netsome.types.views import HostRange
+from netsome.types.views import SubnetView
 from netsome.validators import ipv4 as valids
 
 
+def _parse_address(string: str) -> int:
+    number = convs.parse_address(string) if isinstance(string, str) else None
+    if number is None:
+        # slow path only to raise a detailed error
+        valids.validate_address_str(string)
+        raise ValueError(f'Provided value "{string=}" is invalid IPv4 address')
+
+    return number
+
+
+def _parse_cidr(string: str) -> tuple[int, int]:
+    parsed = convs.parse_cidr(string) if isinstance(string, str) else None
+    if parsed is None:
+        # slow path only to raise a detailed error
+        valids.validate_cidr(string)
+        raise ValueError(f'Provided value "{string=}" is invalid IPv4 CIDR')
+
+    return parsed
+
+
+def _parse_network(string: str) -> tuple[int, int]:
+    addr, prefixlen = _parse_cidr(string)
+    valids.validate_network_int(addr, prefixlen)
+    return addr, prefixlen
+
+
 class IPv4Address:
     """
     Represents an IPv4 address.
@@ -41,34 +72,80 @@ class IPv4Address:
     OCTET_MIN = c.IPV4.OCTET_MIN
     OCTET_MAX = c.IPV4.OCTET_MAX
 
+    # int address and lazily cached string form
+    __slots__ = ("_addr", "_address", "__weakref__")
+
+    # opt-in pool of canonical instances, see intern()
+    intern_pool: t.ClassVar[_intern.InternPool["IPv4Address"]] = _intern.InternPool()
+    # opt-in LRU cache of parsed strings, see netsome.enable_parse_cache()
+    parse_cache: t.ClassVar[_parse_cache.ParseCache[int]] = _parse_cache.register(
+        "IPv4Address"
+    )
+
     def __init__(self, address: str) -> None:
-        valids.validate_address_str(address)
-        self._addr = convs.address_to_int(address)
+        self._addr = self.parse_cache.lookup(address, _parse_address)
+        self._address: str | None = None
+
+    @classmethod
+    def intern(cls, value: "str | IPv4Address") -> "IPv4Address":
+        """
+        Canonical instance for the address, equal interned addresses are
+        identical. The string is parsed on every call, the object and its
+        cached string form are shared.
+        """
+        number = value._addr if isinstance(value, cls) else _parse_address(value)
+        interned = cls.intern_pool.get(number)
+        if interned is not None:
+            return interned
+
+        if not isinstance(value, cls):
+            value = cls._from_int_unchecked(number)
+
+        return cls.intern_pool.add(number, value)
 
     @classmethod
     def from_int(cls, number: int) -> "IPv4Address":
-        valids.validate_address_int(number)
+        if not _trust.is_trusted():
+            valids.validate_address_int(number)
+
+        return cls._from_int_unchecked(number)
+
+    @classmethod
+    def _from_int_unchecked(cls, number: int) -> "IPv4Address":
+        # for values valid by construction, skips validation
         obj = cls.__new__(cls)
         obj._addr = number
+        obj._address = None
         return obj
 
     @classmethod
     def from_cidr(cls, string: str) -> "IPv4Address":
-        valids.validate_cidr(string)
-
-        addr, prefixlen = string.split(c.DELIMITERS.SLASH, maxsplit=1)
-        if int(prefixlen) != cls.PREFIXLEN_MAX:
+        number, prefixlen = _parse_cidr(string)
+        if prefixlen != cls.PREFIXLEN_MAX:
             raise ValueError(
                 f"Invalid address prefixlen, expected: {cls.PREFIXLEN_MAX}"
             )
 
-        return cls(addr)
+        return cls._from_int_unchecked(number)
+
+    @classmethod
+    def try_parse(cls, string: str) -> "IPv4Address | None":
+        """Same as the constructor, but returns None instead of raising."""
+        number = convs.parse_address(string) if isinstance(string, str) else None
+        return None if number is None else cls._from_int_unchecked(number)
 
-    @functools.cached_property
+    @classmethod
+    def is_valid(cls, string: str) -> bool:
+        """True if string is a valid address, never raises."""
+        return isinstance(string, str) and convs.parse_address(string) is not None
+
+    @property
     def address(self) -> str:
-        return convs.int_to_address(self._addr)
+        if self._address is None:
+            self._address = convs.int_to_address(self._addr)
+        return self._address
 
-    @functools.cached_property
+    @property
     def cidr(self) -> str:
         return c.DELIMITERS.SLASH.join_as_str(self.address, self.PREFIXLEN_MAX.value)
 
@@ -85,6 +162,9 @@ class IPv4Address:
         return hash(self._addr)
 
     def __eq__(self, other: t.Any) -> bool:
+        if other is self:
+            return True
+
         if not isinstance(other, self.__class__):
             return NotImplemented
 
@@ -115,6 +195,11 @@ class IPv4Address:
         return self._addr >= other._addr
 
 
+# shared mask objects of every prefixlen, indexed by prefixlen
+_NETMASKS = tuple(IPv4Address._from_int_unchecked(mask) for mask in convs.NETMASKS)
+_HOSTMASKS = tuple(IPv4Address._from_int_unchecked(mask) for mask in convs.HOSTMASKS)
+
+
 class IPv4Network:
     """
     Represents an IPv4 network.
@@ -137,30 +222,38 @@ class IPv4Network:
         [IPv4Network('192.168.1.0/25'), IPv4Network('192.168.1.128/25')]
     """
 
-    def __init__(self, network: str) -> None:
-        valids.validate_cidr(network)
+    __slots__ = ("_netaddr", "_prefixlen", "_address", "_broadcast")
 
-        addr, prefixlen = network.split(c.DELIMITERS.SLASH, maxsplit=1)
-        prefixlen = int(prefixlen)
-        valids.validate_network_int(convs.address_to_int(addr), prefixlen)
+    # opt-in LRU cache of parsed strings, see netsome.enable_parse_cache()
+    parse_cache: t.ClassVar[_parse_cache.ParseCache[tuple[int, int]]] = (
+        _parse_cache.register("IPv4Network")
+    )
 
-        self._prefixlen = prefixlen
-        self._populate(IPv4Address(addr), prefixlen)
+    def __init__(self, network: str) -> None:
+        addr, prefixlen = self.parse_cache.lookup(network, _parse_network)
+        self._populate(IPv4Address._from_int_unchecked(addr), prefixlen)
 
     def _populate(self, netaddr: IPv4Address, prefixlen: int) -> None:
+        # masks are shared per prefixlen, broadcast is built on first access
         self._prefixlen = prefixlen
         self._netaddr = netaddr
-        m = c.IPV4.ADDRESS_MAX
-        self._netmask = IPv4Address.from_int(m ^ (m >> prefixlen))
+        self._address: str | None = None
+        self._broadcast: IPv4Address | None = None
 
     @classmethod
     def from_int(cls, int_addr: int, prefixlen: int) -> "IPv4Network":
-        valids.validate_address_int(int_addr)
-        valids.validate_prefixlen_int(prefixlen)
-        valids.validate_network_int(int_addr, prefixlen)
+        if not _trust.is_trusted():
+            valids.validate_address_int(int_addr)
+            valids.validate_prefixlen_int(prefixlen)
+            valids.validate_network_int(int_addr, prefixlen)
 
+        return cls._from_int_unchecked(int_addr, prefixlen)
+
+    @classmethod
+    def _from_int_unchecked(cls, int_addr: int, prefixlen: int) -> "IPv4Network":
+        # for values valid by construction, skips validation
         obj = cls.__new__(cls)
-        obj._populate(IPv4Address.from_int(int_addr), prefixlen)
+        obj._populate(IPv4Address._from_int_unchecked(int_addr), prefixlen)
         return obj
 
     @classmethod
@@ -181,9 +274,9 @@ class IPv4Network:
 
     @classmethod
     def from_address(cls, string: str) -> "IPv4Network":
-        obj = cls.__new__(cls)
-        obj._populate(IPv4Address(string), c.IPV4.PREFIXLEN_MAX.value)
-        return obj
+        return cls._from_int_unchecked(
+            _parse_address(string), c.IPV4.PREFIXLEN_MAX.value
+        )
 
     @classmethod
     def from_octets(cls, string: str) -> "IPv4Network":
@@ -194,33 +287,77 @@ class IPv4Network:
                 + f' less than "{c.IPV4.OCTETS_COUNT}" octets'
             )
 
+        number = 0
         for octet in octets:
-            valids.validate_octet_str(octet)
-
-        prefixlen = len(octets) * 8
-        octets += ["0"] * (c.IPV4.OCTETS_COUNT - len(octets))
-        addr = c.DELIMITERS.DOT.join(octets)
+            value = convs.parse_octet(octet)
+            if value is None:
+                valids.validate_octet_str(octet)
+                raise ValueError(f'Provided value "{octet=}" has invalid octet format')
 
-        obj = cls.__new__(cls)
-        obj._populate(IPv4Address(addr), prefixlen)
+            number = number << 8 | value
 
-        return obj
+        prefixlen = len(octets) * 8
+        number <<= c.IPV4.PREFIXLEN_MAX.value - prefixlen
+        return cls._from_int_unchecked(number, prefixlen)
 
     @classmethod
     def parse(cls, string: str) -> "IPv4Network":
-        from_fmts = (
-            cls,
-            cls.from_address,
-            cls.from_cidr,
-            cls.from_octets,
-        )
-
-        for fmt in from_fmts:
-            with contextlib.suppress(Exception):
+        # format is picked by delimiters, only the matching constructor runs
+        if isinstance(string, str):
+            full = string.count(c.DELIMITERS.DOT) == c.IPV4.OCTETS_COUNT - 1
+            if c.DELIMITERS.SLASH in string:
+                fmt = cls if full else cls.from_cidr
+            else:
+                fmt = cls.from_address if full else cls.from_octets
+
+            with contextlib.suppress(TypeError, ValueError):
                 return fmt(string)
 
         raise ValueError(f'Unable to parse "{string}" of type "{type(string)}"')
 
+    @classmethod
+    def try_parse(cls, string: str) -> "IPv4Network | None":
+        """Same as parse(), but returns None instead of raising."""
+        if not isinstance(string, str):
+            return None
+
+        addr, slash, prefixlen = string.partition(c.DELIMITERS.SLASH)
+        if addr.count(c.DELIMITERS.DOT) == c.IPV4.OCTETS_COUNT - 1:
+            number = convs.parse_address(addr)
+            length = c.IPV4.PREFIXLEN_MAX.value
+            if slash:
+                length = convs.parse_prefixlen(prefixlen)
+            if number is None or length is None or number & convs.HOSTMASKS[length]:
+                return None
+
+            return cls._from_int_unchecked(number, length)
+
+        # leading octets only, prefixlen is implied by their count
+        octets = addr.split(c.DELIMITERS.DOT)
+        if len(octets) > c.IPV4.OCTETS_COUNT:
+            return None
+
+        number = 0
+        for octet in octets:
+            value = convs.parse_octet(octet)
+            if value is None:
+                return None
+
+            number = number << 8 | value
+
+        length = len(octets) * 8
+        if slash and convs.parse_prefixlen(prefixlen) != length:
+            return None
+
+        return cls._from_int_unchecked(
+            number << (c.IPV4.PREFIXLEN_MAX - length), length
+        )
+
+    @classmethod
+    def is_valid(cls, string: str) -> bool:
+        """True if parse() would succeed, never raises."""
+        return cls.try_parse(string) is not None
+
     def as_tuple(self) -> tuple[int, int]:
         return int(self.netaddress), self._prefixlen
 
@@ -273,35 +410,41 @@ class IPv4Network:
 
     @property
     def netmask(self) -> IPv4Address:
-        return self._netmask
+        return _NETMASKS[self._prefixlen]
 
-    @functools.cached_property
+    @property
     def address(self) -> str:
-        return c.DELIMITERS.SLASH.join_as_str(self._netaddr.address, self._prefixlen)
+        if self._address is None:
+            self._address = c.DELIMITERS.SLASH.join_as_str(
+                self._netaddr.address, self._prefixlen
+            )
+        return self._address
 
-    @functools.cached_property
+    @property
     def hostmask(self) -> IPv4Address:
-        return IPv4Address.from_int(int(self._netmask) ^ c.IPV4.ADDRESS_MAX)
+        return _HOSTMASKS[self._prefixlen]
 
-    @functools.cached_property
+    @property
     def broadcast(self) -> IPv4Address:
-        return IPv4Address.from_int(int(self._netaddr) | int(self.hostmask))
+        if self._broadcast is None:
+            self._broadcast = IPv4Address._from_int_unchecked(
+                self._netaddr._addr | convs.HOSTMASKS[self._prefixlen]
+            )
+        return self._broadcast
 
     def subnets(
         self,
         prefixlen: int | None = None,
-    ) -> cabc.Generator["IPv4Network", None, None]:
+    ) -> SubnetView["IPv4Network"]:
+        """Lazy sequence of subnets, one prefixlen longer by default."""
         new_prefixlen = prefixlen or self._prefixlen + 1
         valids.validate_prefixlen_int(new_prefixlen, min_len=self._prefixlen + 1)
 
-        prefixlen_diff = new_prefixlen - self._prefixlen
-
-        start = int(self._netaddr)
-        end = int(self.broadcast) + 1
-        step = (int(self.hostmask) + 1) >> prefixlen_diff
+        start = self._netaddr._addr
+        end = start + convs.HOSTMASKS[self._prefixlen] + 1
+        step = convs.HOSTMASKS[new_prefixlen] + 1
 
-        for addr in range(start, end, step):
-            yield IPv4Network.from_int(addr, new_prefixlen)
+        return SubnetView(IPv4Network, range(start, end, step), new_prefixlen)
 
     def supernet(
         self,
@@ -310,23 +453,20 @@ class IPv4Network:
         new_prefixlen = prefixlen or self._prefixlen - 1
         valids.validate_prefixlen_int(new_prefixlen, max_len=self._prefixlen - 1)
 
-        prefixlen_diff = self._prefixlen - new_prefixlen
-        addr = int(self._netaddr) & (int(self._netmask) << prefixlen_diff)
-
-        return IPv4Network.from_int(addr, new_prefixlen)
+        addr = self._netaddr._addr & convs.NETMASKS[new_prefixlen]
+        return IPv4Network._from_int_unchecked(addr, new_prefixlen)
 
-    def hosts(self) -> cabc.Generator["IPv4Address", None, None]:
-        start = int(self._netaddr) + 1
-        end = int(self.broadcast)
+    def hosts(self) -> HostRange[IPv4Address]:
+        """Lazy sequence of host addresses, see HostRange for the rules."""
+        start = self._netaddr._addr + 1
+        end = start + convs.HOSTMASKS[self._prefixlen] - 1
 
-        # TODO(kuderr): make it prettier?
-        # /31 and /32 prefixlens
+        # /31 and /32 have no network and broadcast addresses
         if self._prefixlen + 2 > c.IPV4.PREFIXLEN_MAX:
             start -= 1
             end += 1
 
-        for addr in range(start, end):
-            yield IPv4Address.from_int(addr)
+        return HostRange(IPv4Address, range(start, end))
 
     def host_at(self, index: int) -> IPv4Address:
         """
@@ -378,7 +518,36 @@ class IPv4Network:
                 f"Index {index} out of range for network with {network_size} addresses"
             )
 
-        return IPv4Address.from_int(int(self._netaddr) + index)
+        return IPv4Address._from_int_unchecked(int(self._netaddr) + index)
+
+    def sample(self, k: int, seed: int | None = None) -> list[IPv4Address]:
+        """
+        Pick k distinct hosts uniformly at random without materializing
+        hosts(), in O(k) time and memory.
+
+        Args:
+            k: Number of hosts to pick
+            seed: Seed of a reproducible pick, None for a random one
+
+        Raises:
+            TypeError: If k is not an int
+            ValueError: If k is negative or larger than the number of hosts
+
+        Examples:
+            >>> IPv4Network("10.0.0.0/8").sample(2, seed=1)
+            [IPv4Address("10.241.95.64"), IPv4Address("10.45.209.83")]
+        """
+        return self.hosts().sample(k, seed)
+
+    def permuted_hosts(self, seed: int | None = None) -> cabc.Iterator[IPv4Address]:
+        """
+        Iterate over every host exactly once in a pseudo-random order.
+
+        Memory use is constant whatever the network size, e.g. for spreading
+        a scan of a large network evenly over time. The same seed yields the
+        same order.
+        """
+        return self.hosts().permuted(seed)
 
     def contains_subnet(self, subnet: "IPv4Network") -> bool:
         if not isinstance(subnet, self.__class__):
@@ -386,10 +555,10 @@ class IPv4Network:
                 f'Unable to process value "{subnet}" of type "{type(subnet)}"'
             )
 
+        addr, prefixlen = subnet.as_tuple()
         return (
-            self != subnet
-            and self.netaddress <= subnet.netaddress
-            and self.broadcast >= subnet.broadcast
+            prefixlen > self._prefixlen
+            and addr & convs.NETMASKS[self._prefixlen] == self._netaddr._addr
         )
 
     def contains_address(self, address: IPv4Address) -> bool:
@@ -398,7 +567,7 @@ class IPv4Network:
                 f'Unable to process value "{address}" of type "{type(address)}"'
             )
 
-        return self.netaddress <= address <= self.broadcast
+        return address._addr & convs.NETMASKS[self._prefixlen] == self._netaddr._addr
 
     def overlaps(self, other: "IPv4Network") -> bool:
         """
@@ -440,6 +609,60 @@ class IPv4Network:
             self.netaddress
         )
 
+    def exclude(
+        self,
+        *others: "IPv4Network",
+    ) -> cabc.Generator["IPv4Network", None, None]:
+        """
+        Generate networks that remain after removing other networks from this one.
+
+        Remaining address ranges are converted to CIDR blocks by bit arithmetic,
+        which costs O(prefixlen) per excluded network instead of enumerating
+        subnets down to its prefix length. Networks outside of this one are
+        ignored.
+
+        Args:
+            *others: IPv4Network objects to exclude
+
+        Yields:
+            IPv4Network: Remaining networks in sorted order
+
+        Raises:
+            TypeError: If any of others is not an IPv4Network
+
+        Examples:
+            >>> net = IPv4Network("10.0.0.0/24")
+            >>> list(net.exclude(IPv4Network("10.0.0.64/26")))
+            [IPv4Network("10.0.0.0/26"), IPv4Network("10.0.0.128/25")]
+        """
+        width = c.IPV4.PREFIXLEN_MAX.value
+        excluded: list[tuple[int, int]] = []
+        for other in others:
+            if not isinstance(other, self.__class__):
+                raise TypeError(
+                    f'Unable to process value "{other}" of type "{type(other)}"'
+                )
+
+            addr, prefixlen = other.as_tuple()
+            excluded.append((addr, addr + (1 << (width - prefixlen))))
+
+        start = int(self._netaddr)
+        stop = start + (1 << (width - self._prefixlen))
+        bounds = ranges.merge_ranges(excluded)
+        for i in range(0, len(bounds), 2):
+            excluded_start = max(bounds[i], start)
+            excluded_stop = min(bounds[i + 1], stop)
+            if excluded_start >= excluded_stop:
+                continue
+
+            for addr, prefixlen in ranges.range_to_cidrs(start, excluded_start, width):
+                yield IPv4Network._from_int_unchecked(addr, prefixlen)
+
+            start = excluded_stop
+
+        for addr, prefixlen in ranges.range_to_cidrs(start, stop, width):
+            yield IPv4Network._from_int_unchecked(addr, prefixlen)
+
 
 class IPv4Interface:
     """
@@ -463,23 +686,41 @@ class IPv4Interface:
         IPv4Network('192.168.1.0/24')
     """
 
+    __slots__ = ("_addr", "_network", "_ip")
+
     def __init__(self, address: str) -> None:
-        valids.validate_cidr(address)
-        addr, prefixlen = address.split(c.DELIMITERS.SLASH, maxsplit=1)
-        self._populate(addr, prefixlen)
+        self._populate(*_parse_cidr(address))
 
     @classmethod
     def from_simple(cls, address: str, prefixlen: str) -> "IPv4Interface":
+        prefixlen_ = int(prefixlen)
+        valids.validate_prefixlen_int(prefixlen_)
+
         obj = cls.__new__(cls)
-        obj._populate(address, prefixlen)
+        obj._populate(_parse_address(address), prefixlen_)
         return obj
 
-    def _populate(self, address: str, prefixlen: str) -> None:
-        prefixlen_ = int(prefixlen)
-        self._addr = IPv4Address(address)
-        netmask = c.IPV4.ADDRESS_MAX ^ (c.IPV4.ADDRESS_MAX >> prefixlen_)
-        netaddr = int(self._addr) & netmask
-        self._network = IPv4Network.from_int(netaddr, prefixlen_)
+    @classmethod
+    def try_parse(cls, string: str) -> "IPv4Interface | None":
+        """Same as the constructor, but returns None instead of raising."""
+        parsed = convs.parse_cidr(string) if isinstance(string, str) else None
+        if parsed is None:
+            return None
+
+        obj = cls.__new__(cls)
+        obj._populate(*parsed)
+        return obj
+
+    @classmethod
+    def is_valid(cls, string: str) -> bool:
+        """True if string is a valid interface address, never raises."""
+        return isinstance(string, str) and convs.parse_cidr(string) is not None
+
+    def _populate(self, addr: int, prefixlen: int) -> None:
+        self._addr = IPv4Address._from_int_unchecked(addr)
+        netaddr = addr & convs.NETMASKS[prefixlen]
+        self._network = IPv4Network._from_int_unchecked(netaddr, prefixlen)
+        self._ip: str | None = None
 
     @classmethod
     def from_objects(
@@ -499,6 +740,7 @@ class IPv4Interface:
         obj = cls.__new__(cls)
         obj._addr = address
         obj._network = network
+        obj._ip = None
         return obj
 
     def as_tuple(self) -> tuple[IPv4Address, IPv4Network]:
@@ -527,8 +769,203 @@ class IPv4Interface:
     def network(self) -> "IPv4Network":
         return self._network
 
-    @functools.cached_property
+    @property
     def ip(self) -> str:
-        return c.DELIMITERS.SLASH.join_as_str(
-            self._addr.address, self._network.prefixlen
+        if self._ip is None:
+            self._ip = c.DELIMITERS.SLASH.join_as_str(
+                self._addr.address, self._network.prefixlen
+            )
+        return self._ip
+
+
+class IPv4Range:
+    """
+    Represents an arbitrary range of IPv4 addresses.
+
+    The range is stored as its first and last address only, so size,
+    membership and overlap checks are O(1) integer comparisons and the
+    range is never iterated address by address.
+
+    Args:
+        string (str): First and last address joined by a dash,
+            e.g. "10.0.0.5-10.0.0.10"
+
+    Raises:
+        TypeError: If input is not a string
+        ValueError: If an address is invalid or first is greater than last
+
+    Examples:
+        >>> rng = IPv4Range("10.0.0.5-10.0.0.10")
+        >>> len(rng)
+        6
+        >>> IPv4Address("10.0.0.7") in rng
+        True
+        >>> [str(network) for network in rng.networks()]
+        ['10.0.0.5/32', '10.0.0.6/31', '10.0.0.8/31', '10.0.0.10/32']
+    """
+
+    __slots__ = ("_first", "_last", "_address")
+
+    def __init__(self, string: str) -> None:
+        if not isinstance(string, str):
+            raise TypeError(
+                f'Provided invalid value "{string=}" of type "{type(string)}",'
+                + " str expected"
+            )
+
+        first, _, last = string.partition(c.DELIMITERS.DASH)
+        self._populate(IPv4Address(first), IPv4Address(last))
+
+    def _populate(self, first: IPv4Address, last: IPv4Address) -> None:
+        if first > last:
+            raise ValueError(
+                f'First address "{first}" must not be greater than last "{last}"'
+            )
+
+        self._first = first
+        self._last = last
+        self._address: str | None = None
+
+    @classmethod
+    def from_addresses(
+        cls,
+        first: IPv4Address,
+        last: IPv4Address,
+    ) -> "IPv4Range":
+        if not isinstance(first, IPv4Address):
+            raise TypeError(f'Unable to create "{cls.__name__}" from "{first=}"')
+
+        if not isinstance(last, IPv4Address):
+            raise TypeError(f'Unable to create "{cls.__name__}" from "{last=}"')
+
+        obj = cls.__new__(cls)
+        obj._populate(first, last)
+        return obj
+
+    @classmethod
+    def from_int(cls, first: int, last: int) -> "IPv4Range":
+        return cls.from_addresses(
+            IPv4Address.from_int(first), IPv4Address.from_int(last)
+        )
+
+    @classmethod
+    def from_network(cls, network: IPv4Network) -> "IPv4Range":
+        if not isinstance(network, IPv4Network):
+            raise TypeError(f'Unable to create "{cls.__name__}" from "{network=}"')
+
+        return cls.from_addresses(network.netaddress, network.host_at(-1))
+
+    @classmethod
+    def try_parse(cls, string: str) -> "IPv4Range | None":
+        """Same as the constructor, but returns None instead of raising."""
+        if not isinstance(string, str):
+            return None
+
+        first, _, last = string.partition(c.DELIMITERS.DASH)
+        first_ = convs.parse_address(first)
+        last_ = convs.parse_address(last)
+        if first_ is None or last_ is None or first_ > last_:
+            return None
+
+        obj = cls.__new__(cls)
+        obj._populate(
+            IPv4Address._from_int_unchecked(first_),
+            IPv4Address._from_int_unchecked(last_),
         )
+        return obj
+
+    @classmethod
+    def is_valid(cls, string: str) -> bool:
+        """True if string is a valid range, never raises."""
+        return cls.try_parse(string) is not None
+
+    def as_tuple(self) -> tuple[int, int]:
+        return int(self._first), int(self._last)
+
+    @property
+    def first(self) -> IPv4Address:
+        return self._first
+
+    @property
+    def last(self) -> IPv4Address:
+        return self._last
+
+    @property
+    def size(self) -> int:
+        return int(self._last) - int(self._first) + 1
+
+    @property
+    def address(self) -> str:
+        if self._address is None:
+            self._address = c.DELIMITERS.DASH.join_as_str(
+                self._first.address, self._last.address
+            )
+        return self._address
+
+    def networks(self) -> cabc.Generator[IPv4Network, None, None]:
+        """Minimal list of networks exactly covering the range, in sorted order."""
+        for addr, prefixlen in ranges.range_to_cidrs(
+            int(self._first), int(self._last) + 1, c.IPV4.PREFIXLEN_MAX.value
+        ):
+            yield IPv4Network._from_int_unchecked(addr, prefixlen)
+
+    def contains_address(self, address: IPv4Address) -> bool:
+        if not isinstance(address, IPv4Address):
+            raise TypeError(
+                f'Unable to process value "{address}" of type "{type(address)}"'
+            )
+
+        return self._first <= address <= self._last
+
+    def overlaps(self, other: "IPv4Range") -> bool:
+        if not isinstance(other, self.__class__):
+            raise TypeError(
+                f'Unable to process value "{other}" of type "{type(other)}"'
+            )
+
+        return self._first <= other._last and other._first <= self._last
+
+    def __contains__(self, address: IPv4Address) -> bool:
+        return self.contains_address(address)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __str__(self) -> str:
+        return self.address
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}("{self.address}")'
+
+    def __hash__(self) -> int:
+        return hash(self.as_tuple())
+
+    def __eq__(self, other: t.Any) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return self._first == other._first and self._last == other._last
+
+    def __lt__(self, other: t.Any) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return self.as_tuple() < other.as_tuple()
+
+    def __le__(self, other: t.Any) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return self.as_tuple() <= other.as_tuple()
+
+    def __gt__(self, other: t.Any) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return self.as_tuple() > other.as_tuple()
+
+    def __ge__(self, other: t.Any) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return self.as_tuple() >= other.as_tuple()
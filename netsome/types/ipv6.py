@@ -2,14 +2,38 @@
 
 import collections.abc as cabc
 import contextlib
-import functools
 import typing as t
 
+from netsome import _parse_cache
+from netsome import _trust
 from netsome import constants as c
 from netsome._converters import ipv6 as convs
+from netsome._converters import ranges
+from netsome.types.views import HostRange
+from netsome.types.views import SubnetView
 from netsome.validators import ipv6 as valids
 
 
+def _parse_address(string: str) -> int:
+    number = convs.parse_address(string) if isinstance(string, str) else None
+    if number is None:
+        # slow path only to raise a detailed error
+        valids.validate_address_str(string)
+        raise ValueError(f'Provided value "{string=}" is invalid IPv6 address')
+
+    return number
+
+
+def _parse_cidr(string: str) -> tuple[int, int]:
+    parsed = convs.parse_cidr(string) if isinstance(string, str) else None
+    if parsed is None:
+        # slow path only to raise a detailed error
+        valids.validate_cidr(string)
+        raise ValueError(f'Provided value "{string=}" is invalid IPv6 CIDR')
+
+    return parsed
+
+
 class IPv6Address:
     """
     Represents an IPv6 address.
@@ -41,75 +65,102 @@ class IPv6Address:
     GROUP_MIN = c.IPV6.GROUP_MIN
     GROUP_MAX = c.IPV6.GROUP_MAX
 
+    # int address and lazily cached string form
+    __slots__ = ("_addr", "_address")
+
+    # opt-in LRU cache of parsed strings, see netsome.enable_parse_cache()
+    parse_cache: t.ClassVar[_parse_cache.ParseCache[int]] = _parse_cache.register(
+        "IPv6Address"
+    )
+
     def __init__(self, address: str) -> None:
-        valids.validate_address_str(address)
-        self._addr = convs.address_to_int(address)
+        self._addr = self.parse_cache.lookup(address, _parse_address)
+        self._address: str | None = None
 
     @classmethod
     def from_int(cls, number: int) -> "IPv6Address":
-        valids.validate_address_int(number)
+        if not _trust.is_trusted():
+            valids.validate_address_int(number)
+
+        return cls._from_int_unchecked(number)
+
+    @classmethod
+    def _from_int_unchecked(cls, number: int) -> "IPv6Address":
+        # for values valid by construction, skips validation
         obj = cls.__new__(cls)
         obj._addr = number
+        obj._address = None
         return obj
 
     @classmethod
     def from_cidr(cls, string: str) -> "IPv6Address":
-        valids.validate_cidr(string)
-
-        addr, prefixlen = string.split(c.DELIMITERS.SLASH, maxsplit=1)
-        if int(prefixlen) != cls.PREFIXLEN_MAX:
+        number, prefixlen = _parse_cidr(string)
+        if prefixlen != cls.PREFIXLEN_MAX:
             raise ValueError(
                 f"Invalid address prefixlen, expected: {cls.PREFIXLEN_MAX}"
             )
 
-        return cls(addr)
+        return cls._from_int_unchecked(number)
 
-    @functools.cached_property
+    @classmethod
+    def try_parse(cls, string: str) -> "IPv6Address | None":
+        """Same as the constructor, but returns None instead of raising."""
+        number = convs.parse_address(string) if isinstance(string, str) else None
+        return None if number is None else cls._from_int_unchecked(number)
+
+    @classmethod
+    def is_valid(cls, string: str) -> bool:
+        """True if string is a valid address, never raises."""
+        return isinstance(string, str) and convs.parse_address(string) is not None
+
+    @property
     def address(self) -> str:
         """Compressed IPv6 address representation."""
-        return convs.int_to_address(self._addr)
+        if self._address is None:
+            self._address = convs.int_to_address(self._addr)
+        return self._address
 
-    @functools.cached_property
+    @property
     def cidr(self) -> str:
         """IPv6 address in CIDR notation with /128."""
         return c.DELIMITERS.SLASH.join_as_str(self.address, self.PREFIXLEN_MAX.value)
 
-    @functools.cached_property
+    @property
     def compressed(self) -> str:
         """Compressed IPv6 address (same as address)."""
         return self.address
 
-    @functools.cached_property
+    @property
     def expanded(self) -> str:
         """Expanded IPv6 address without compression."""
-        return convs.expand_address(self.address)
+        return convs.int_to_expanded(self._addr)
 
-    @functools.cached_property
+    @property
     def is_multicast(self) -> bool:
         """True if address is multicast (ff00::/8)."""
         return (self._addr >> 120) == 0xFF
 
-    @functools.cached_property
+    @property
     def is_link_local(self) -> bool:
         """True if address is link-local (fe80::/10)."""
         return (self._addr >> 118) == 0x3FA
 
-    @functools.cached_property
+    @property
     def is_loopback(self) -> bool:
         """True if address is loopback (::1)."""
         return self._addr == 1
 
-    @functools.cached_property
+    @property
     def is_unspecified(self) -> bool:
         """True if address is unspecified (::)."""
         return self._addr == 0
 
-    @functools.cached_property
+    @property
     def is_private(self) -> bool:
         """True if address is private/unique local (fc00::/7)."""
         return (self._addr >> 121) == 0x7E
 
-    @functools.cached_property
+    @property
     def is_global(self) -> bool:
         """True if address is global unicast."""
         return not (
@@ -163,6 +214,11 @@ class IPv6Address:
         return self._addr >= other._addr
 
 
+# shared mask objects of every prefixlen, indexed by prefixlen
+_NETMASKS = tuple(IPv6Address._from_int_unchecked(mask) for mask in convs.NETMASKS)
+_HOSTMASKS = tuple(IPv6Address._from_int_unchecked(mask) for mask in convs.HOSTMASKS)
+
+
 class IPv6Network:
     """
     Represents an IPv6 network.
@@ -185,59 +241,75 @@ class IPv6Network:
         [IPv6Network('2001:db8::/33'), IPv6Network('2001:db8:8000::/33')]
     """
 
-    def __init__(self, network: str) -> None:
-        valids.validate_cidr(network)
-
-        addr, prefixlen = network.split(c.DELIMITERS.SLASH, maxsplit=1)
-        prefixlen = int(prefixlen)
-        valids.validate_network_int(convs.address_to_int(addr), prefixlen)
+    __slots__ = ("_netaddr", "_prefixlen", "_address")
 
-        self._prefixlen = prefixlen
-        self._populate(IPv6Address(addr), prefixlen)
+    def __init__(self, network: str) -> None:
+        addr, prefixlen = _parse_cidr(network)
+        valids.validate_network_int(addr, prefixlen)
+        self._populate(IPv6Address._from_int_unchecked(addr), prefixlen)
 
     def _populate(self, netaddr: IPv6Address, prefixlen: int) -> None:
+        # masks are shared per prefixlen
         self._prefixlen = prefixlen
         self._netaddr = netaddr
-
-        # Calculate netmask
-        if prefixlen == 0:
-            netmask_int = 0
-        else:
-            netmask_int = (
-                c.IPV6.ADDRESS_MAX << (c.IPV6.PREFIXLEN_MAX - prefixlen)
-            ) & c.IPV6.ADDRESS_MAX
-
-        self._netmask = IPv6Address.from_int(netmask_int)
+        self._address: str | None = None
 
     @classmethod
     def from_int(cls, int_addr: int, prefixlen: int) -> "IPv6Network":
-        valids.validate_address_int(int_addr)
-        valids.validate_prefixlen_int(prefixlen)
-        valids.validate_network_int(int_addr, prefixlen)
+        if not _trust.is_trusted():
+            valids.validate_address_int(int_addr)
+            valids.validate_prefixlen_int(prefixlen)
+            valids.validate_network_int(int_addr, prefixlen)
 
-        obj = cls.__new__(cls)
-        obj._populate(IPv6Address.from_int(int_addr), prefixlen)
-        return obj
+        return cls._from_int_unchecked(int_addr, prefixlen)
 
     @classmethod
-    def from_address(cls, string: str) -> "IPv6Network":
+    def _from_int_unchecked(cls, int_addr: int, prefixlen: int) -> "IPv6Network":
+        # for values valid by construction, skips validation
         obj = cls.__new__(cls)
-        obj._populate(IPv6Address(string), c.IPV6.PREFIXLEN_MAX.value)
+        obj._populate(IPv6Address._from_int_unchecked(int_addr), prefixlen)
         return obj
 
     @classmethod
-    def parse(cls, string: str) -> "IPv6Network":
-        from_fmts = (
-            cls,
-            cls.from_address,
+    def from_address(cls, string: str) -> "IPv6Network":
+        return cls._from_int_unchecked(
+            _parse_address(string), c.IPV6.PREFIXLEN_MAX.value
         )
 
-        for fmt in from_fmts:
-            with contextlib.suppress(Exception):
+    @classmethod
+    def parse(cls, string: str) -> "IPv6Network":
+        # format is picked by delimiters, only the matching constructor runs
+        if isinstance(string, str):
+            fmt = cls if c.DELIMITERS.SLASH in string else cls.from_address
+            with contextlib.suppress(TypeError, ValueError):
                 return fmt(string)
 
         raise ValueError(f'Unable to parse "{string}" of type "{type(string)}"')
 
+    @classmethod
+    def try_parse(cls, string: str) -> "IPv6Network | None":
+        """Same as parse(), but returns None instead of raising."""
+        if not isinstance(string, str):
+            return None
+
+        if c.DELIMITERS.SLASH not in string:
+            number = convs.parse_address(string)
+            if number is None:
+                return None
+
+            return cls._from_int_unchecked(number, c.IPV6.PREFIXLEN_MAX.value)
+
+        parsed = convs.parse_cidr(string)
+        if parsed is None or parsed[0] & convs.HOSTMASKS[parsed[1]]:
+            return None
+
+        return cls._from_int_unchecked(*parsed)
+
+    @classmethod
+    def is_valid(cls, string: str) -> bool:
+        """True if parse() would succeed, never raises."""
+        return cls.try_parse(string) is not None
+
     def as_tuple(self) -> tuple[int, int]:
         return int(self.netaddress), self._prefixlen
 
@@ -290,32 +362,33 @@ class IPv6Network:
 
     @property
     def netmask(self) -> IPv6Address:
-        return self._netmask
+        return _NETMASKS[self._prefixlen]
 
-    @functools.cached_property
+    @property
     def address(self) -> str:
-        return c.DELIMITERS.SLASH.join_as_str(self._netaddr.address, self._prefixlen)
+        if self._address is None:
+            self._address = c.DELIMITERS.SLASH.join_as_str(
+                self._netaddr.address, self._prefixlen
+            )
+        return self._address
 
-    @functools.cached_property
+    @property
     def hostmask(self) -> IPv6Address:
-        return IPv6Address.from_int(int(self._netmask) ^ c.IPV6.ADDRESS_MAX)
+        return _HOSTMASKS[self._prefixlen]
 
     def subnets(
         self,
         prefixlen: int | None = None,
-    ) -> cabc.Generator["IPv6Network", None, None]:
+    ) -> SubnetView["IPv6Network"]:
+        """Lazy sequence of subnets, one prefixlen longer by default."""
         new_prefixlen = prefixlen or self._prefixlen + 1
         valids.validate_prefixlen_int(new_prefixlen, min_len=self._prefixlen + 1)
 
-        subnet_size = 1 << (c.IPV6.PREFIXLEN_MAX - new_prefixlen)
+        start = self._netaddr._addr
+        end = start + convs.HOSTMASKS[self._prefixlen] + 1
+        step = convs.HOSTMASKS[new_prefixlen] + 1
 
-        current_addr = int(self._netaddr)
-        network_size = 1 << (c.IPV6.PREFIXLEN_MAX - self._prefixlen)
-        end_addr = current_addr + network_size
-
-        while current_addr < end_addr:
-            yield IPv6Network.from_int(current_addr, new_prefixlen)
-            current_addr += subnet_size
+        return SubnetView(IPv6Network, range(start, end, step), new_prefixlen)
 
     def supernet(
         self,
@@ -325,43 +398,21 @@ class IPv6Network:
         valids.validate_prefixlen_int(new_prefixlen, max_len=self._prefixlen - 1)
 
         # Calculate supernet address by masking host bits
-        if new_prefixlen == 0:
-            supernet_addr = 0
-        else:
-            mask = (
-                c.IPV6.ADDRESS_MAX << (c.IPV6.PREFIXLEN_MAX - new_prefixlen)
-            ) & c.IPV6.ADDRESS_MAX
-            supernet_addr = int(self._netaddr) & mask
+        supernet_addr = self._netaddr._addr & convs.NETMASKS[new_prefixlen]
+        return IPv6Network._from_int_unchecked(supernet_addr, new_prefixlen)
 
-        return IPv6Network.from_int(supernet_addr, new_prefixlen)
-
-    def hosts(self) -> cabc.Generator["IPv6Address", None, None]:
+    def hosts(self) -> HostRange[IPv6Address]:
         """
-        Generate all host addresses in the network.
-
-        Note: Unlike IPv4, IPv6 does not have broadcast addresses, so all addresses
-        in the subnet are valid host addresses. This can generate extremely large
-        numbers of addresses for networks with small prefix lengths.
+        Lazy sequence of all addresses in the network.
 
-        WARNING: Be cautious when calling this on large networks (e.g., /64 or smaller).
-        A /64 network contains 2^64 (18+ quintillion) addresses. Consider using
-        subnets() to break large networks into smaller chunks instead.
-
-        Yields:
-            IPv6Address: Each host address in the network
+        Unlike IPv4, IPv6 does not have broadcast addresses, so all addresses
+        in the subnet are valid host addresses, see HostRange. A /64 network
+        contains 2^64 addresses, use batched(), slicing or indexing instead of
+        materializing them.
         """
-        if self._prefixlen == c.IPV6.PREFIXLEN_MAX:
-            # Single address - yield the address itself
-            yield self._netaddr
-            return
-
-        # Unlike IPv4, IPv6 has no broadcast address concept.
-        # All addresses in an IPv6 subnet are valid host addresses.
-        network_size = 1 << (c.IPV6.PREFIXLEN_MAX - self._prefixlen)
-        start_addr = int(self._netaddr)
-
-        for i in range(network_size):
-            yield IPv6Address.from_int(start_addr + i)
+        start = self._netaddr._addr
+        end = start + convs.HOSTMASKS[self._prefixlen] + 1
+        return HostRange(IPv6Address, range(start, end))
 
     def host_at(self, index: int) -> IPv6Address:
         """
@@ -413,7 +464,36 @@ class IPv6Network:
                 f"Index {index} out of range for network with {network_size} addresses"
             )
 
-        return IPv6Address.from_int(int(self._netaddr) + index)
+        return IPv6Address._from_int_unchecked(int(self._netaddr) + index)
+
+    def sample(self, k: int, seed: int | None = None) -> list[IPv6Address]:
+        """
+        Pick k distinct hosts uniformly at random without materializing
+        hosts(), in O(k) time and memory.
+
+        Args:
+            k: Number of hosts to pick
+            seed: Seed of a reproducible pick, None for a random one
+
+        Raises:
+            TypeError: If k is not an int
+            ValueError: If k is negative or larger than the number of hosts
+
+        Examples:
+            >>> IPv6Network("2001:db8::/64").sample(1, seed=1)
+            [IPv6Address("2001:db8::6ab6:c7be:2e97:46e4")]
+        """
+        return self.hosts().sample(k, seed)
+
+    def permuted_hosts(self, seed: int | None = None) -> cabc.Iterator[IPv6Address]:
+        """
+        Iterate over every host exactly once in a pseudo-random order.
+
+        Memory use is constant whatever the network size, e.g. for spreading
+        a scan of a large network evenly over time. The same seed yields the
+        same order.
+        """
+        return self.hosts().permuted(seed)
 
     def contains_subnet(self, subnet: "IPv6Network") -> bool:
         if not isinstance(subnet, self.__class__):
@@ -437,12 +517,9 @@ class IPv6Network:
                 f'Unable to process value "{address}" of type "{type(address)}"'
             )
 
-        if self._prefixlen == 0:
-            return True  # Network covers all addresses
-
         # Apply network mask to both addresses and compare
-        mask = int(self._netmask)
-        return (int(address) & mask) == (int(self._netaddr) & mask)
+        mask = convs.NETMASKS[self._prefixlen]
+        return (address._addr & mask) == (self._netaddr._addr & mask)
 
     def overlaps(self, other: "IPv6Network") -> bool:
         """
@@ -484,6 +561,60 @@ class IPv6Network:
             self.netaddress
         )
 
+    def exclude(
+        self,
+        *others: "IPv6Network",
+    ) -> cabc.Generator["IPv6Network", None, None]:
+        """
+        Generate networks that remain after removing other networks from this one.
+
+        Remaining address ranges are converted to CIDR blocks by bit arithmetic,
+        which costs O(prefixlen) per excluded network instead of enumerating
+        subnets down to its prefix length. Networks outside of this one are
+        ignored.
+
+        Args:
+            *others: IPv6Network objects to exclude
+
+        Yields:
+            IPv6Network: Remaining networks in sorted order
+
+        Raises:
+            TypeError: If any of others is not an IPv6Network
+
+        Examples:
+            >>> net = IPv6Network("2001:db8::/32")
+            >>> list(net.exclude(IPv6Network("2001:db8:4000::/34")))
+            [IPv6Network("2001:db8::/34"), IPv6Network("2001:db8:8000::/33")]
+        """
+        width = c.IPV6.PREFIXLEN_MAX.value
+        excluded: list[tuple[int, int]] = []
+        for other in others:
+            if not isinstance(other, self.__class__):
+                raise TypeError(
+                    f'Unable to process value "{other}" of type "{type(other)}"'
+                )
+
+            addr, prefixlen = other.as_tuple()
+            excluded.append((addr, addr + (1 << (width - prefixlen))))
+
+        start = int(self._netaddr)
+        stop = start + (1 << (width - self._prefixlen))
+        bounds = ranges.merge_ranges(excluded)
+        for i in range(0, len(bounds), 2):
+            excluded_start = max(bounds[i], start)
+            excluded_stop = min(bounds[i + 1], stop)
+            if excluded_start >= excluded_stop:
+                continue
+
+            for addr, prefixlen in ranges.range_to_cidrs(start, excluded_start, width):
+                yield IPv6Network._from_int_unchecked(addr, prefixlen)
+
+            start = excluded_stop
+
+        for addr, prefixlen in ranges.range_to_cidrs(start, stop, width):
+            yield IPv6Network._from_int_unchecked(addr, prefixlen)
+
 
 class IPv6Interface:
     """
@@ -507,31 +638,41 @@ class IPv6Interface:
         IPv6Network('2001:db8::/64')
     """
 
+    __slots__ = ("_addr", "_network", "_ip")
+
     def __init__(self, address: str) -> None:
-        valids.validate_cidr(address)
-        addr, prefixlen = address.split(c.DELIMITERS.SLASH, maxsplit=1)
-        self._populate(addr, prefixlen)
+        self._populate(*_parse_cidr(address))
 
     @classmethod
     def from_simple(cls, address: str, prefixlen: str) -> "IPv6Interface":
+        prefixlen_ = int(prefixlen)
+        valids.validate_prefixlen_int(prefixlen_)
+
         obj = cls.__new__(cls)
-        obj._populate(address, prefixlen)
+        obj._populate(_parse_address(address), prefixlen_)
         return obj
 
-    def _populate(self, address: str, prefixlen: str) -> None:
-        prefixlen_ = int(prefixlen)
-        self._addr = IPv6Address(address)
+    @classmethod
+    def try_parse(cls, string: str) -> "IPv6Interface | None":
+        """Same as the constructor, but returns None instead of raising."""
+        parsed = convs.parse_cidr(string) if isinstance(string, str) else None
+        if parsed is None:
+            return None
 
-        # Calculate network address
-        if prefixlen_ == 0:
-            netaddr = 0
-        else:
-            mask = (
-                c.IPV6.ADDRESS_MAX << (c.IPV6.PREFIXLEN_MAX - prefixlen_)
-            ) & c.IPV6.ADDRESS_MAX
-            netaddr = int(self._addr) & mask
+        obj = cls.__new__(cls)
+        obj._populate(*parsed)
+        return obj
 
-        self._network = IPv6Network.from_int(netaddr, prefixlen_)
+    @classmethod
+    def is_valid(cls, string: str) -> bool:
+        """True if string is a valid interface address, never raises."""
+        return isinstance(string, str) and convs.parse_cidr(string) is not None
+
+    def _populate(self, addr: int, prefixlen: int) -> None:
+        self._addr = IPv6Address._from_int_unchecked(addr)
+        netaddr = addr & convs.NETMASKS[prefixlen]
+        self._network = IPv6Network._from_int_unchecked(netaddr, prefixlen)
+        self._ip: str | None = None
 
     @classmethod
     def from_objects(
@@ -551,6 +692,7 @@ class IPv6Interface:
         obj = cls.__new__(cls)
         obj._addr = address
         obj._network = network
+        obj._ip = None
         return obj
 
     def as_tuple(self) -> tuple[IPv6Address, IPv6Network]:
@@ -579,8 +721,206 @@ class IPv6Interface:
     def network(self) -> "IPv6Network":
         return self._network
 
-    @functools.cached_property
+    @property
     def ip(self) -> str:
-        return c.DELIMITERS.SLASH.join_as_str(
-            self._addr.address, self._network.prefixlen
+        if self._ip is None:
+            self._ip = c.DELIMITERS.SLASH.join_as_str(
+                self._addr.address, self._network.prefixlen
+            )
+        return self._ip
+
+
+class IPv6Range:
+    """
+    Represents an arbitrary range of IPv6 addresses.
+
+    The range is stored as its first and last address only, so size,
+    membership and overlap checks are O(1) integer comparisons and the
+    range is never iterated address by address.
+
+    Note: len() is limited by sys.maxsize, use the size property
+    for ranges spanning more than 2^63 addresses.
+
+    Args:
+        string (str): First and last address joined by a dash,
+            e.g. "2001:db8::1-2001:db8::4"
+
+    Raises:
+        TypeError: If input is not a string
+        ValueError: If an address is invalid or first is greater than last
+
+    Examples:
+        >>> rng = IPv6Range("2001:db8::1-2001:db8::4")
+        >>> len(rng)
+        4
+        >>> IPv6Address("2001:db8::2") in rng
+        True
+        >>> [str(network) for network in rng.networks()]
+        ['2001:db8::1/128', '2001:db8::2/127', '2001:db8::4/128']
+    """
+
+    __slots__ = ("_first", "_last", "_address")
+
+    def __init__(self, string: str) -> None:
+        if not isinstance(string, str):
+            raise TypeError(
+                f'Provided invalid value "{string=}" of type "{type(string)}",'
+                + " str expected"
+            )
+
+        first, _, last = string.partition(c.DELIMITERS.DASH)
+        self._populate(IPv6Address(first), IPv6Address(last))
+
+    def _populate(self, first: IPv6Address, last: IPv6Address) -> None:
+        if first > last:
+            raise ValueError(
+                f'First address "{first}" must not be greater than last "{last}"'
+            )
+
+        self._first = first
+        self._last = last
+        self._address: str | None = None
+
+    @classmethod
+    def from_addresses(
+        cls,
+        first: IPv6Address,
+        last: IPv6Address,
+    ) -> "IPv6Range":
+        if not isinstance(first, IPv6Address):
+            raise TypeError(f'Unable to create "{cls.__name__}" from "{first=}"')
+
+        if not isinstance(last, IPv6Address):
+            raise TypeError(f'Unable to create "{cls.__name__}" from "{last=}"')
+
+        obj = cls.__new__(cls)
+        obj._populate(first, last)
+        return obj
+
+    @classmethod
+    def from_int(cls, first: int, last: int) -> "IPv6Range":
+        return cls.from_addresses(
+            IPv6Address.from_int(first), IPv6Address.from_int(last)
+        )
+
+    @classmethod
+    def from_network(cls, network: IPv6Network) -> "IPv6Range":
+        if not isinstance(network, IPv6Network):
+            raise TypeError(f'Unable to create "{cls.__name__}" from "{network=}"')
+
+        return cls.from_addresses(network.netaddress, network.host_at(-1))
+
+    @classmethod
+    def try_parse(cls, string: str) -> "IPv6Range | None":
+        """Same as the constructor, but returns None instead of raising."""
+        if not isinstance(string, str):
+            return None
+
+        first, _, last = string.partition(c.DELIMITERS.DASH)
+        first_ = convs.parse_address(first)
+        last_ = convs.parse_address(last)
+        if first_ is None or last_ is None or first_ > last_:
+            return None
+
+        obj = cls.__new__(cls)
+        obj._populate(
+            IPv6Address._from_int_unchecked(first_),
+            IPv6Address._from_int_unchecked(last_),
         )
+        return obj
+
+    @classmethod
+    def is_valid(cls, string: str) -> bool:
+        """True if string is a valid range, never raises."""
+        return cls.try_parse(string) is not None
+
+    def as_tuple(self) -> tuple[int, int]:
+        return int(self._first), int(self._last)
+
+    @property
+    def first(self) -> IPv6Address:
+        return self._first
+
+    @property
+    def last(self) -> IPv6Address:
+        return self._last
+
+    @property
+    def size(self) -> int:
+        return int(self._last) - int(self._first) + 1
+
+    @property
+    def address(self) -> str:
+        if self._address is None:
+            self._address = c.DELIMITERS.DASH.join_as_str(
+                self._first.address, self._last.address
+            )
+        return self._address
+
+    def networks(self) -> cabc.Generator[IPv6Network, None, None]:
+        """Minimal list of networks exactly covering the range, in sorted order."""
+        for addr, prefixlen in ranges.range_to_cidrs(
+            int(self._first), int(self._last) + 1, c.IPV6.PREFIXLEN_MAX.value
+        ):
+            yield IPv6Network._from_int_unchecked(addr, prefixlen)
+
+    def contains_address(self, address: IPv6Address) -> bool:
+        if not isinstance(address, IPv6Address):
+            raise TypeError(
+                f'Unable to process value "{address}" of type "{type(address)}"'
+            )
+
+        return self._first <= address <= self._last
+
+    def overlaps(self, other: "IPv6Range") -> bool:
+        if not isinstance(other, self.__class__):
+            raise TypeError(
+                f'Unable to process value "{other}" of type "{type(other)}"'
+            )
+
+        return self._first <= other._last and other._first <= self._last
+
+    def __contains__(self, address: IPv6Address) -> bool:
+        return self.contains_address(address)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __str__(self) -> str:
+        return self.address
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}("{self.address}")'
+
+    def __hash__(self) -> int:
+        return hash(self.as_tuple())
+
+    def __eq__(self, other: t.Any) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return self._first == other._first and self._last == other._last
+
+    def __lt__(self, other: t.Any) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return self.as_tuple() < other.as_tuple()
+
+    def __le__(self, other: t.Any) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return self.as_tuple() <= other.as_tuple()
+
+    def __gt__(self, other: t.Any) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return self.as_tuple() > other.as_tuple()
+
+    def __ge__(self, other: t.Any) -> bool:
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+
+        return self.as_tuple() >= other.as_tuple()
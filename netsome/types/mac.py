@@ -2,7 +2,11 @@ import contextlib
 import functools
 import typing as t
 
+from netsome import _intern
+from netsome import _parse_cache
+from netsome import _trust
 from netsome import constants as c
+from netsome._converters import mac as convs
 from netsome.validators import mac as valids
 
 
@@ -40,21 +44,69 @@ class MacAddress:
     ADDR_STRING_SIZE = 12
     OUI_PART_STRING_SIZE = 6
 
+    # int address and lazily cached string form
+    __slots__ = ("_addr", "_address", "__weakref__")
+
+    # opt-in pool of canonical instances, see intern()
+    intern_pool: t.ClassVar[_intern.InternPool["MacAddress"]] = _intern.InternPool()
+    # opt-in LRU cache of parsed strings, see netsome.enable_parse_cache()
+    parse_cache: t.ClassVar[_parse_cache.ParseCache[int]] = _parse_cache.register(
+        "MacAddress"
+    )
+
     def __init__(self, addr: str) -> None:
-        valids.validate_hex_string(addr, self.ADDR_STRING_SIZE)
-        self._addr = int(addr, base=c.NUMERALSYSTEMS.HEX)
+        self._addr = self.parse_cache.lookup(addr, self._parse_hex)
+        self._address: str | None = None
+
+    @classmethod
+    def _parse_hex(cls, addr: str) -> int:
+        valids.validate_hex_string(addr, cls.ADDR_STRING_SIZE)
+        return int(addr, base=c.NUMERALSYSTEMS.HEX)
+
+    @classmethod
+    def _from_int_unchecked(cls, number: int) -> "MacAddress":
+        # for values valid by construction, skips validation
+        obj = cls.__new__(cls)
+        obj._addr = number
+        obj._address = None
+        return obj
 
-    @functools.cached_property
+    @classmethod
+    def intern(cls, value: "str | MacAddress") -> "MacAddress":
+        """
+        Canonical instance for the address, equal interned addresses are
+        identical. Accepts the constructor format of 12 hex digits.
+        """
+        if isinstance(value, cls):
+            number = value._addr
+        else:
+            parsed = convs.parse_address(value) if isinstance(value, str) else None
+            if parsed is None:
+                valids.validate_hex_string(value, cls.ADDR_STRING_SIZE)
+                raise ValueError(f'Unable to parse "{value}" of type "{type(value)}"')
+
+            number = parsed
+
+        interned = cls.intern_pool.get(number)
+        if interned is not None:
+            return interned
+
+        if not isinstance(value, cls):
+            value = cls._from_int_unchecked(number)
+
+        return cls.intern_pool.add(number, value)
+
+    @property
     def address(self) -> str:
-        addr = hex(self._addr)[2:]  # ignore 0x part
-        leading_zeros = "0" * (self.ADDR_STRING_SIZE - len(addr))
-        return leading_zeros + addr
+        if self._address is None:
+            self._address = f"{self._addr:0{self.ADDR_STRING_SIZE}x}"
+        return self._address
 
-    @functools.cached_property
+    @property
     def oui(self) -> str:
         return self.address[: self.OUI_PART_STRING_SIZE]
 
-    @functools.cached_property
+    @property
     def nic(self) -> str:
         return self.address[self.OUI_PART_STRING_SIZE :]
 
@@ -85,28 +137,59 @@ class MacAddress:
 
     @classmethod
     def from_int(cls, number: int) -> "MacAddress":
-        valids.validate_int(number)
-        obj = cls.__new__(cls)
-        obj._addr = number
-        return obj
+        if not _trust.is_trusted():
+            valids.validate_int(number)
+
+        return cls._from_int_unchecked(number)
 
     @classmethod
     def parse(cls, addr: t.Any) -> "MacAddress":
-        # TODO: can collect all this from cls attrs?
-        from_fmts = (
-            cls,
-            cls.from_dashed,
-            cls.from_coloned,
-            cls.from_dotted,
-            cls.from_int,
-        )
-
-        for fmt in from_fmts:
-            with contextlib.suppress(Exception):
+        # format is picked by delimiter, only the matching constructor runs
+        fmt: t.Callable[[t.Any], MacAddress] | None = None
+        if isinstance(addr, int):
+            fmt = cls.from_int
+        elif isinstance(addr, str):
+            fmt = cls
+            for delimiter, from_fmt in (
+                (c.DELIMITERS.COLON, cls.from_coloned),
+                (c.DELIMITERS.DASH, cls.from_dashed),
+                (c.DELIMITERS.DOT, cls.from_dotted),
+            ):
+                if delimiter in addr:
+                    fmt = from_fmt
+                    break
+
+        if fmt is not None:
+            with contextlib.suppress(TypeError, ValueError):
                 return fmt(addr)
 
         raise ValueError(f'Unable to parse "{addr}" of type "{type(addr)}"')
 
+    @classmethod
+    def try_parse(cls, addr: t.Any) -> "MacAddress | None":
+        """Same as parse(), but returns None instead of raising."""
+        if isinstance(addr, int):
+            if not (c.MAC.ADDRESS_MIN <= addr <= c.MAC.ADDRESS_MAX):
+                return None
+
+            return cls.from_int(addr)
+
+        if not isinstance(addr, str):
+            return None
+
+        for delimiter in (c.DELIMITERS.COLON, c.DELIMITERS.DASH, c.DELIMITERS.DOT):
+            if delimiter in addr:
+                addr = addr.replace(delimiter, "")
+                break
+
+        number = convs.parse_address(addr)
+        return None if number is None else cls.from_int(number)
+
+    @classmethod
+    def is_valid(cls, addr: t.Any) -> bool:
+        """True if parse() would succeed, never raises."""
+        return cls.try_parse(addr) is not None
+
     @functools.lru_cache
     def to_str(
         self,
@@ -131,6 +214,9 @@ class MacAddress:
         return hash(self._addr)
 
     def __eq__(self, other: t.Any) -> bool:
+        if other is self:
+            return True
+
         if not isinstance(other, self.__class__):
             return NotImplemented
 
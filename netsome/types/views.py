@@ -0,0 +1,286 @@
+import abc
+import collections.abc as cabc
+import itertools
+import random
+import typing as t
+
+
+T = t.TypeVar("T")
+View = t.TypeVar("View", bound="_RangeView[t.Any]")
+
+
+def _range_size(addrs: range) -> int:
+    # len() of a range is limited to sys.maxsize, IPv6 ranges are not
+    if addrs.step > 0:
+        return max(0, (addrs.stop - addrs.start + addrs.step - 1) // addrs.step)
+
+    return max(0, (addrs.start - addrs.stop - addrs.step - 1) // -addrs.step)
+
+
+def _permuted_indexes(size: int, seed: int | None) -> cabc.Iterator[int]:
+    # every index in range(size) exactly once in a pseudo-random order, in
+    # O(1) memory: a counter over the smallest power of two domain is mapped
+    # through a keyed bijection of that domain, values past size are
+    # skipped, which costs less than one extra step per index
+    if size < 1:
+        return
+
+    bits = max(1, (size - 1).bit_length())
+    mask = (1 << bits) - 1
+    shift = (bits + 1) // 2
+    rng = random.Random(seed)
+    mul1, mul2, mul3, mul4 = (rng.getrandbits(bits) | 1 for _ in range(4))
+    inc1, inc2, inc3, inc4 = (rng.getrandbits(bits) for _ in range(4))
+    offset = rng.getrandbits(bits)
+
+    for counter in range(mask + 1):
+        # rounds of xorshift, multiplication by an odd number and addition,
+        # each invertible modulo a power of two, unrolled for speed
+        index = (counter + offset) & mask
+        index = ((index ^ (index >> shift)) * mul1 + inc1) & mask
+        index = ((index ^ (index >> shift)) * mul2 + inc2) & mask
+        index = ((index ^ (index >> shift)) * mul3 + inc3) & mask
+        index = ((index ^ (index >> shift)) * mul4 + inc4) & mask
+        if index < size:
+            yield index
+
+
+class _RangeView(cabc.Sequence[T]):
+    # sequence of objects built from an arithmetic progression of ints,
+    # subclasses tell how an object is built and found
+
+    __slots__ = ("_cls", "_addrs")
+
+    _NAME = "items"
+
+    def __init__(self, cls: type[T], addrs: range) -> None:
+        self._cls: t.Any = cls
+        self._addrs = addrs
+
+    @property
+    def size(self) -> int:
+        """Number of items, not limited to sys.maxsize unlike len()."""
+        return _range_size(self._addrs)
+
+    @abc.abstractmethod
+    def _build(self, addr: int) -> T: ...
+
+    @abc.abstractmethod
+    def _addr_of(self, value: t.Any) -> int | None: ...
+
+    @abc.abstractmethod
+    def _slice(self: View, addrs: range) -> View: ...
+
+    def _offset(self, value: t.Any) -> int | None:
+        # position of value in the view, None if not in it
+        addr = self._addr_of(value) if isinstance(value, self._cls) else None
+        if addr is None or addr not in self._addrs:
+            return None
+
+        return (addr - self._addrs.start) // self._addrs.step
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __bool__(self) -> bool:
+        return bool(self._addrs)
+
+    @t.overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @t.overload
+    def __getitem__(self: View, index: slice) -> View: ...
+
+    def __getitem__(self, index: int | slice) -> "T | _RangeView[T]":
+        if isinstance(index, slice):
+            return self._slice(self._addrs[index])
+
+        try:
+            addr = self._addrs[index]
+        except IndexError:
+            raise IndexError(
+                f"Index {index} out of range for {self.size} {self._NAME}"
+            ) from None
+
+        return self._build(addr)
+
+    def __iter__(self) -> cabc.Iterator[T]:
+        build = self._build
+        for addr in self._addrs:
+            yield build(addr)
+
+    def __reversed__(self) -> cabc.Iterator[T]:
+        return iter(self[::-1])
+
+    def __contains__(self, value: t.Any) -> bool:
+        return self._offset(value) is not None
+
+    def index(self, value: t.Any, start: int = 0, stop: int | None = None) -> int:
+        offset = self._offset(value)
+        first, last, _ = slice(start, stop).indices(self.size)
+        if offset is None or not (first <= offset < last):
+            raise ValueError(f"{value!r} is not in {self._NAME}")
+
+        return offset
+
+    def count(self, value: t.Any) -> int:
+        return int(value in self)
+
+    def permuted(self, seed: int | None = None) -> cabc.Iterator[T]:
+        """
+        Iterate over every item exactly once in a pseudo-random order.
+
+        Memory use is constant whatever the size, items are built one at a
+        time. The same seed yields the same order, None picks a random one.
+        """
+        addrs = self._addrs
+        for index in _permuted_indexes(self.size, seed):
+            yield self._build(addrs[index])
+
+    def sample(self, k: int, seed: int | None = None) -> list[T]:
+        """
+        Pick k distinct items uniformly at random, in O(k) time and memory.
+
+        Raises:
+            TypeError: If k is not an int
+            ValueError: If k is negative or larger than the view
+        """
+        if not isinstance(k, int):
+            raise TypeError(
+                f'Provided invalid value "{k=}" of type "{type(k)}", int expected'
+            )
+
+        if not 0 <= k <= self.size:
+            raise ValueError(
+                f'Provided invalid value "{k=}", must be in range 0-{self.size}'
+            )
+
+        return list(itertools.islice(self.permuted(seed), k))
+
+    def __repr__(self) -> str:
+        if not self:
+            return f"{self.__class__.__name__}(size=0)"
+
+        return (
+            f"{self.__class__.__name__}({self[0]!r}, ..., {self[-1]!r},"
+            + f" size={self.size})"
+        )
+
+
+class SubnetView(_RangeView[T]):
+    """
+    Lazy sequence of equally sized subnets of a network.
+
+    Returned by IPv4Network.subnets() and IPv6Network.subnets(). Subnets
+    are an arithmetic progression of addresses, so length, indexing,
+    slicing, membership and index() are O(1) integer math and networks
+    are only built when accessed. Iterating yields the same networks in
+    the same order as the former generator.
+
+    Slices are views too. len() is limited to sys.maxsize by python, use
+    size for views of more subnets, e.g. /64s of an IPv6 /0.
+
+    Examples:
+        >>> subnets = IPv4Network("10.0.0.0/8").subnets(24)
+        >>> len(subnets)
+        65536
+        >>> subnets[-1]
+        IPv4Network("10.255.255.0/24")
+        >>> subnets[::256][1]
+        IPv4Network("10.1.0.0/24")
+        >>> IPv4Network("10.1.2.0/24") in subnets
+        True
+    """
+
+    __slots__ = ("_prefixlen",)
+
+    _NAME = "subnets"
+
+    def __init__(self, network_cls: type[T], addrs: range, prefixlen: int) -> None:
+        super().__init__(network_cls, addrs)
+        self._prefixlen = prefixlen
+
+    @property
+    def prefixlen(self) -> int:
+        return self._prefixlen
+
+    def _build(self, addr: int) -> T:
+        return self._cls._from_int_unchecked(addr, self._prefixlen)
+
+    def _addr_of(self, value: t.Any) -> int | None:
+        addr, prefixlen = value.as_tuple()
+        return addr if prefixlen == self._prefixlen else None
+
+    def _slice(self, addrs: range) -> "SubnetView[T]":
+        return self.__class__(self._cls, addrs, self._prefixlen)
+
+    def __iter__(self) -> cabc.Iterator[T]:
+        build = self._cls._from_int_unchecked
+        prefixlen = self._prefixlen
+        for addr in self._addrs:
+            yield build(addr, prefixlen)
+
+
+class HostRange(_RangeView[T]):
+    """
+    Lazy sequence of host addresses of a network.
+
+    Returned by IPv4Network.hosts() and IPv6Network.hosts(). IPv4 hosts
+    exclude the network and broadcast addresses, except for /31 and /32
+    where every address is a host. IPv6 has no broadcast address, every
+    address of an IPv6 network is a host, /127 and /128 included.
+
+    Length, indexing, slicing, reverse iteration and membership are O(1)
+    integer math, addresses are only built when accessed. batched()
+    iterates in chunks of objects or of raw int values.
+
+    Examples:
+        >>> hosts = IPv4Network("10.0.0.0/24").hosts()
+        >>> len(hosts), hosts[0], hosts[-1]
+        (254, IPv4Address("10.0.0.1"), IPv4Address("10.0.0.254"))
+        >>> IPv4Address("10.0.0.255") in hosts
+        False
+        >>> next(IPv4Network("10.0.0.0/24").hosts().batched(100, raw=True))
+        range(167772161, 167772261)
+    """
+
+    __slots__ = ()
+
+    _NAME = "hosts"
+
+    def _build(self, addr: int) -> T:
+        return self._cls._from_int_unchecked(addr)
+
+    def _addr_of(self, value: t.Any) -> int | None:
+        return int(value)
+
+    def _slice(self, addrs: range) -> "HostRange[T]":
+        return self.__class__(self._cls, addrs)
+
+    def __iter__(self) -> cabc.Iterator[T]:
+        build = self._cls._from_int_unchecked
+        for addr in self._addrs:
+            yield build(addr)
+
+    def batched(
+        self,
+        size: int,
+        raw: bool = False,
+    ) -> cabc.Generator[range | list[T], None, None]:
+        """
+        Iterate in chunks of up to size hosts.
+
+        Args:
+            size: Number of hosts per chunk
+            raw: Yield ranges of int addresses instead of lists of addresses
+
+        Raises:
+            ValueError: If size is not positive
+        """
+        if size < 1:
+            raise ValueError(f'Provided invalid value "{size=}", must be positive')
+
+        build = self._cls._from_int_unchecked
+        for first in range(0, self.size, size):
+            chunk = self._addrs[first : first + size]
+            yield chunk if raw else [build(addr) for addr in chunk]
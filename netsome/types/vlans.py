@@ -1,5 +1,7 @@
+import collections.abc as cabc
 import typing as t
 
+from netsome import _trust
 from netsome import constants as c
 from netsome.validators import vlans as valids
 
@@ -40,15 +42,57 @@ class VID:
 
     RESERVED = {MIN, DEFAULT, MAX}
 
+    __slots__ = ("_vid",)
+
     def __init__(self, vid: int) -> None:
         valids.validate_vid(vid)
         self._vid = vid
 
+    @classmethod
+    def intern(cls, value: "int | VID") -> "VID":
+        """Shared instance from the table of all VLAN IDs, never allocates."""
+        if isinstance(value, cls):
+            return _VIDS[value._vid]
+
+        valids.validate_vid(value)
+        return _VIDS[value]
+
+    @classmethod
+    def from_str(cls, string: str) -> "VID":
+        """VID from decimal string, e.g. "100"."""
+        valids.validate_vid_str(string)
+        return cls(int(string))
+
+    @classmethod
+    def try_parse(cls, value: int | str) -> "VID | None":
+        """
+        Same as the constructor for ints and from_str() for strings, but
+        returns None instead of raising.
+        """
+        if isinstance(value, str):
+            if not (value.isascii() and value.isdigit()):
+                return None
+
+            value = int(value)
+
+        if not isinstance(value, int) or not (cls.MIN <= value <= cls.MAX):
+            return None
+
+        return cls(value)
+
+    @classmethod
+    def is_valid(cls, value: int | str) -> bool:
+        """True if value is a valid VLAN ID, never raises."""
+        return cls.try_parse(value) is not None
+
     @property
     def vid(self) -> int:
         return self._vid
 
     def __eq__(self, other: t.Any) -> bool:
+        if other is self:
+            return True
+
         if not isinstance(other, self.__class__):
             return NotImplemented
 
@@ -95,3 +139,279 @@ class VID:
 
     def is_default(self) -> bool:
         return self._vid == self.DEFAULT
+
+
+# every possible VID, indexed by VID, see VID.intern()
+_VIDS = tuple(VID(vid) for vid in range(c.VLAN.VID_MAX + 1))
+
+_VID_ALL = (1 << (c.VLAN.VID_MAX + 1)) - 1
+# "all" keyword of vendor range syntax, reserved VLANs 0 and 4095 excluded
+_VID_KEYWORD_ALL = _VID_ALL ^ (1 << c.VLAN.VID_MIN) ^ (1 << c.VLAN.VID_MAX)
+
+
+def _parse_range_string(string: str) -> int | None:
+    value = string.strip()
+    if value.startswith("[") and value.endswith("]"):
+        value = value[1:-1]
+
+    keyword = value.strip().lower()
+    if keyword == "all":
+        return _VID_KEYWORD_ALL
+    if keyword == "none":
+        return 0
+
+    bitmap = 0
+    for item in value.replace(",", " ").split():
+        first, dash, last = item.partition(c.DELIMITERS.DASH)
+        if not (
+            first.isascii()
+            and first.isdigit()
+            and (not dash or (last.isascii() and last.isdigit()))
+        ):
+            return None
+
+        low = int(first)
+        high = int(last) if dash else low
+        if not (low <= high <= c.VLAN.VID_MAX):
+            return None
+
+        bitmap |= (1 << (high + 1)) - (1 << low)
+
+    return bitmap
+
+
+class VlanSet:
+    """
+    Represents a set of VLAN IDs.
+
+    VLAN IDs are stored as a single 4096-bit integer bitmap, so membership is
+    a bit test and set operations are bitwise operations over whole machine
+    words. Vendor range strings like "1-10,20,4000-4094" are parsed and
+    emitted directly into and from the bitmap, without VID objects.
+
+    Args:
+        vids: Iterable of VID objects or ints
+
+    Raises:
+        TypeError: If an item is not a VID or int
+        ValueError: If an int is outside valid VLAN ID range
+
+    Examples:
+        >>> allowed = VlanSet.from_string("1-10,20,4000-4094")
+        >>> VID(5) in allowed
+        True
+        >>> str(allowed - VlanSet.from_string("2-9"))
+        '1,10,20,4000-4094'
+        >>> allowed.to_string(c.VLAN_RANGE_STYLES.JUNIPER)
+        '[ 1-10 20 4000-4094 ]'
+    """
+
+    __slots__ = ("_bitmap",)
+
+    def __init__(self, vids: cabc.Iterable[VID | int] = ()) -> None:
+        bitmap = 0
+        for vid in vids:
+            if not isinstance(vid, VID):
+                valids.validate_vid(vid)
+            bitmap |= 1 << int(vid)
+
+        self._bitmap = bitmap
+
+    @classmethod
+    def from_int(cls, bitmap: int) -> "VlanSet":
+        """Create set from a bitmap where bit N stands for VLAN ID N."""
+        if _trust.is_trusted():
+            return cls._from_int_unchecked(bitmap)
+
+        if not isinstance(bitmap, int):
+            raise TypeError(
+                f'Provided invalid value "{bitmap}" of type "{type(bitmap)}",'
+                + " int expected"
+            )
+
+        if bitmap < 0 or bitmap > _VID_ALL:
+            raise ValueError(f'Bitmap "{bitmap}" has bits outside VLAN ID range')
+
+        return cls._from_int_unchecked(bitmap)
+
+    @classmethod
+    def _from_int_unchecked(cls, bitmap: int) -> "VlanSet":
+        # for values valid by construction, skips validation
+        obj = cls.__new__(cls)
+        obj._bitmap = bitmap
+        return obj
+
+    @classmethod
+    def from_string(cls, string: str) -> "VlanSet":
+        """
+        Parse a vendor VLAN range string.
+
+        Items are separated by commas (Cisco, Arista) or whitespace and may
+        be wrapped in square brackets (Juniper). Keywords "all" (1-4094)
+        and "none" are accepted as the whole string.
+
+        Raises:
+            TypeError: If string is not a str
+            ValueError: If string is not a valid VLAN range string
+        """
+        if not isinstance(string, str):
+            raise TypeError(
+                f'Provided invalid value "{string}" of type "{type(string)}",'
+                + " str expected"
+            )
+
+        bitmap = _parse_range_string(string)
+        if bitmap is None:
+            raise ValueError(f'Invalid VLAN range string "{string}"')
+
+        return cls._from_int_unchecked(bitmap)
+
+    @classmethod
+    def try_parse(cls, string: str) -> "VlanSet | None":
+        """Same as from_string(), but returns None instead of raising."""
+        bitmap = _parse_range_string(string) if isinstance(string, str) else None
+        return None if bitmap is None else cls._from_int_unchecked(bitmap)
+
+    @classmethod
+    def is_valid(cls, string: str) -> bool:
+        """True if string is a valid VLAN range string, never raises."""
+        return isinstance(string, str) and _parse_range_string(string) is not None
+
+    @property
+    def bitmap(self) -> int:
+        return self._bitmap
+
+    def ranges(self) -> cabc.Generator[tuple[int, int], None, None]:
+        """Consecutive runs of VLAN IDs as inclusive (first, last) pairs."""
+        bitmap = self._bitmap
+        while bitmap:
+            # lowest set bit, then the length of the run of ones above it
+            low = (bitmap & -bitmap).bit_length() - 1
+            run = bitmap >> low
+            length = (~run & (run + 1)).bit_length() - 1
+            yield low, low + length - 1
+            bitmap ^= ((1 << length) - 1) << low
+
+    def to_string(
+        self,
+        style: c.VLAN_RANGE_STYLES = c.VLAN_RANGE_STYLES.CISCO,
+    ) -> str:
+        """
+        Emit compressed VLAN range string in the syntax of a vendor.
+
+        Cisco and Arista use "1-10,20" and "none" for an empty set,
+        Juniper uses "[ 1-10 20 ]", a single item is not bracketed.
+        """
+        style = c.VLAN_RANGE_STYLES(style)
+        items = [
+            str(first) if first == last else c.DELIMITERS.DASH.join_as_str(first, last)
+            for first, last in self.ranges()
+        ]
+        if style == c.VLAN_RANGE_STYLES.JUNIPER:
+            if len(items) == 1:
+                return items[0]
+            return f"[ {' '.join(items)} ]" if items else "[ ]"
+
+        return ",".join(items) if items else "none"
+
+    def union(self, other: "VlanSet") -> "VlanSet":
+        return self._from_int_unchecked(self._bitmap | other._bitmap)
+
+    def intersection(self, other: "VlanSet") -> "VlanSet":
+        return self._from_int_unchecked(self._bitmap & other._bitmap)
+
+    def difference(self, other: "VlanSet") -> "VlanSet":
+        return self._from_int_unchecked(self._bitmap & ~other._bitmap)
+
+    def symmetric_difference(self, other: "VlanSet") -> "VlanSet":
+        return self._from_int_unchecked(self._bitmap ^ other._bitmap)
+
+    def isdisjoint(self, other: "VlanSet") -> bool:
+        return not self._bitmap & other._bitmap
+
+    def issubset(self, other: "VlanSet") -> bool:
+        return not self._bitmap & ~other._bitmap
+
+    def issuperset(self, other: "VlanSet") -> bool:
+        return not other._bitmap & ~self._bitmap
+
+    def __contains__(self, vid: VID | int) -> bool:
+        if not isinstance(vid, (VID, int)):
+            raise TypeError(f'Unable to process value "{vid}" of type "{type(vid)}"')
+
+        vid = int(vid)
+        return vid >= 0 and bool(self._bitmap >> vid & 1)
+
+    def __iter__(self) -> cabc.Iterator[VID]:
+        for first, last in self.ranges():
+            for vid in range(first, last + 1):
+                yield VID(vid)
+
+    def __len__(self) -> int:
+        return self._bitmap.bit_count()
+
+    def __bool__(self) -> bool:
+        return bool(self._bitmap)
+
+    def __or__(self, other: t.Any) -> "VlanSet":
+        if not isinstance(other, VlanSet):
+            return NotImplemented
+
+        return self.union(other)
+
+    def __and__(self, other: t.Any) -> "VlanSet":
+        if not isinstance(other, VlanSet):
+            return NotImplemented
+
+        return self.intersection(other)
+
+    def __sub__(self, other: t.Any) -> "VlanSet":
+        if not isinstance(other, VlanSet):
+            return NotImplemented
+
+        return self.difference(other)
+
+    def __xor__(self, other: t.Any) -> "VlanSet":
+        if not isinstance(other, VlanSet):
+            return NotImplemented
+
+        return self.symmetric_difference(other)
+
+    def __le__(self, other: t.Any) -> bool:
+        if not isinstance(other, VlanSet):
+            return NotImplemented
+
+        return self.issubset(other)
+
+    def __ge__(self, other: t.Any) -> bool:
+        if not isinstance(other, VlanSet):
+            return NotImplemented
+
+        return self.issuperset(other)
+
+    def __lt__(self, other: t.Any) -> bool:
+        if not isinstance(other, VlanSet):
+            return NotImplemented
+
+        return self._bitmap != other._bitmap and self.issubset(other)
+
+    def __gt__(self, other: t.Any) -> bool:
+        if not isinstance(other, VlanSet):
+            return NotImplemented
+
+        return self._bitmap != other._bitmap and self.issuperset(other)
+
+    def __eq__(self, other: t.Any) -> bool:
+        if not isinstance(other, VlanSet):
+            return NotImplemented
+
+        return self._bitmap == other._bitmap
+
+    def __hash__(self) -> int:
+        return hash(self._bitmap)
+
+    def __str__(self) -> str:
+        return self.to_string()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}.from_string("{self}")'
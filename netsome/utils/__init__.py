@@ -0,0 +1,28 @@
+"""
+Utilities package providing bulk operations over netsome types.
+
+The package includes:
+- collapse_networks: aggregation of adjacent and overlapping networks
+- summarize_range: minimal list of networks covering an address range
+- AddressPool: bitmap allocator of individual addresses with leases
+- PrefixAllocator: buddy allocator of subnets
+- compact_interfaces: vendor range strings of sorted interfaces
+- expand_interfaces: lazy expansion of vendor range strings
+"""
+
+from netsome.utils.interfaces import compact_interfaces
+from netsome.utils.interfaces import expand_interfaces
+from netsome.utils.networks import collapse_networks
+from netsome.utils.networks import summarize_range
+from netsome.utils.pools import AddressPool
+from netsome.utils.pools import PrefixAllocator
+
+
+__all__ = [
+    "AddressPool",
+    "PrefixAllocator",
+    "collapse_networks",
+    "compact_interfaces",
+    "expand_interfaces",
+    "summarize_range",
+]
@@ -0,0 +1,136 @@
+# pyright: strict, reportUnnecessaryIsInstance=false, reportUnreachable=false
+
+import collections.abc as cabc
+
+from netsome import constants as c
+from netsome.types.interfaces import Interface
+
+
+def _name(iface: Interface, abbreviated: bool) -> str:
+    return iface.abbreviated_name if abbreviated else iface.canonical_name
+
+
+def compact_interfaces(
+    interfaces: cabc.Iterable[Interface],
+    abbreviated: bool = False,
+) -> cabc.Generator[str, None, None]:
+    """
+    Compact sorted interfaces into vendor range strings.
+
+    Runs of interfaces of one type that differ only in consecutive last
+    port numbers become one range like "GigabitEthernet1/0/1-24".
+    Subinterfaces are never merged and duplicates are dropped. Input is
+    consumed as a stream, only the current run is kept.
+
+    Args:
+        interfaces: Interfaces in natural order, e.g. sorted(interfaces)
+        abbreviated: Use abbreviated names like "GE1/0/1-24"
+
+    Returns:
+        Generator of range strings, single interfaces have no range
+
+    Raises:
+        TypeError: If an item is not an Interface
+
+    Examples:
+        >>> ports = [Interface(f"Gi1/0/{i}") for i in range(24, 0, -1)]
+        >>> list(compact_interfaces(sorted(ports)))
+        ['GigabitEthernet1/0/1-24']
+    """
+    first: Interface | None = None
+    last: Interface | None = None
+    for iface in interfaces:
+        if not isinstance(iface, Interface):
+            raise TypeError(
+                f'Provided invalid value "{iface=}" of type "{type(iface)}", '
+                + "Interface expected"
+            )
+
+        if last is not None:
+            if iface.sort_key == last.sort_key:
+                continue
+
+            rank, ports, sub = last.sort_key
+            next_rank, next_ports, next_sub = iface.sort_key
+            if (
+                rank == next_rank
+                and sub == next_sub == -1
+                and ports[:-1] == next_ports[:-1]
+                and ports[-1] + 1 == next_ports[-1]
+            ):
+                last = iface
+                continue
+
+        if first is not None and last is not None:
+            yield _range_string(first, last, abbreviated)
+
+        first = last = iface
+
+    if first is not None and last is not None:
+        yield _range_string(first, last, abbreviated)
+
+
+def _range_string(first: Interface, last: Interface, abbreviated: bool) -> str:
+    name = _name(first, abbreviated)
+    if first is last:
+        return name
+
+    return c.DELIMITERS.DASH.join_as_str(name, last.sort_key[1][-1])
+
+
+def expand_interfaces(string: str) -> cabc.Generator[Interface, None, None]:
+    """
+    Expand vendor range strings into interfaces, lazily.
+
+    Accepts comma separated items, every item is an interface name or a
+    range of last port numbers like "Gi1/0/1-24" or "Gi1/0/1 - 24".
+    Interfaces are yielded one by one, so a range of a whole stack is never
+    materialized.
+
+    Args:
+        string: Range string, e.g. "Gi1/0/1-24, Gi2/0/1-48, Po1"
+
+    Returns:
+        Generator of Interface
+
+    Raises:
+        TypeError: If string is not a str
+        ValueError: If an item is not a valid interface or range
+
+    Examples:
+        >>> list(expand_interfaces("Gi1/0/1-3"))
+        [Interface("GigabitEthernet1/0/1"), Interface("GigabitEthernet1/0/2"),
+         Interface("GigabitEthernet1/0/3")]
+    """
+    if not isinstance(string, str):
+        raise TypeError(
+            f'Provided invalid value "{string=}" of type "{type(string)}", '
+            + "str expected"
+        )
+
+    for item in string.split(","):
+        item = item.strip()
+        if not item:
+            continue
+
+        head, dash, stop = item.rpartition(c.DELIMITERS.DASH)
+        stop = stop.strip()
+        first = Interface.try_parse(head.strip()) if dash else None
+        # "Port-channel1" is a name, "Port-channel1-4" is a range
+        if first is None or not (stop.isascii() and stop.isdigit()):
+            yield Interface(item)
+            continue
+
+        if first.sub is not None:
+            raise ValueError(f'Invalid interface range "{item}", subinterface')
+
+        ports = first.sort_key[1]
+        if int(stop) < ports[-1]:
+            raise ValueError(f'Invalid interface range "{item}", stop < start')
+
+        base = c.DELIMITERS.SLASH.join(map(str, ports[:-1]))
+        if base:
+            base += c.DELIMITERS.SLASH
+
+        for port in range(ports[-1], int(stop) + 1):
+            yield Interface._from_parsed((first.type, f"{base}{port}", None))
@@ -0,0 +1,144 @@
+# pyright: strict, reportUnnecessaryIsInstance=false, reportUnreachable=false
+
+import collections.abc as cabc
+import typing as t
+
+from netsome import constants as c
+from netsome.types.ipv4 import IPv4Address
+from netsome.types.ipv4 import IPv4Network
+from netsome.types.ipv4 import IPv4Range
+from netsome.types.ipv6 import IPv6Address
+from netsome.types.ipv6 import IPv6Network
+from netsome.types.ipv6 import IPv6Range
+
+
+Network = t.TypeVar("Network", IPv4Network, IPv6Network)
+
+
+def _collapse(prefixes: list[tuple[int, int]], width: int) -> list[tuple[int, int]]:
+    # sorted by address and shorter prefixes first, so a covering network
+    # is always seen before everything it covers
+    prefixes.sort()
+
+    stack: list[tuple[int, int]] = []
+    for addr, prefixlen in prefixes:
+        if stack:
+            top, top_prefixlen = stack[-1]
+            if addr < top + (1 << (width - top_prefixlen)):
+                continue
+
+        # merge sibling pairs bottom-up while the stack top allows
+        while stack and prefixlen:
+            top, top_prefixlen = stack[-1]
+            size = 1 << (width - prefixlen)
+            if top_prefixlen != prefixlen or top + size != addr or top & size:
+                break
+
+            stack.pop()
+            addr, prefixlen = top, prefixlen - 1
+
+        stack.append((addr, prefixlen))
+
+    return stack
+
+
+def collapse_networks(
+    networks: cabc.Iterable[Network],
+) -> list[Network]:
+    """
+    Collapse networks into the minimal equivalent list of networks.
+
+    Networks covered by other networks are dropped and sibling networks
+    are merged into their supernet, repeatedly, so the result covers exactly
+    the same addresses with as few networks as possible. Input is consumed
+    as a stream, only integer forms of the networks are kept while sorting,
+    so the whole run is O(n log n).
+
+    Args:
+        networks: Iterable of IPv4Network or IPv6Network, families may be mixed
+
+    Returns:
+        Sorted list of collapsed networks, IPv4 networks first
+
+    Raises:
+        TypeError: If an item is not an IPv4Network or IPv6Network
+
+    Examples:
+        >>> collapse_networks([
+        ...     IPv4Network("10.0.0.0/25"),
+        ...     IPv4Network("10.0.0.128/25"),
+        ...     IPv4Network("10.0.1.0/24"),
+        ...     IPv4Network("10.0.1.16/28"),
+        ... ])
+        [IPv4Network("10.0.0.0/23")]
+    """
+    v4: list[tuple[int, int]] = []
+    v6: list[tuple[int, int]] = []
+    for network in networks:
+        if isinstance(network, IPv4Network):
+            v4.append(network.as_tuple())
+        elif isinstance(network, IPv6Network):
+            v6.append(network.as_tuple())
+        else:
+            raise TypeError(
+                f'Unable to process value "{network}" of type "{type(network)}"'
+            )
+
+    result: list[t.Any] = [
+        IPv4Network._from_int_unchecked(addr, prefixlen)
+        for addr, prefixlen in _collapse(v4, c.IPV4.PREFIXLEN_MAX.value)
+    ]
+    result += [
+        IPv6Network._from_int_unchecked(addr, prefixlen)
+        for addr, prefixlen in _collapse(v6, c.IPV6.PREFIXLEN_MAX.value)
+    ]
+    return result
+
+
+@t.overload
+def summarize_range(
+    first: IPv4Address,
+    last: IPv4Address,
+) -> cabc.Generator[IPv4Network, None, None]: ...
+
+
+@t.overload
+def summarize_range(
+    first: IPv6Address,
+    last: IPv6Address,
+) -> cabc.Generator[IPv6Network, None, None]: ...
+
+
+def summarize_range(
+    first: IPv4Address | IPv6Address,
+    last: IPv4Address | IPv6Address,
+) -> cabc.Generator[IPv4Network | IPv6Network, None, None]:
+    """
+    Summarize an address range into the minimal list of networks covering it.
+
+    Every emitted network is computed from the trailing zeros of the current
+    address and the bit length of the remaining range, so the work is
+    O(1) per network and never depends on the number of addresses.
+
+    Args:
+        first: First address of the range
+        last: Last address of the range, same family as first
+
+    Returns:
+        Generator of networks exactly covering the range in sorted order
+
+    Raises:
+        TypeError: If addresses are not of the same IPv4/IPv6 address type
+        ValueError: If first address is greater than last
+
+    Examples:
+        >>> list(summarize_range(IPv4Address("10.0.0.0"), IPv4Address("10.0.2.255")))
+        [IPv4Network("10.0.0.0/23"), IPv4Network("10.0.2.0/24")]
+    """
+    if isinstance(first, IPv4Address):
+        return IPv4Range.from_addresses(first, t.cast(IPv4Address, last)).networks()
+
+    if isinstance(first, IPv6Address):
+        return IPv6Range.from_addresses(first, t.cast(IPv6Address, last)).networks()
+
+    raise TypeError(f'Unable to process value "{first}" of type "{type(first)}"')
@@ -0,0 +1,910 @@
+# pyright: strict, reportUnnecessaryIsInstance=false, reportUnreachable=false
+
+import collections.abc as cabc
+import heapq
+import math
+import struct
+import time
+import typing as t
+
+from netsome import constants as c
+from netsome.types.ipv4 import IPv4Address
+from netsome.types.ipv4 import IPv4Network
+from netsome.types.ipv4 import IPv4Range
+from netsome.types.ipv6 import IPv6Address
+from netsome.types.ipv6 import IPv6Network
+from netsome.types.ipv6 import IPv6Range
+
+
+Address: t.TypeAlias = IPv4Address | IPv6Address
+Network: t.TypeAlias = IPv4Network | IPv6Network
+Range: t.TypeAlias = IPv4Range | IPv6Range
+
+_WORD_BITS = 64
+_WORD_SHIFT = 6
+_WORD_MASK = _WORD_BITS - 1
+_WORD_FULL = (1 << _WORD_BITS) - 1
+
+_SNAPSHOT_MAGIC = b"NSAP"
+_SNAPSHOT_VERSION = 2
+# magic, version, address bits, prefixlen, network address
+_SNAPSHOT_HEADER = struct.Struct("!4sBBB16s")
+# count of records
+_SNAPSHOT_COUNT = struct.Struct("!Q")
+# bitmap word: level, word index, word
+_SNAPSHOT_WORD = struct.Struct("!B16sQ")
+# lease: offset, seconds left
+_SNAPSHOT_LEASE = struct.Struct("!16sd")
+
+
+def _parse_snapshot(
+    data: bytes,
+) -> tuple[int, int, int, dict[tuple[int, int], int], list[tuple[int, float]]]:
+    try:
+        magic, version, bits, prefixlen, start = _SNAPSHOT_HEADER.unpack_from(data)
+        if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION:
+            raise ValueError("Invalid pool snapshot header")
+
+        offset = _SNAPSHOT_HEADER.size
+        (count,) = _SNAPSHOT_COUNT.unpack_from(data, offset)
+        offset += _SNAPSHOT_COUNT.size
+        words: dict[tuple[int, int], int] = {}
+        for _ in range(count):
+            level, idx, word = _SNAPSHOT_WORD.unpack_from(data, offset)
+            words[level, int.from_bytes(idx, "big")] = word
+            offset += _SNAPSHOT_WORD.size
+
+        (count,) = _SNAPSHOT_COUNT.unpack_from(data, offset)
+        offset += _SNAPSHOT_COUNT.size
+        leases: list[tuple[int, float]] = []
+        for _ in range(count):
+            lease_offset, left = _SNAPSHOT_LEASE.unpack_from(data, offset)
+            leases.append((int.from_bytes(lease_offset, "big"), left))
+            offset += _SNAPSHOT_LEASE.size
+    except struct.error as e:
+        raise ValueError(f"Invalid pool snapshot: {e}") from e
+
+    if offset != len(data):
+        raise ValueError("Invalid pool snapshot: unexpected trailing data")
+
+    return bits, prefixlen, int.from_bytes(start, "big"), words, leases
+
+
+class AddressPool:
+    """
+    Allocator of individual addresses from an IPv4 or IPv6 network.
+
+    Allocation state is a hierarchical bitmap of 64-bit words: level 0 has a bit
+    per address, every upper level has a bit per full word below it. The next
+    free address is found by descending from the top word, so allocation,
+    release and specific allocation are O(log64 n). Words are stored sparsely,
+    a fresh pool costs nothing even for an IPv6 /64. A set upper bit without
+    words below stands for a full block, so reserving a large aligned block
+    sets a single bit; a second bitmap marks non-empty blocks per level.
+
+    Addresses that are not hosts of the network (IPv4 network and broadcast
+    addresses) are reserved on creation. Allocations may carry a lease, expired
+    leases are kept on a hashed timing wheel and released on expire() or
+    before the next allocation.
+
+    Args:
+        network: Network to allocate addresses from
+        lease_resolution: Timing wheel tick in seconds
+        wheel_size: Number of timing wheel slots
+        clock: Monotonic time source in seconds
+
+    Raises:
+        TypeError: If network is not an IPv4Network or IPv6Network
+
+    Examples:
+        >>> pool = AddressPool(IPv4Network("10.0.0.0/30"))
+        >>> pool.allocate()
+        IPv4Address("10.0.0.1")
+        >>> pool.allocate()
+        IPv4Address("10.0.0.2")
+        >>> pool.free
+        0
+        >>> pool.release(IPv4Address("10.0.0.1"))
+        >>> pool.allocate()
+        IPv4Address("10.0.0.1")
+    """
+
+    def __init__(
+        self,
+        network: Network,
+        lease_resolution: float = 1.0,
+        wheel_size: int = 4096,
+        clock: cabc.Callable[[], float] = time.monotonic,
+    ) -> None:
+        if isinstance(network, IPv4Network):
+            self._address_cls: type[Address] = IPv4Address
+            self._range_cls: type[Range] = IPv4Range
+        elif isinstance(network, IPv6Network):
+            self._address_cls = IPv6Address
+            self._range_cls = IPv6Range
+        else:
+            raise TypeError(
+                f'Unable to process value "{network}" of type "{type(network)}"'
+            )
+
+        if lease_resolution <= 0 or wheel_size <= 0:
+            raise ValueError(
+                f'Invalid timing wheel "{lease_resolution=}", "{wheel_size=}",'
+                + " both must be positive"
+            )
+
+        self._network = network
+        self._start, prefixlen = network.as_tuple()
+        self._size = 1 << (network.netaddress.PREFIXLEN_MAX - prefixlen)
+
+        depth = 1
+        while 1 << (_WORD_SHIFT * depth) < self._size:
+            depth += 1
+        self._levels: list[dict[int, int]] = [{} for _ in range(depth)]
+        # bit per non-empty block of every upper level, level 0 is unused
+        self._used: list[dict[int, int]] = [{} for _ in range(depth)]
+
+        # top word is the only one that may have bits past the pool end,
+        # keep them set so they are never handed out
+        top_bits = -(-self._size >> (_WORD_SHIFT * (depth - 1)))
+        self._padding = _WORD_FULL ^ ((1 << top_bits) - 1)
+        if self._padding:
+            self._levels[-1][0] = self._padding
+
+        self._allocated = 0
+
+        self._resolution = lease_resolution
+        self._clock = clock
+        self._leases: dict[int, int] = {}
+        self._wheel: list[set[int]] = [set() for _ in range(wheel_size)]
+        self._tick = self._now()
+
+        first, last = self._host_bounds()
+        if first:
+            self._set_range(0, first)
+        if last < self._size - 1:
+            self._set_range(last + 1, self._size)
+
+    def _host_bounds(self) -> tuple[int, int]:
+        # offsets of the first and last host, same rules as network.hosts()
+        if isinstance(self._network, IPv4Network) and self._size > 2:
+            return 1, self._size - 2
+
+        return 0, self._size - 1
+
+    @property
+    def network(self) -> Network:
+        return self._network
+
+    @property
+    def size(self) -> int:
+        """Number of addresses in the pool, reserved ones included."""
+        return self._size
+
+    @property
+    def allocated(self) -> int:
+        """Number of allocated and reserved addresses."""
+        return self._allocated
+
+    @property
+    def free(self) -> int:
+        return self._size - self._allocated
+
+    def _offset(self, address: Address) -> int:
+        if not isinstance(address, self._address_cls):
+            raise TypeError(
+                f'Unable to process value "{address}" of type "{type(address)}"'
+            )
+
+        offset = int(address) - self._start
+        if not (0 <= offset < self._size):
+            raise ValueError(
+                f'Address "{address}" is not in pool network "{self._network}"'
+            )
+
+        return offset
+
+    def _is_set(self, offset: int) -> bool:
+        # the lowest word present on the path decides, a missing word is
+        # empty, or full if the bit above it is set
+        idx = offset
+        for words in self._levels:
+            word = words.get(idx >> _WORD_SHIFT)
+            if word is not None:
+                return bool(word >> (idx & _WORD_MASK) & 1)
+
+            idx >>= _WORD_SHIFT
+
+        return False
+
+    def _set(self, offset: int, level: int = 0) -> None:
+        idx = offset
+        for word_level, words in enumerate(self._levels[level:], level):
+            word_idx = idx >> _WORD_SHIFT
+            old = words.get(word_idx, 0)
+            word = old | 1 << (idx & _WORD_MASK)
+            words[word_idx] = word
+            if not old:
+                self._mark_used(word_level + 1, word_idx)
+            if word != _WORD_FULL:
+                break
+
+            idx = word_idx
+
+    def _clear(self, offset: int) -> None:
+        self._materialize(0, offset >> _WORD_SHIFT)
+        idx = offset
+        for level, words in enumerate(self._levels):
+            word_idx = idx >> _WORD_SHIFT
+            word = words.get(word_idx, 0)
+            full = word == _WORD_FULL
+            word &= ~(1 << (idx & _WORD_MASK))
+            if word:
+                words[word_idx] = word
+            else:
+                words.pop(word_idx, None)
+                if not level:
+                    self._unmark_used(1, word_idx)
+
+            if not full:
+                break
+
+            idx = word_idx
+
+    def _mark_used(self, level: int, idx: int) -> None:
+        # block idx of level got its first allocation
+        for used in self._used[level:]:
+            word_idx = idx >> _WORD_SHIFT
+            old = used.get(word_idx, 0)
+            bit = 1 << (idx & _WORD_MASK)
+            if old & bit:
+                return
+
+            used[word_idx] = old | bit
+            if old:
+                return
+
+            idx = word_idx
+
+    def _unmark_used(self, level: int, idx: int) -> None:
+        # block idx of level lost its last allocation
+        for used in self._used[level:]:
+            word_idx = idx >> _WORD_SHIFT
+            word = used.get(word_idx, 0) & ~(1 << (idx & _WORD_MASK))
+            if word:
+                used[word_idx] = word
+                return
+
+            used.pop(word_idx, None)
+            idx = word_idx
+
+    def _materialize(self, level: int, word_idx: int) -> None:
+        # make a word inside a full block explicit, pushing the full bit
+        # down as full words, before bits of it are changed
+        if word_idx in self._levels[level]:
+            return
+
+        for upper in range(level + 1, len(self._levels)):
+            bit = word_idx >> (_WORD_SHIFT * (upper - level - 1))
+            word = self._levels[upper].get(bit >> _WORD_SHIFT)
+            if word is None:
+                continue
+
+            if not word >> (bit & _WORD_MASK) & 1:
+                return
+
+            for lower in range(upper - 1, level - 1, -1):
+                idx = word_idx >> (_WORD_SHIFT * (lower - level))
+                self._levels[lower][idx] = _WORD_FULL
+                if lower:
+                    self._used[lower][idx] = _WORD_FULL
+            return
+
+    def _drop(self, level: int, idx: int) -> int:
+        # remove all words below bit idx of level, which is not set,
+        # and return the number of allocated addresses they held
+        word = self._levels[level - 1].pop(idx, 0)
+        if level == 1:
+            return word.bit_count()
+
+        unit = 1 << (_WORD_SHIFT * (level - 1))
+        used = self._used[level - 1].pop(idx, 0) | word
+        count = 0
+        while used:
+            bit = (used & -used).bit_length() - 1
+            used &= used - 1
+            dropped = self._drop(level - 1, idx << _WORD_SHIFT | bit)
+            count += unit if word >> bit & 1 else dropped
+
+        return count
+
+    def _set_bits(self, level: int, start: int, stop: int) -> None:
+        # set bits [start, stop) of a single word of level, a bit of an
+        # upper level marks its whole block allocated
+        word_idx = start >> _WORD_SHIFT
+        self._materialize(level, word_idx)
+        words = self._levels[level]
+        old = words.get(word_idx, 0)
+        mask = ((1 << (stop - start)) - 1) << (start & _WORD_MASK)
+        new = mask & ~old
+        if not new:
+            return
+
+        word = old | mask
+        words[word_idx] = word
+        if level:
+            unit = 1 << (_WORD_SHIFT * level)
+            bits = new
+            while bits:
+                bit = (bits & -bits).bit_length() - 1
+                bits &= bits - 1
+                dropped = self._drop(level, word_idx << _WORD_SHIFT | bit)
+                self._allocated += unit - dropped
+
+            used = self._used[level]
+            old_used = used.get(word_idx, 0)
+            used[word_idx] = old_used | new
+            if not old_used:
+                self._mark_used(level + 1, word_idx)
+        else:
+            self._allocated += new.bit_count()
+            if not old:
+                self._mark_used(1, word_idx)
+
+        if word == _WORD_FULL and level + 1 < len(self._levels):
+            self._set(word_idx, level=level + 1)
+
+    def _set_range(self, start: int, stop: int) -> None:
+        # unaligned edges are set at every level, aligned blocks between
+        # them move up as one bit of the next level, so O(log64 n) words
+        for level in range(len(self._levels)):
+            if start >> _WORD_SHIFT == (stop - 1) >> _WORD_SHIFT:
+                self._set_bits(level, start, stop)
+                return
+
+            head = start + (-start & _WORD_MASK)
+            tail = stop & ~_WORD_MASK
+            if start < head:
+                self._set_bits(level, start, head)
+            if tail < stop:
+                self._set_bits(level, tail, stop)
+
+            start, stop = head >> _WORD_SHIFT, tail >> _WORD_SHIFT
+            if start == stop:
+                return
+
+    def _find_free(self) -> int:
+        idx = 0
+        for words in reversed(self._levels):
+            word = words.get(idx, 0)
+            # lowest zero bit
+            bit = (~word & (word + 1)).bit_length() - 1
+            idx = (idx << _WORD_SHIFT) | bit
+
+        return idx
+
+    def _now(self) -> int:
+        return int(self._clock() / self._resolution)
+
+    def _lease(self, offset: int, lease: float) -> None:
+        if lease <= 0:
+            raise ValueError(f'Invalid "{lease=}", must be positive')
+
+        expires = self._now() + math.ceil(lease / self._resolution)
+        self._leases[offset] = expires
+        self._wheel[expires % len(self._wheel)].add(offset)
+
+    def _allocate(self, offset: int, lease: float | None) -> Address:
+        self._set(offset)
+        self._allocated += 1
+        if lease is not None:
+            self._lease(offset, lease)
+
+        return self._address_cls._from_int_unchecked(self._start + offset)
+
+    def allocate(self, lease: float | None = None) -> Address:
+        """
+        Allocate the lowest free address.
+
+        Args:
+            lease: Optional lease time in seconds, the address is released
+                   automatically once it expires
+
+        Raises:
+            ValueError: If there are no free addresses left
+        """
+        if self._leases:
+            self.expire()
+
+        if self._allocated == self._size:
+            raise ValueError(f'No free addresses left in "{self._network}"')
+
+        return self._allocate(self._find_free(), lease)
+
+    def allocate_specific(
+        self,
+        address: Address,
+        lease: float | None = None,
+    ) -> Address:
+        """
+        Allocate the given address.
+
+        Raises:
+            TypeError: If address family does not match the pool
+            ValueError: If address is outside the pool or already allocated
+        """
+        offset = self._offset(address)
+        if self._leases:
+            self.expire()
+
+        if self._is_set(offset):
+            raise ValueError(f'Address "{address}" is already allocated')
+
+        return self._allocate(offset, lease)
+
+    def release(self, address: Address) -> None:
+        """
+        Return an allocated or reserved address to the pool.
+
+        Raises:
+            TypeError: If address family does not match the pool
+            ValueError: If address is outside the pool or not allocated
+        """
+        offset = self._offset(address)
+        if not self._is_set(offset):
+            raise ValueError(f'Address "{address}" is not allocated')
+
+        self._clear(offset)
+        self._allocated -= 1
+        self._leases.pop(offset, None)
+
+    def reserve(self, item: Address | Network | Range) -> None:
+        """
+        Mark every address of an address, network or range as allocated.
+
+        Already allocated addresses stay allocated, their leases are dropped.
+        Aligned blocks are marked by upper level bits, so the cost is
+        O(log64 n) words plus the words of allocations inside the item.
+
+        Raises:
+            TypeError: If item family does not match the pool
+            ValueError: If item is not inside the pool network
+        """
+        if isinstance(item, (IPv4Network, IPv6Network)):
+            item = self._range_cls.from_network(item)  # pyright: ignore[reportArgumentType]
+
+        if isinstance(item, (IPv4Range, IPv6Range)):
+            first, last = self._offset(item.first), self._offset(item.last)
+        else:
+            first = last = self._offset(item)
+
+        for offset in [o for o in self._leases if first <= o <= last]:
+            del self._leases[offset]
+
+        self._set_range(first, last + 1)
+
+    def renew(self, address: Address, lease: float) -> None:
+        """
+        Set a new lease time for an allocated address.
+
+        Raises:
+            ValueError: If address is not allocated
+        """
+        offset = self._offset(address)
+        if not self._is_set(offset):
+            raise ValueError(f'Address "{address}" is not allocated')
+
+        self._lease(offset, lease)
+
+    def expire(self) -> list[Address]:
+        """
+        Release addresses with expired leases.
+
+        Only wheel slots passed since the previous call are visited.
+
+        Returns:
+            Released addresses
+        """
+        now = self._now()
+        released: list[Address] = []
+        wheel_size = len(self._wheel)
+        ticks = min(now - self._tick, wheel_size)
+        for tick in range(now - ticks + 1, now + 1):
+            slot = self._wheel[tick % wheel_size]
+            for offset in list(slot):
+                expires = self._leases.get(offset)
+                if expires is None or expires % wheel_size != tick % wheel_size:
+                    # released or renewed into another slot
+                    slot.discard(offset)
+                elif expires <= now:
+                    slot.discard(offset)
+                    del self._leases[offset]
+                    self._clear(offset)
+                    self._allocated -= 1
+                    released.append(
+                        self._address_cls._from_int_unchecked(self._start + offset)
+                    )
+
+        self._tick = now
+        return released
+
+    def is_allocated(self, address: Address) -> bool:
+        return self._is_set(self._offset(address))
+
+    def __contains__(self, address: Address) -> bool:
+        return self.is_allocated(address)
+
+    def __len__(self) -> int:
+        return self._allocated
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}("{self._network}",'
+            + f" allocated={self._allocated}/{self._size})"
+        )
+
+    def snapshot(self) -> bytes:
+        """
+        Serialize allocation state and leases to bytes.
+
+        Lease expiry is stored as time left, so a snapshot can be restored
+        by another process with its own clock.
+        """
+        start, prefixlen = self._network.as_tuple()
+        parts = [
+            _SNAPSHOT_HEADER.pack(
+                _SNAPSHOT_MAGIC,
+                _SNAPSHOT_VERSION,
+                self._network.netaddress.PREFIXLEN_MAX,
+                prefixlen,
+                start.to_bytes(16, "big"),
+            ),
+            _SNAPSHOT_COUNT.pack(sum(map(len, self._levels))),
+        ]
+        parts += (
+            _SNAPSHOT_WORD.pack(level, idx.to_bytes(16, "big"), word)
+            for level, words in enumerate(self._levels)
+            for idx, word in sorted(words.items())
+        )
+
+        now = self._clock()
+        parts.append(_SNAPSHOT_COUNT.pack(len(self._leases)))
+        parts += (
+            _SNAPSHOT_LEASE.pack(
+                offset.to_bytes(16, "big"),
+                max(expires * self._resolution - now, 0.0),
+            )
+            for offset, expires in sorted(self._leases.items())
+        )
+        return b"".join(parts)
+
+    @classmethod
+    def restore(
+        cls,
+        data: bytes,
+        lease_resolution: float = 1.0,
+        wheel_size: int = 4096,
+        clock: cabc.Callable[[], float] = time.monotonic,
+    ) -> "AddressPool":
+        """
+        Create a pool from snapshot() output.
+
+        Raises:
+            TypeError: If data is not bytes
+            ValueError: If data is not a valid snapshot
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError(
+                f'Provided invalid value "{data=}" of type "{type(data)}",'
+                + " bytes expected"
+            )
+
+        bits, prefixlen, start, words, leases = _parse_snapshot(data)
+        if bits == c.IPV4.PREFIXLEN_MAX:
+            network: Network = IPv4Network.from_int(start, prefixlen)
+        elif bits == c.IPV6.PREFIXLEN_MAX:
+            network = IPv6Network.from_int(start, prefixlen)
+        else:
+            raise ValueError(f"Invalid pool snapshot: unknown address size {bits}")
+
+        pool = cls(network, lease_resolution, wheel_size, clock)
+        pool._load(words)
+        for lease_offset, left in leases:
+            if pool._is_set(lease_offset):
+                pool._lease(lease_offset, max(left, pool._resolution))
+
+        return pool
+
+    def _load(self, words: dict[tuple[int, int], int]) -> None:
+        for level in (*self._levels, *self._used):
+            level.clear()
+
+        top = len(self._levels) - 1
+        for (level, word_idx), word in words.items():
+            if level > top or word_idx > self._last_word(level):
+                raise ValueError("Invalid pool snapshot: word out of pool range")
+
+            if word:
+                self._levels[level][word_idx] = word
+
+        if self._padding:
+            self._levels[top][0] = self._levels[top].get(0, 0) | self._padding
+
+        self._allocated = 0
+        for level, words in enumerate(self._levels):
+            for word_idx, word in words.items():
+                if level == top:
+                    word &= ~self._padding
+                self._allocated += self._word_allocated(level, word_idx, word)
+
+            if level:
+                self._rebuild_used(level)
+
+    def _last_word(self, level: int) -> int:
+        return (self._size - 1) >> (_WORD_SHIFT * (level + 1))
+
+    def _word_allocated(self, level: int, word_idx: int, word: int) -> int:
+        # addresses of set bits without words below, the others are
+        # counted by their words
+        if not level:
+            return word.bit_count()
+
+        below = self._levels[level - 1]
+        count = 0
+        while word:
+            bit = (word & -word).bit_length() - 1
+            word &= word - 1
+            if word_idx << _WORD_SHIFT | bit not in below:
+                count += 1 << (_WORD_SHIFT * level)
+
+        return count
+
+    def _rebuild_used(self, level: int) -> None:
+        # a block is non-empty if it is full or has a word or a non-empty
+        # block below
+        used = self._used[level]
+        top = len(self._levels) - 1
+        for word_idx, word in self._levels[level].items():
+            if level == top:
+                word &= ~self._padding
+            if word:
+                used[word_idx] = word
+
+        for idx in (*self._levels[level - 1], *self._used[level - 1]):
+            word_idx = idx >> _WORD_SHIFT
+            used[word_idx] = used.get(word_idx, 0) | 1 << (idx & _WORD_MASK)
+
+
+class PrefixAllocator:
+    """
+    Buddy allocator of subnets from an IPv4 or IPv6 network.
+
+    Free blocks are kept in per-prefixlen free lists. Allocation takes the
+    lowest free block of the requested size, or splits the lowest block of
+    the nearest larger size down, pushing the unused halves (buddies) to the
+    free lists. Freed blocks are merged with their free buddies all the way
+    up. Both take O(prefixlen) steps, the free list of a level is a set for
+    membership and a heap for lowest-address-first order.
+
+    Args:
+        network: Network to allocate subnets from
+
+    Raises:
+        TypeError: If network is not an IPv4Network or IPv6Network
+
+    Examples:
+        >>> allocator = PrefixAllocator(IPv6Network("2001:db8::/32"))
+        >>> allocator.allocate(56)
+        IPv6Network("2001:db8::/56")
+        >>> allocator.allocate(60)
+        IPv6Network("2001:db8:0:100::/60")
+        >>> allocator.allocate(56)
+        IPv6Network("2001:db8:0:200::/56")
+    """
+
+    def __init__(self, network: Network) -> None:
+        if isinstance(network, IPv4Network):
+            self._network_cls: type[Network] = IPv4Network
+        elif isinstance(network, IPv6Network):
+            self._network_cls = IPv6Network
+        else:
+            raise TypeError(
+                f'Unable to process value "{network}" of type "{type(network)}"'
+            )
+
+        self._network = network
+        self._start, self._prefixlen = network.as_tuple()
+        self._width = network.netaddress.PREFIXLEN_MAX.value
+        self._free: dict[int, set[int]] = {}
+        self._heaps: dict[int, list[int]] = {}
+        self._allocated: dict[int, int] = {}
+        self._push(self._start, self._prefixlen)
+
+    @property
+    def network(self) -> Network:
+        return self._network
+
+    @property
+    def allocated(self) -> int:
+        """Number of allocated addresses."""
+        return sum(
+            1 << (self._width - prefixlen) for prefixlen in self._allocated.values()
+        )
+
+    @property
+    def utilization(self) -> float:
+        """Share of allocated addresses, from 0.0 to 1.0."""
+        return self.allocated / (1 << (self._width - self._prefixlen))
+
+    def _push(self, addr: int, prefixlen: int) -> None:
+        self._free.setdefault(prefixlen, set()).add(addr)
+        heapq.heappush(self._heaps.setdefault(prefixlen, []), addr)
+
+    def _discard(self, addr: int, prefixlen: int) -> None:
+        # heap entries are dropped lazily on pop
+        free = self._free[prefixlen]
+        free.discard(addr)
+        if not free:
+            del self._free[prefixlen]
+            del self._heaps[prefixlen]
+
+    def _pop(self, prefixlen: int) -> int:
+        free, heap = self._free[prefixlen], self._heaps[prefixlen]
+        addr = heapq.heappop(heap)
+        while addr not in free:
+            addr = heapq.heappop(heap)
+
+        self._discard(addr, prefixlen)
+        return addr
+
+    def _split(self, addr: int, prefixlen: int, target: int, wanted: int) -> None:
+        # split block down to target prefixlen along the path to wanted,
+        # the other half of every split becomes free
+        while prefixlen < target:
+            prefixlen += 1
+            half = 1 << (self._width - prefixlen)
+            if wanted & half:
+                self._push(addr, prefixlen)
+                addr |= half
+            else:
+                self._push(addr | half, prefixlen)
+
+    def _check_prefixlen(self, prefixlen: int) -> None:
+        if not isinstance(prefixlen, int):
+            raise TypeError(
+                f'Provided invalid value "{prefixlen=}" of type "{type(prefixlen)}",'
+                + " int expected"
+            )
+
+        if not (self._prefixlen <= prefixlen <= self._width):
+            raise ValueError(
+                f'Invalid "{prefixlen=}", must be in range'
+                + f" {self._prefixlen}-{self._width}"
+            )
+
+    def allocate(self, prefixlen: int) -> Network:
+        """
+        Allocate a subnet of the given prefix length.
+
+        Free blocks of the same size are used first, so larger blocks are
+        split only when needed.
+
+        Raises:
+            TypeError: If prefixlen is not an int
+            ValueError: If prefixlen is out of the network range or no
+                        free space is left
+        """
+        self._check_prefixlen(prefixlen)
+
+        level = prefixlen
+        while level not in self._free:
+            if level == self._prefixlen:
+                raise ValueError(
+                    f'No free /{prefixlen} subnets left in "{self._network}"'
+                )
+            level -= 1
+
+        addr = self._pop(level)
+        self._split(addr, level, prefixlen, addr)
+        self._allocated[addr] = prefixlen
+        return self._network_cls._from_int_unchecked(addr, prefixlen)
+
+    def allocate_specific(self, network: Network) -> Network:
+        """
+        Allocate the given subnet.
+
+        Raises:
+            TypeError: If network family does not match the allocator
+            ValueError: If network is not inside the allocator network or
+                        overlaps an allocated subnet
+        """
+        addr, prefixlen = self._subnet(network)
+        for level in range(prefixlen, self._prefixlen - 1, -1):
+            block = addr & ~((1 << (self._width - level)) - 1)
+            if block in self._free.get(level, ()):
+                self._discard(block, level)
+                self._split(block, level, prefixlen, addr)
+                self._allocated[addr] = prefixlen
+                return network
+
+        raise ValueError(f'Subnet "{network}" overlaps allocated subnets')
+
+    def free(self, network: Network) -> None:
+        """
+        Return an allocated subnet, merging it with free buddies.
+
+        Raises:
+            TypeError: If network family does not match the allocator
+            ValueError: If network is not an allocated subnet
+        """
+        addr, prefixlen = self._subnet(network)
+        if self._allocated.get(addr) != prefixlen:
+            raise ValueError(f'Subnet "{network}" is not allocated')
+
+        del self._allocated[addr]
+        while prefixlen > self._prefixlen:
+            size = 1 << (self._width - prefixlen)
+            if addr ^ size not in self._free.get(prefixlen, ()):
+                break
+
+            self._discard(addr ^ size, prefixlen)
+            addr &= ~size
+            prefixlen -= 1
+
+        self._push(addr, prefixlen)
+
+    def _subnet(self, network: Network) -> tuple[int, int]:
+        if not isinstance(network, self._network_cls):
+            raise TypeError(
+                f'Unable to process value "{network}" of type "{type(network)}"'
+            )
+
+        # contains_subnet() is strict, the whole network is a valid block too
+        if not (
+            network == self._network or self._network.contains_subnet(network)  # pyright: ignore[reportArgumentType]
+        ):
+            raise ValueError(
+                f'Subnet "{network}" is not in allocator network "{self._network}"'
+            )
+
+        return network.as_tuple()
+
+    def is_allocated(self, network: Network) -> bool:
+        """Whether network is exactly one of the allocated subnets."""
+        addr, prefixlen = self._subnet(network)
+        return self._allocated.get(addr) == prefixlen
+
+    def stats(self) -> dict[int, tuple[int, int]]:
+        """
+        Utilization per level.
+
+        Returns:
+            Mapping of prefixlen to (allocated, free) block counts,
+            only levels having any blocks are included
+        """
+        result: dict[int, list[int]] = {}
+        for prefixlen in self._allocated.values():
+            result.setdefault(prefixlen, [0, 0])[0] += 1
+        for prefixlen, free in self._free.items():
+            result.setdefault(prefixlen, [0, 0])[1] += len(free)
+
+        return {
+            prefixlen: (allocated, free)
+            for prefixlen, (allocated, free) in sorted(result.items())
+        }
+
+    def __iter__(self) -> cabc.Iterator[Network]:
+        for addr, prefixlen in sorted(self._allocated.items()):
+            yield self._network_cls._from_int_unchecked(addr, prefixlen)
+
+    def __contains__(self, network: Network) -> bool:
+        return self.is_allocated(network)
+
+    def __len__(self) -> int:
+        return len(self._allocated)
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}("{self._network}",'
+            + f" allocated={len(self._allocated)})"
+        )
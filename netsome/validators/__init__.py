@@ -0,0 +1,6 @@
+from netsome.validators.bulk import validate_many
+
+
+__all__ = [
+    "validate_many",
+]
@@ -28,6 +28,20 @@ def validate_asplain(
         raise ValueError(msg)
 
 
+def validate_asplain_str(string: str) -> None:
+    if not isinstance(string, str):
+        raise TypeError(
+            f'Provided invalid asplain value "{string=}" of type "{type(string)}", '
+            + "str expected"
+        )
+
+    if convs.parse_asplain(string) is None:
+        raise ValueError(
+            f'Invalid asplain value "{string=}", must be a decimal number in range '
+            + c.DELIMITERS.DASH.join_as_str(c.BGP.ASN_MIN, c.BGP.ASN_MAX)
+        )
+
+
 def validate_asdotplus(string: str) -> None:
     if not isinstance(string, str):
         raise TypeError(
@@ -40,7 +54,13 @@ def validate_asdotplus(string: str) -> None:
             f'Invalid asdot+ format "{string=}", must be HIGH_ORDER.LOW_ORDER'
         )
 
-    validate_asplain(convs.asdotplus_to_asplain(string))
+    # each order is a 16-bit decimal number
+    if convs.parse_asdotplus(string) is None:
+        raise ValueError(
+            f'Invalid asdot+ value "{string=}", HIGH_ORDER and LOW_ORDER must be '
+            + "decimal numbers in range "
+            + c.DELIMITERS.DASH.join_as_str(c.BGP.ASN_MIN, c.BGP.ASN_ORDER_MAX)
+        )
 
 
 def validate_asdot(string: str) -> None:
@@ -53,10 +73,10 @@ def validate_asdot(string: str) -> None:
     if c.DELIMITERS.DOT in string:
         validate_asdotplus(string)
     else:
+        validate_asplain_str(string)
         validate_asplain(int(string), max_len=c.BGP.ASN_ORDER_MAX)
 
 
-# TODO(kuderr): refactor
 def validate_community(string: str) -> None:
     if not isinstance(string, str):
         raise TypeError(
@@ -64,22 +84,14 @@ def validate_community(string: str) -> None:
             + "str expected"
         )
 
-    asn, value, *unexpected = string.split(c.DELIMITERS.COLON)
-
-    if unexpected:
+    if string.count(c.DELIMITERS.COLON) != 1:
         msg = "Invalid Community format, delimiter must be colon – ASN:VALUE"
         raise ValueError(msg)
 
-    asn, value = int(asn), int(value)
-    if not (c.BGP.ASN_MIN <= asn <= c.BGP.ASN_ORDER_MAX):
-        msg = (
-            "Invalid ASN in Community. Must be in range "
-            + c.DELIMITERS.DASH.join_as_str(c.BGP.ASN_MIN, c.BGP.ASN_ORDER_MAX)
-        )
-        raise ValueError(msg)
-    if not (c.BGP.ASN_MIN <= value <= c.BGP.ASN_ORDER_MAX):
+    # ASN and VALUE are 16-bit decimal numbers
+    if convs.parse_community(string) is None:
         msg = (
-            "Invalid VALUE number in Community. Must be in range "
+            "Invalid ASN or VALUE in Community. Must be decimal numbers in range "
             + c.DELIMITERS.DASH.join_as_str(c.BGP.ASN_MIN, c.BGP.ASN_ORDER_MAX)
         )
         raise ValueError(msg)
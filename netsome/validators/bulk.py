@@ -0,0 +1,231 @@
+# pyright: strict, reportUnnecessaryIsInstance=false, reportUnreachable=false
+
+import collections
+import collections.abc as cabc
+import concurrent.futures
+import itertools
+import typing as t
+
+from netsome import constants as c
+from netsome._converters import ipv4 as ipv4_convs
+from netsome._converters import ipv6 as ipv6_convs
+from netsome.validators import bgp
+from netsome.validators import ipv4
+from netsome.validators import ipv6
+from netsome.validators import mac
+from netsome.validators import vlans
+
+
+Report: t.TypeAlias = tuple[int, t.Any, c.VALIDATION_ERRORS | None]
+_Step: t.TypeAlias = tuple[cabc.Callable[[t.Any], None], c.VALIDATION_ERRORS]
+
+_MAC_DELIMITERS = (c.DELIMITERS.COLON, c.DELIMITERS.DASH, c.DELIMITERS.DOT)
+
+
+def _validate_decimal(value: t.Any) -> None:
+    if isinstance(value, str) and not (value.isascii() and value.isdigit()):
+        raise ValueError(f'Provided value "{value}" is not a decimal number')
+
+
+def _validate_asn_format(value: t.Any) -> None:
+    if isinstance(value, str):
+        for part in value.split(c.DELIMITERS.DOT, maxsplit=1):
+            _validate_decimal(part)
+
+
+def _validate_asn_range(value: t.Any) -> None:
+    if not isinstance(value, str):
+        bgp.validate_asplain(value)
+    elif c.DELIMITERS.DOT in value:
+        bgp.validate_asdotplus(value)
+    else:
+        bgp.validate_asplain_str(value)
+
+
+def _validate_vid_range(value: t.Any) -> None:
+    if isinstance(value, str):
+        vlans.validate_vid_str(value)
+    else:
+        vlans.validate_vid(value)
+
+
+def _validate_mac(value: t.Any) -> None:
+    if isinstance(value, int):
+        mac.validate_int(value)
+        return
+
+    if isinstance(value, str):
+        for delimiter in _MAC_DELIMITERS:
+            if delimiter in value:
+                value = value.replace(delimiter, "")
+                break
+
+    mac.validate_hex_string(value, 12)
+
+
+def _validate_ipv4_host_bits(value: str) -> None:
+    parsed = ipv4_convs.parse_cidr(value)
+    if parsed is not None:
+        ipv4.validate_network_int(*parsed)
+
+
+def _validate_ipv6_host_bits(value: str) -> None:
+    parsed = ipv6_convs.parse_cidr(value)
+    if parsed is not None:
+        ipv6.validate_network_int(*parsed)
+
+
+def _validate_interface(value: t.Any) -> None:
+    if not isinstance(value, str):
+        raise TypeError(
+            f'Provided invalid value "{value=}" of type "{type(value)}", str expected'
+        )
+
+    if c.IFACE_PATTERN.match(value) is None:
+        raise ValueError(f'Unable to parse interface "{value}"')
+
+
+# validators run in order, the first failing one gives the error code,
+# TypeError of any step is reported as a type error
+_STEPS: dict[c.VALIDATION_KINDS, tuple[_Step, ...]] = {
+    c.VALIDATION_KINDS.IPV4_ADDRESS: (
+        (ipv4.validate_address_str, c.VALIDATION_ERRORS.FORMAT),
+    ),
+    c.VALIDATION_KINDS.IPV4_NETWORK: (
+        (ipv4.validate_cidr, c.VALIDATION_ERRORS.FORMAT),
+        (_validate_ipv4_host_bits, c.VALIDATION_ERRORS.HOST_BITS),
+    ),
+    c.VALIDATION_KINDS.IPV6_ADDRESS: (
+        (ipv6.validate_address_str, c.VALIDATION_ERRORS.FORMAT),
+    ),
+    c.VALIDATION_KINDS.IPV6_NETWORK: (
+        (ipv6.validate_cidr, c.VALIDATION_ERRORS.FORMAT),
+        (_validate_ipv6_host_bits, c.VALIDATION_ERRORS.HOST_BITS),
+    ),
+    c.VALIDATION_KINDS.MAC: ((_validate_mac, c.VALIDATION_ERRORS.FORMAT),),
+    c.VALIDATION_KINDS.VLAN: (
+        (_validate_decimal, c.VALIDATION_ERRORS.FORMAT),
+        (_validate_vid_range, c.VALIDATION_ERRORS.RANGE),
+    ),
+    c.VALIDATION_KINDS.ASN: (
+        (_validate_asn_format, c.VALIDATION_ERRORS.FORMAT),
+        (_validate_asn_range, c.VALIDATION_ERRORS.RANGE),
+    ),
+    c.VALIDATION_KINDS.INTERFACE: ((_validate_interface, c.VALIDATION_ERRORS.FORMAT),),
+}
+
+
+def _check(steps: tuple[_Step, ...], value: t.Any) -> c.VALIDATION_ERRORS | None:
+    for validate, code in steps:
+        try:
+            validate(value)
+        except TypeError:
+            return c.VALIDATION_ERRORS.TYPE
+        except ValueError:
+            return code
+
+    return None
+
+
+def _validate_serial(
+    kind: c.VALIDATION_KINDS,
+    values: cabc.Iterable[t.Any],
+    errors_only: bool,
+    start: int = 0,
+) -> cabc.Generator[Report, None, None]:
+    steps = _STEPS[kind]
+    for index, value in enumerate(values, start):
+        code = _check(steps, value)
+        if code is not None or not errors_only:
+            yield index, value, code
+
+
+def _validate_chunk(
+    kind: c.VALIDATION_KINDS,
+    values: list[t.Any],
+    errors_only: bool,
+    start: int,
+) -> list[Report]:
+    # runs in a worker process
+    return list(_validate_serial(kind, values, errors_only, start))
+
+
+def _validate_parallel(
+    kind: c.VALIDATION_KINDS,
+    values: cabc.Iterable[t.Any],
+    errors_only: bool,
+    workers: int,
+    chunksize: int,
+) -> cabc.Generator[Report, None, None]:
+    iterator = iter(values)
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        # bounded number of chunks in flight keeps input streaming
+        pending: collections.deque[concurrent.futures.Future[list[Report]]]
+        pending = collections.deque()
+        start = 0
+        while True:
+            while len(pending) < workers * 2:
+                chunk = list(itertools.islice(iterator, chunksize))
+                if not chunk:
+                    break
+
+                pending.append(
+                    executor.submit(_validate_chunk, kind, chunk, errors_only, start)
+                )
+                start += len(chunk)
+
+            if not pending:
+                return
+
+            yield from pending.popleft().result()
+
+
+def validate_many(
+    kind: c.VALIDATION_KINDS | str,
+    values: cabc.Iterable[t.Any],
+    *,
+    errors_only: bool = True,
+    workers: int | None = None,
+    chunksize: int = 10_000,
+) -> cabc.Generator[Report, None, None]:
+    """
+    Validate a stream of values of one kind and report every invalid row.
+
+    Values are checked with the validators of this package, so a row is
+    valid exactly when the type accepts it: the constructor for addresses,
+    networks and interfaces, parse() for mac and asn, VID() or
+    VID.from_str() for vlan. A failing row does not stop the run, it is
+    reported with a structured error code instead of a formatted message.
+    Input is consumed lazily and reports are yielded in input order.
+
+    Args:
+        kind: What values are, e.g. c.VALIDATION_KINDS.IPV4_NETWORK or "vlan"
+        values: Iterable of values to validate
+        errors_only: Report only invalid rows, otherwise every row
+        workers: Number of worker processes, values are validated in the
+            current process if not set; values must be picklable
+        chunksize: Number of values sent to a worker at once
+
+    Returns:
+        Generator of (index, value, error code) tuples, error code is None
+        for valid rows
+
+    Raises:
+        ValueError: If kind is unknown or workers/chunksize is not positive
+
+    Examples:
+        >>> list(validate_many("ipv4_network", ["10.0.0.0/8", "10.0.0.1/8", "foo"]))
+        [(1, '10.0.0.1/8', <VALIDATION_ERRORS.HOST_BITS: 'host_bits'>),
+         (2, 'foo', <VALIDATION_ERRORS.FORMAT: 'format'>)]
+    """
+    kind = c.VALIDATION_KINDS(kind)
+    if chunksize < 1:
+        raise ValueError(f'Provided invalid value "{chunksize=}", must be positive')
+
+    if workers is not None and workers < 1:
+        raise ValueError(f'Provided invalid value "{workers=}", must be positive')
+
+    if workers is not None and workers > 1:
+        return _validate_parallel(kind, values, errors_only, workers, chunksize)
+
+    return _validate_serial(kind, values, errors_only)
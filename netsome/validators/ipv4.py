@@ -1,5 +1,6 @@
 # pyright: strict, reportUnnecessaryIsInstance=false, reportUnreachable=false
 from netsome import constants as c
+from netsome._converters import ipv4 as convs
 
 
 def validate_cidr(string: str) -> None:
@@ -8,12 +9,14 @@ def validate_cidr(string: str) -> None:
             f'Provided invalid value "{string=}" of type "{type(string)}", str expected'
         )
 
+    if convs.parse_cidr(string) is not None:
+        return
+
     addr, prefixlen = string.split(c.DELIMITERS.SLASH, maxsplit=1)
     validate_address_str(addr)
     validate_prefixlen_str(prefixlen)
 
 
-# TODO: regexp?
 def validate_address_str(string: str) -> None:
     if not isinstance(string, str):
         raise TypeError(
@@ -21,6 +24,9 @@ def validate_address_str(string: str) -> None:
             + " str expected"
         )
 
+    if convs.parse_address(string) is not None:
+        return
+
     octets = string.split(c.DELIMITERS.DOT)
     if len(octets) != c.IPV4.OCTETS_COUNT:
         raise ValueError(
@@ -107,6 +113,11 @@ def validate_prefixlen_int(
 
 
 def validate_network_int(address: int, prefixlen: int) -> None:
-    netmask = c.IPV4.ADDRESS_MAX ^ (c.IPV4.ADDRESS_MAX >> prefixlen)
-    if address & netmask != address:
+    if not (c.IPV4.PREFIXLEN_MIN <= prefixlen <= c.IPV4.PREFIXLEN_MAX):
+        raise ValueError(
+            f'Value "{prefixlen}" must be in range '
+            + f"{c.IPV4.PREFIXLEN_MIN}-{c.IPV4.PREFIXLEN_MAX}"
+        )
+
+    if address & convs.HOSTMASKS[prefixlen]:
         raise ValueError("Host bits set")
@@ -1,5 +1,6 @@
 # pyright: strict, reportUnnecessaryIsInstance=false, reportUnreachable=false
 from netsome import constants as c
+from netsome._converters import ipv6 as convs
 
 
 def validate_cidr(string: str) -> None:
@@ -9,6 +10,9 @@ def validate_cidr(string: str) -> None:
             f'Provided invalid value "{string=}" of type "{type(string)}", str expected'
         )
 
+    if convs.parse_cidr(string) is not None:
+        return
+
     parts = string.split(c.DELIMITERS.SLASH)
     if len(parts) != 2:
         raise ValueError(
@@ -18,6 +22,7 @@ def validate_cidr(string: str) -> None:
     addr, prefixlen = parts
     validate_address_str(addr)
     validate_prefixlen_str(prefixlen)
+    raise ValueError(f'Provided value "{string}" is invalid IPv6 CIDR')
 
 
 def validate_address_str(string: str) -> None:
@@ -30,23 +35,26 @@ def validate_address_str(string: str) -> None:
     if not string:
         raise ValueError("IPv6 address cannot be empty")
 
-    string = string.lower()
+    if convs.parse_address(string) is not None:
+        return
 
-    # Check for IPv4-mapped IPv6 addresses
+    # slow path only to find out a detailed error
     if "." in string:
-        _validate_ipv4_mapped_format(string)
-        return
+        _validate_embedded_ipv4_format(string)
+    else:
+        _validate_regular_ipv6_format(string)
 
-    # Validate regular IPv6 format
-    _validate_regular_ipv6_format(string)
+    raise ValueError(f'Provided value "{string}" is invalid IPv6 address')
 
 
-def _validate_ipv4_mapped_format(string: str) -> None:
-    """Validate IPv4-mapped IPv6 address format."""
-    if not string.startswith("::ffff:"):
-        raise ValueError(f"Invalid IPv4-mapped IPv6 format: {string}")
-    ipv4_part = string[7:]
+def _validate_embedded_ipv4_format(string: str) -> None:
+    """Validate IPv6 address with embedded IPv4 address in the last 32 bits."""
+    head, _, ipv4_part = string.rpartition(":")
+    if not head:
+        raise ValueError(f"Invalid embedded IPv4 IPv6 format: {string}")
+
     _validate_ipv4_in_ipv6(ipv4_part)
+    _validate_regular_ipv6_format(f"{head}:0:0")
 
 
 def _validate_regular_ipv6_format(string: str) -> None:
@@ -180,22 +188,18 @@ def validate_prefixlen_int(
 
 def validate_network_int(address: int, prefixlen: int) -> None:
     """Validate that network address has no host bits set."""
-    if prefixlen == 0:
-        return  # All bits are network bits
-
-    host_bits = c.IPV6.PREFIXLEN_MAX - prefixlen
-    if host_bits == 0:
-        return  # No host bits to check
-
-    # Create mask with host bits set
-    host_mask = (1 << host_bits) - 1
+    if not (c.IPV6.PREFIXLEN_MIN <= prefixlen <= c.IPV6.PREFIXLEN_MAX):
+        raise ValueError(
+            f'Value "{prefixlen}" must be in range '
+            + f"{c.IPV6.PREFIXLEN_MIN}-{c.IPV6.PREFIXLEN_MAX}"
+        )
 
-    if address & host_mask != 0:
+    if address & convs.HOSTMASKS[prefixlen]:
         raise ValueError("Host bits set in network address")
 
 
 def _validate_ipv4_in_ipv6(ipv4_str: str) -> None:
-    """Validate IPv4 part of IPv4-mapped IPv6 address."""
+    """Validate IPv4 part of IPv6 address with embedded IPv4."""
     octets = ipv4_str.split(".")
     if len(octets) != 4:
         raise ValueError(f"Invalid IPv4 format in IPv6: {ipv4_str}")
@@ -13,3 +13,15 @@ def validate_vid(vid: int) -> None:
         raise ValueError(
             f'Value "{vid}" must be in range {c.VLAN.VID_MIN}-{c.VLAN.VID_MAX}'
         )
+
+
+def validate_vid_str(string: str) -> None:
+    if not isinstance(string, str):
+        raise TypeError(
+            f'Provided invalid value "{string}" of type "{type(string)}", str expected'
+        )
+
+    if not (string.isascii() and string.isdigit()):
+        raise ValueError(f'Value "{string}" must be a decimal number')
+
+    validate_vid(int(string))
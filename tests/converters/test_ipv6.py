@@ -1,3 +1,6 @@
+import ipaddress
+import random
+
 import pytest
 
 from netsome import constants as c
@@ -32,7 +35,7 @@ class TestAddressToInt:
             "2001:db8::12345",  # Group too long
             "2001:db8:1:2:3:4:5:6:7:8:9",  # Too many groups
             "::ffff:256.1.1.1",  # Invalid IPv4 in mapped
-            "::192.0.2.1",  # IPv4 format without ffff prefix
+            "192.0.2.1",  # IPv4 address without IPv6 part
         ),
     )
     def test_value_error(self, test_input):
@@ -166,6 +169,10 @@ class TestIpv4MappedAddresses:
             ("::ffff:192.0.2.1", 281473902969345),
             ("::ffff:127.0.0.1", 281472812449793),
             ("::ffff:0.0.0.0", 281470681743360),
+            ("::192.0.2.1", 0xC0000201),
+            ("::1:192.0.2.1", 0x1C0000201),
+            ("64:ff9b::192.0.2.1", 0x64FF9B0000000000000000C0000201),
+            ("1:2:3:4:5:6:1.2.3.4", 0x00010002000300040005000601020304),
         ),
     )
     def test_ipv4_mapped_conversion(self, ipv6_addr, expected_int):
@@ -175,11 +182,99 @@ class TestIpv4MappedAddresses:
     @pytest.mark.parametrize(
         "test_input",
         (
-            "::192.0.2.1",  # Missing ffff
-            "::1:192.0.2.1",  # Wrong prefix
             "::ffff:256.0.0.1",  # Invalid IPv4
+            "::ffff:1.2.3",  # Short IPv4
+            "1:2:3:4:5:6:7:1.2.3.4",  # Too many groups
+            "1.2.3.4::",  # IPv4 not in the last 32 bits
+            ":1.2.3.4",
         ),
     )
     def test_ipv4_mapped_errors(self, test_input):
         with pytest.raises(ValueError):
             convs.address_to_int(test_input)
+
+
+@pytest.mark.parametrize(
+    ("prefixlen", "netmask"),
+    (
+        (0, 0),
+        (32, 0xFFFFFFFF << 96),
+        (64, 0xFFFFFFFFFFFFFFFF << 64),
+        (128, c.IPV6.ADDRESS_MAX),
+    ),
+)
+def test_masks(prefixlen, netmask):
+    assert len(convs.NETMASKS) == len(convs.HOSTMASKS) == 129
+    assert convs.NETMASKS[prefixlen] == netmask
+    assert convs.HOSTMASKS[prefixlen] == netmask ^ c.IPV6.ADDRESS_MAX
+
+
+class TestParse:
+    @pytest.mark.parametrize(
+        ("test_input", "expected"),
+        (
+            ("::", 0),
+            ("::1", 1),
+            ("1::", 1 << 112),
+            ("1:2:3:4:5:6:7:8", 0x00010002000300040005000600070008),
+            ("1:2:3::5:6:7:8", 0x00010002000300000005000600070008),
+            ("FE80::aB", 0xFE8000000000000000000000000000AB),
+            (":::", None),
+            (":1::", None),
+            ("1::2::3", None),
+            ("1:2:3:4:5:6:7:8::", None),
+            ("1:2:3:4:5:6:7", None),
+            ("12345::", None),
+            ("0x1::", None),
+            ("+1::", None),
+            ("f_f::", None),
+            (" ::1", None),
+            ("", None),
+        ),
+    )
+    def test_parse_address(self, test_input, expected):
+        assert convs.parse_address(test_input) == expected
+
+    @pytest.mark.parametrize(
+        ("test_input", "expected"),
+        (
+            ("2001:db8::/32", (0x20010DB8 << 96, 32)),
+            ("::/0", (0, 0)),
+            ("::1/128", (1, 128)),
+            ("::1/129", None),
+            ("::1/", None),
+            ("::1", None),
+        ),
+    )
+    def test_parse_cidr(self, test_input, expected):
+        assert convs.parse_cidr(test_input) == expected
+
+
+@pytest.mark.parametrize(
+    ("number", "expected"),
+    (
+        (0x20010DB8000000010000000000000001, "2001:db8:0:1::1"),
+        (0x20010DB8000000000001000000000001, "2001:db8::1:0:0:1"),
+        (0x00010000000000010000000000000000, "1:0:0:1::"),
+        (0x00010000000100000001000000010000, "1:0:1:0:1:0:1:0"),
+        (0x20010DB8000000000000000000000000, "2001:db8::"),
+        (0x0001FFFFFFFFFFFFFFFFFFFFFFFFFFFF, "1:ffff:ffff:ffff:ffff:ffff:ffff:ffff"),
+    ),
+)
+def test_int_to_address_rfc5952(number, expected):
+    assert convs.int_to_address(number) == expected
+
+
+def test_int_to_address_matches_stdlib():
+    rnd = random.Random(0)
+    for _ in range(2000):
+        number = 0
+        for _ in range(c.IPV6.GROUPS_COUNT):
+            group = rnd.choice((0, 0, 0, 1, rnd.getrandbits(16)))
+            number = number << 16 | group
+
+        expected = ipaddress.IPv6Address(number).exploded
+        assert convs.int_to_expanded(number) == expected
+        assert convs.address_to_int(convs.int_to_address(number)) == number
+        if number >> 32 != 0xFFFF:
+            assert convs.int_to_address(number) == str(ipaddress.IPv6Address(number))
@@ -89,3 +89,41 @@ def test_asplain_to_community(test_input, expected):
 )
 def test_community_to_asplain(test_input, expected):
     assert convs.community_to_asplain(test_input) == expected
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    (("0", 0), ("4294967295", 4294967295), ("4294967296", None), ("+1", None)),
+)
+def test_parse_asplain(test_input, expected):
+    assert convs.parse_asplain(test_input) == expected
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    (
+        ("0.0", 0),
+        ("1.0", 65536),
+        ("65535.65535", 4294967295),
+        ("65536.0", None),
+        ("0.65536", None),
+        ("1", None),
+        ("1.", None),
+    ),
+)
+def test_parse_asdotplus(test_input, expected):
+    assert convs.parse_asdotplus(test_input) == expected
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    (
+        ("0:0", 0),
+        ("65535:65535", 4294967295),
+        ("65536:0", None),
+        ("1:2:3", None),
+        ("1", None),
+    ),
+)
+def test_parse_community(test_input, expected):
+    assert convs.parse_community(test_input) == expected
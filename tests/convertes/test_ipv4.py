@@ -25,3 +25,62 @@ def test_address_to_int(test_input, expected):
 )
 def test_int_to_address(test_input, expected):
     assert convs.int_to_address(test_input) == expected
+
+
+@pytest.mark.parametrize(
+    ("prefixlen", "netmask", "hostmask"),
+    (
+        (0, 0, 0xFFFFFFFF),
+        (8, 0xFF000000, 0x00FFFFFF),
+        (31, 0xFFFFFFFE, 1),
+        (32, 0xFFFFFFFF, 0),
+    ),
+)
+def test_masks(prefixlen, netmask, hostmask):
+    assert len(convs.NETMASKS) == len(convs.HOSTMASKS) == 33
+    assert convs.NETMASKS[prefixlen] == netmask
+    assert convs.HOSTMASKS[prefixlen] == hostmask
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    (
+        ("0.0.0.0", 0),
+        ("10.0.1.255", 0x0A0001FF),
+        ("255.255.255.255", 0xFFFFFFFF),
+        ("01.0.0.0", None),
+        ("256.0.0.0", None),
+        ("1.2.3", None),
+        ("1.2.3.4.5", None),
+        ("1.2.3.+4", None),
+        ("1.2.3.٣", None),
+        ("", None),
+    ),
+)
+def test_parse_address(test_input, expected):
+    assert convs.parse_address(test_input) == expected
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    (
+        ("10.0.0.0/8", (0x0A000000, 8)),
+        ("0.0.0.0/0", (0, 0)),
+        ("1.2.3.4/32", (0x01020304, 32)),
+        ("1.2.3.4/33", None),
+        ("1.2.3.4/", None),
+        ("1.2.3.4/-1", None),
+        ("1.2.3.4", None),
+        ("1.2.3.4/8/8", None),
+    ),
+)
+def test_parse_cidr(test_input, expected):
+    assert convs.parse_cidr(test_input) == expected
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    (("0", 0), ("255", 255), ("00", None), ("256", None), (" 1", None)),
+)
+def test_parse_octet(test_input, expected):
+    assert convs.parse_octet(test_input) == expected
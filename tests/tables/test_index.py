@@ -0,0 +1,146 @@
+import random
+
+import pytest
+
+from netsome import types
+from netsome.tables import PrefixIndex
+
+
+@pytest.fixture
+def index():
+    return PrefixIndex(
+        types.IPv4Network(network)
+        for network in (
+            "0.0.0.0/0",
+            "10.0.0.0/8",
+            "10.1.0.0/16",
+            "10.1.2.0/24",
+            "10.1.3.0/24",
+            "10.2.0.0/16",
+            "192.168.0.0/16",
+            "10.1.2.0/24",
+        )
+    )
+
+
+def nets(*networks):
+    return [types.IPv4Network(network) for network in networks]
+
+
+def test_init(index):
+    assert len(index) == 7
+    assert list(index) == sorted(index)
+    assert types.IPv4Network("10.1.0.0/16") in index
+    assert types.IPv4Network("10.3.0.0/16") not in index
+    assert types.IPv6Network("::/0") not in index
+    assert repr(index) == "PrefixIndex(<7 prefixes>)"
+
+
+@pytest.mark.parametrize(
+    ("network", "strict", "expected"),
+    (
+        (
+            "10.0.0.0/8",
+            False,
+            ("10.0.0.0/8", "10.1.0.0/16", "10.1.2.0/24", "10.1.3.0/24", "10.2.0.0/16"),
+        ),
+        (
+            "10.0.0.0/8",
+            True,
+            ("10.1.0.0/16", "10.1.2.0/24", "10.1.3.0/24", "10.2.0.0/16"),
+        ),
+        ("10.1.0.0/16", True, ("10.1.2.0/24", "10.1.3.0/24")),
+        ("10.1.2.0/23", False, ("10.1.2.0/24", "10.1.3.0/24")),
+        ("10.1.2.0/25", False, ()),
+        ("172.16.0.0/12", False, ()),
+    ),
+)
+def test_covered_by(index, network, strict, expected):
+    covered = index.covered_by(types.IPv4Network(network), strict=strict)
+    assert list(covered) == nets(*expected)
+
+
+@pytest.mark.parametrize(
+    ("network", "strict", "expected"),
+    (
+        (
+            "10.1.2.0/24",
+            False,
+            ("10.1.2.0/24", "10.1.0.0/16", "10.0.0.0/8", "0.0.0.0/0"),
+        ),
+        ("10.1.2.0/24", True, ("10.1.0.0/16", "10.0.0.0/8", "0.0.0.0/0")),
+        ("10.1.4.0/24", False, ("10.1.0.0/16", "10.0.0.0/8", "0.0.0.0/0")),
+        ("10.2.255.255/32", False, ("10.2.0.0/16", "10.0.0.0/8", "0.0.0.0/0")),
+        ("11.0.0.0/8", False, ("0.0.0.0/0",)),
+        ("0.0.0.0/0", True, ()),
+    ),
+)
+def test_covering(index, network, strict, expected):
+    covering = index.covering(types.IPv4Network(network), strict=strict)
+    assert list(covering) == nets(*expected)
+
+
+def test_overlapping(index):
+    assert list(index.overlapping(types.IPv4Network("10.1.0.0/16"))) == nets(
+        "0.0.0.0/0", "10.0.0.0/8", "10.1.0.0/16", "10.1.2.0/24", "10.1.3.0/24"
+    )
+    assert list(index.overlapping(types.IPv4Network("192.168.1.0/24"))) == nets(
+        "0.0.0.0/0", "192.168.0.0/16"
+    )
+
+
+def test_empty():
+    index = PrefixIndex()
+    network = types.IPv6Network("2001:db8::/32")
+
+    assert len(index) == 0
+    assert list(index.covered_by(network)) == []
+    assert list(index.covering(network)) == []
+    assert list(index.overlapping(network)) == []
+
+
+@pytest.mark.parametrize(
+    "networks",
+    (
+        [types.IPv4Network("10.0.0.0/8"), types.IPv6Network("::/0")],
+        [types.IPv4Address("10.0.0.1")],
+        ["10.0.0.0/8"],
+    ),
+)
+def test_init_type_error(networks):
+    with pytest.raises(TypeError):
+        PrefixIndex(networks)
+
+
+@pytest.mark.parametrize("network", (types.IPv6Network("::/0"), "10.0.0.0/8", None))
+def test_query_type_error(index, network):
+    with pytest.raises(TypeError):
+        next(index.covered_by(network))
+    with pytest.raises(TypeError):
+        next(index.covering(network))
+
+
+def random_network(rnd):
+    # prefixes under 2000::/3 with few distinct lengths, so they nest
+    prefixlen = rnd.choice((0, 8, 16, 32, 48, 56, 64, 127, 128))
+    if not prefixlen:
+        return types.IPv6Network("::/0")
+
+    bits = 0b001 << (prefixlen - 3) | rnd.getrandbits(prefixlen - 3)
+    return types.IPv6Network.from_int(bits << (128 - prefixlen), prefixlen)
+
+
+def test_matches_brute_force_ipv6():
+    rnd = random.Random(0)
+    networks = sorted({random_network(rnd) for _ in range(2000)})
+    index = PrefixIndex(networks)
+
+    assert list(index) == networks
+    for _ in range(200):
+        query = random_network(rnd)
+        covered = [n for n in networks if n == query or query.contains_subnet(n)]
+        covering = [n for n in networks if n == query or n.contains_subnet(query)]
+
+        assert list(index.covered_by(query)) == covered
+        assert list(index.covering(query)) == covering[::-1]
+        assert list(index.overlapping(query)) == sorted({*covered, *covering})
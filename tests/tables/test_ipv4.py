@@ -0,0 +1,170 @@
+import random
+
+import pytest
+
+from netsome import types
+from netsome.tables import IPv4PrefixTable
+
+
+@pytest.fixture
+def table():
+    return IPv4PrefixTable(
+        (
+            (types.IPv4Network("0.0.0.0/0"), "default"),
+            (types.IPv4Network("10.0.0.0/8"), "core"),
+            (types.IPv4Network("10.1.0.0/16"), "dc1"),
+            (types.IPv4Network("10.1.2.128/25"), "rack"),
+            (types.IPv4Network("10.1.2.255/32"), "host"),
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ("address", "expected"),
+    (
+        ("1.1.1.1", "default"),
+        ("10.0.0.1", "core"),
+        ("10.1.0.0", "dc1"),
+        ("10.1.2.127", "dc1"),
+        ("10.1.2.128", "rack"),
+        ("10.1.2.254", "rack"),
+        ("10.1.2.255", "host"),
+        ("10.1.3.0", "dc1"),
+        ("10.255.255.255", "core"),
+    ),
+)
+def test_lookup(table, address, expected):
+    assert table.lookup(types.IPv4Address(address)) == expected
+    assert table.lookup(int(types.IPv4Address(address))) == expected
+
+
+def test_lookup_empty():
+    table = IPv4PrefixTable()
+    assert table.lookup(types.IPv4Address("1.1.1.1")) is None
+    assert table.lookup(0, default="miss") == "miss"
+    assert table.lookup_many([0, 1], default="miss") == ["miss", "miss"]
+
+
+def test_lookup_default():
+    table = IPv4PrefixTable()
+    table.insert(types.IPv4Network("10.0.0.0/8"))
+    assert table.lookup(types.IPv4Address("11.0.0.0"), default="miss") == "miss"
+    assert table.lookup(types.IPv4Address("10.0.0.0")) == types.IPv4Network(
+        "10.0.0.0/8"
+    )
+
+
+@pytest.mark.parametrize("address", ("1.1.1.1", 1.1, [], object()))
+def test_lookup_type_error(table, address):
+    with pytest.raises(TypeError):
+        table.lookup(address)
+
+
+@pytest.mark.parametrize("address", (-1, 2**32))
+def test_lookup_value_error(table, address):
+    with pytest.raises(ValueError):
+        table.lookup(address)
+
+    with pytest.raises(ValueError):
+        table.lookup_many([1, address])
+
+
+def test_lookup_many(table):
+    addresses = [
+        types.IPv4Address("10.1.2.200"),
+        int(types.IPv4Address("10.1.2.255")),
+        types.IPv4Address("10.200.0.1"),
+        0,
+    ]
+    assert table.lookup_many(addresses) == ["rack", "host", "core", "default"]
+
+
+def test_remove(table):
+    table.remove(types.IPv4Network("10.1.2.128/25"))
+    assert table.lookup(types.IPv4Address("10.1.2.200")) == "dc1"
+    assert table.lookup(types.IPv4Address("10.1.2.255")) == "host"
+
+    table.remove(types.IPv4Network("10.1.2.255/32"))
+    assert table.lookup(types.IPv4Address("10.1.2.255")) == "dc1"
+    assert table._free_chunks
+
+    table.remove(types.IPv4Network("10.0.0.0/8"))
+    assert table.lookup(types.IPv4Address("10.2.0.0")) == "default"
+    assert table.lookup(types.IPv4Address("10.1.0.0")) == "dc1"
+
+    table.remove(types.IPv4Network("0.0.0.0/0"))
+    assert table.lookup(types.IPv4Address("10.2.0.0")) is None
+
+
+def test_remove_missing(table):
+    with pytest.raises(KeyError):
+        table.remove(types.IPv4Network("192.168.0.0/16"))
+
+
+def test_insert_replaces_value(table):
+    table.insert(types.IPv4Network("10.1.0.0/16"), "dc2")
+    assert len(table) == 5
+    assert table.lookup(types.IPv4Address("10.1.0.1")) == "dc2"
+    assert table.get(types.IPv4Network("10.1.0.0/16")) == "dc2"
+
+
+def test_insert_shorter_after_longer():
+    table = IPv4PrefixTable()
+    table.insert(types.IPv4Network("10.1.2.0/24"), "long")
+    table.insert(types.IPv4Network("10.1.2.4/30"), "longer")
+    table.insert(types.IPv4Network("10.0.0.0/8"), "short")
+
+    assert table.lookup(types.IPv4Address("10.1.2.5")) == "longer"
+    assert table.lookup(types.IPv4Address("10.1.2.8")) == "long"
+    assert table.lookup(types.IPv4Address("10.1.3.8")) == "short"
+
+
+@pytest.mark.parametrize("network", ("10.0.0.0/8", 1, None))
+def test_insert_type_error(network):
+    with pytest.raises(TypeError):
+        IPv4PrefixTable().insert(network, "value")
+
+
+def test_container_protocol(table):
+    assert len(table) == 5
+    assert types.IPv4Network("10.1.0.0/16") in table
+    assert types.IPv4Network("10.2.0.0/16") not in table
+    assert "10.1.0.0/16" not in table
+    assert set(table) == {network for network, _ in table.items()}
+    assert table.get(types.IPv4Network("10.2.0.0/16"), "miss") == "miss"
+
+
+def test_lookup_matches_linear_scan():
+    rnd = random.Random(42)
+    networks: dict[types.IPv4Network, int] = {}
+    for i in range(300):
+        prefixlen = rnd.choice((8, 12, 16, 20, 22, 24, 25, 27, 30, 32))
+        addr = rnd.randrange(2**32) & (2**32 - 2 ** (32 - prefixlen))
+        networks[types.IPv4Network.from_int(addr, prefixlen)] = i
+
+    table = IPv4PrefixTable()
+    for network, value in networks.items():
+        table.insert(network, value)
+
+    removed = rnd.sample(sorted(networks), 100)
+    for network in removed:
+        table.remove(network)
+        del networks[network]
+
+    probes = [int(network.netaddress) for network in networks]
+    probes += [int(network.broadcast) for network in networks]
+    probes += [rnd.randrange(2**32) for _ in range(1000)]
+
+    def linear(addr):
+        matches = [
+            network
+            for network in networks
+            if network.contains_address(types.IPv4Address.from_int(addr))
+        ]
+        if not matches:
+            return None
+        return networks[max(matches, key=lambda network: network.prefixlen)]
+
+    expected = [linear(addr) for addr in probes]
+    assert table.lookup_many(probes) == expected
+    assert [table.lookup(addr) for addr in probes] == expected
@@ -0,0 +1,163 @@
+import random
+
+import pytest
+
+from netsome import types
+from netsome.tables import IPv6PrefixTable
+
+
+@pytest.fixture
+def table():
+    return IPv6PrefixTable(
+        (
+            (types.IPv6Network("::/0"), "default"),
+            (types.IPv6Network("2001:db8::/32"), "isp"),
+            (types.IPv6Network("2001:db8:1::/48"), "site"),
+            (types.IPv6Network("2001:db8:1:ff00::/56"), "lan"),
+            (types.IPv6Network("2001:db8:1:ff00::1/128"), "host"),
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ("address", "expected"),
+    (
+        ("::1", "default"),
+        ("2001:db8::1", "isp"),
+        ("2001:db8:1::", "site"),
+        ("2001:db8:1:feff:ffff:ffff:ffff:ffff", "site"),
+        ("2001:db8:1:ff00::", "lan"),
+        ("2001:db8:1:ff00::1", "host"),
+        ("2001:db8:1:ff00::2", "lan"),
+        ("2001:db8:2::", "isp"),
+        ("2001:db9::", "default"),
+    ),
+)
+def test_lookup(table, address, expected):
+    assert table.lookup(types.IPv6Address(address)) == expected
+    assert table.lookup(int(types.IPv6Address(address))) == expected
+
+
+def test_lookup_empty():
+    table = IPv6PrefixTable()
+    assert table.lookup(types.IPv6Address("::1")) is None
+    assert table.lookup(0, default="miss") == "miss"
+    assert table.node_count == 1
+
+
+@pytest.mark.parametrize("address", ("::1", 1.1, [], object()))
+def test_lookup_type_error(table, address):
+    with pytest.raises(TypeError):
+        table.lookup(address)
+
+
+@pytest.mark.parametrize("address", (-1, 2**128))
+def test_lookup_value_error(table, address):
+    with pytest.raises(ValueError):
+        table.lookup(address)
+
+
+def test_lookup_many(table):
+    addresses = [
+        types.IPv6Address("2001:db8:1:ff00::1"),
+        int(types.IPv6Address("2001:db8:1::1")),
+        types.IPv6Address("fe80::1"),
+    ]
+    assert table.lookup_many(addresses) == ["host", "site", "default"]
+
+
+def test_get(table):
+    assert table.get(types.IPv6Network("2001:db8:1::/48")) == "site"
+    assert table.get(types.IPv6Network("2001:db8:1::/49")) is None
+    assert table.get(types.IPv6Network("2001:db8::/47"), "miss") == "miss"
+
+
+def test_remove(table):
+    table.remove(types.IPv6Network("2001:db8:1:ff00::/56"))
+    assert table.lookup(types.IPv6Address("2001:db8:1:ff00::2")) == "site"
+    assert table.lookup(types.IPv6Address("2001:db8:1:ff00::1")) == "host"
+
+    table.remove(types.IPv6Network("2001:db8::/32"))
+    assert table.lookup(types.IPv6Address("2001:db8:2::")) == "default"
+    assert table.lookup(types.IPv6Address("2001:db8:1::")) == "site"
+    assert len(table) == 3
+
+
+def test_remove_missing(table):
+    with pytest.raises(KeyError):
+        table.remove(types.IPv6Network("2001:db8:1::/49"))
+
+    with pytest.raises(KeyError):
+        table.remove(types.IPv6Network("2001:db9::/32"))
+
+
+def test_remove_all_releases_nodes(table):
+    for network in list(table):
+        table.remove(network)
+
+    assert len(table) == 0
+    assert table.node_count == 1
+    assert table.lookup(0) is None
+
+
+def test_path_compression():
+    table = IPv6PrefixTable(stride=4)
+    table.insert(types.IPv6Network("2001:db8::1/128"))
+    # root and a single compressed leaf, no intermediate nodes
+    assert table.node_count == 2
+
+    table.insert(types.IPv6Network("2001:db8::2/128"))
+    assert table.node_count == 4
+    assert table.lookup(types.IPv6Address("2001:db8::2")) == types.IPv6Network(
+        "2001:db8::2/128"
+    )
+
+
+def test_memory_usage(table):
+    assert table.memory_usage() > IPv6PrefixTable().memory_usage()
+
+
+@pytest.mark.parametrize("stride", (0, 9))
+def test_stride_value_error(stride):
+    with pytest.raises(ValueError):
+        IPv6PrefixTable(stride=stride)
+
+
+@pytest.mark.parametrize("stride", ("8", 8.0))
+def test_stride_type_error(stride):
+    with pytest.raises(TypeError):
+        IPv6PrefixTable(stride=stride)
+
+
+@pytest.mark.parametrize("stride", (1, 4, 6, 8))
+def test_lookup_matches_linear_scan(stride):
+    rnd = random.Random(stride)
+    networks: dict[types.IPv6Network, int] = {}
+    for i in range(200):
+        prefixlen = rnd.choice((0, 29, 32, 33, 48, 56, 64, 127, 128))
+        addr = (0x20010DB8 << 96) | rnd.randrange(2**96)
+        addr &= (2**128 - 1) ^ (2 ** (128 - prefixlen) - 1)
+        networks[types.IPv6Network.from_int(addr, prefixlen)] = i
+
+    table = IPv6PrefixTable(networks.items(), stride=stride)
+    for network in rnd.sample(sorted(networks), 80):
+        table.remove(network)
+        del networks[network]
+
+    assert dict(table.items()) == networks
+
+    probes = [int(network.netaddress) for network in networks]
+    probes += [int(network.netaddress) + 1 for network in networks]
+    probes += [(0x20010DB8 << 96) | rnd.randrange(2**96) for _ in range(300)]
+
+    def linear(addr):
+        matches = [
+            network
+            for network in networks
+            if network.contains_address(types.IPv6Address.from_int(addr))
+        ]
+        if not matches:
+            return None
+        return networks[max(matches, key=lambda network: network.prefixlen)]
+
+    assert table.lookup_many(probes) == [linear(addr) for addr in probes]
@@ -47,6 +47,11 @@ from netsome import constants as c
         (c.MAC.NIC_MAX, 2 ** (8 * 3) - 1),
         (c.MAC.NIC64_MAX, 2 ** (8 * 5) - 1),
         (c.MAC.ADDRESS64_MAX, 2 ** (8 * 8) - 1),
+        # VALIDATION_ERRORS
+        (c.VALIDATION_ERRORS.TYPE, "type"),
+        (c.VALIDATION_ERRORS.FORMAT, "format"),
+        (c.VALIDATION_ERRORS.RANGE, "range"),
+        (c.VALIDATION_ERRORS.HOST_BITS, "host_bits"),
     ),
 )
 def test_constant(constant, value):
@@ -0,0 +1,127 @@
+import gc
+
+import pytest
+
+from netsome import types
+from netsome._intern import InternPool
+
+
+@pytest.fixture(autouse=True)
+def clear_pools():
+    pools = [
+        cls.intern_pool
+        for cls in (types.ASN, types.Community, types.IPv4Address, types.MacAddress)
+    ]
+    sizes = [pool.maxsize for pool in pools]
+    for pool in pools:
+        pool.clear()
+
+    yield
+
+    for pool, size in zip(pools, sizes):
+        pool.clear()
+        pool.maxsize = size
+
+
+@pytest.mark.parametrize(
+    ("cls", "value"),
+    (
+        (types.ASN, 65000),
+        (types.Community, 4259840100),
+        (types.IPv4Address, "10.0.0.1"),
+        (types.MacAddress, "001122334455"),
+        (types.VID, 100),
+    ),
+)
+def test_intern_identity(cls, value):
+    first = cls.intern(value)
+    assert first is cls.intern(value)
+    assert first is cls.intern(first)
+
+
+@pytest.mark.parametrize(
+    ("cls", "value", "expected"),
+    (
+        (types.ASN, 65000, types.ASN(65000)),
+        (types.Community, 4259840100, types.Community(4259840100)),
+        (types.IPv4Address, "10.0.0.1", types.IPv4Address("10.0.0.1")),
+        (types.MacAddress, "001122334455", types.MacAddress("001122334455")),
+    ),
+)
+def test_intern_instance_becomes_canonical(cls, value, expected):
+    assert cls.intern(expected) is expected
+    assert cls.intern(value) is expected
+
+
+@pytest.mark.parametrize(
+    ("cls", "value", "exc"),
+    (
+        (types.ASN, -1, ValueError),
+        (types.ASN, 65000.0, TypeError),
+        (types.ASN, "65000", TypeError),
+        (types.Community, 2**32, ValueError),
+        (types.IPv4Address, "10.0.0.256", ValueError),
+        (types.IPv4Address, 167772161, TypeError),
+        (types.MacAddress, "0011223344", ValueError),
+        (types.MacAddress, 0x001122334455, TypeError),
+        (types.VID, 4096, ValueError),
+        (types.VID, "100", TypeError),
+    ),
+)
+def test_intern_invalid(cls, value, exc):
+    with pytest.raises(exc):
+        cls.intern(value)
+
+
+def test_vid_table_is_eager():
+    assert types.VID.intern(0) is types.VID.intern(types.VID(0))
+    assert types.VID.intern(4095) is types.VID.intern(4095)
+
+
+def test_pool_counters():
+    pool = types.ASN.intern_pool
+    kept = [types.ASN.intern(number) for number in (1, 1, 2)]
+    assert (pool.hits, pool.misses) == (1, 2)
+    assert pool.hit_rate == pytest.approx(1 / 3)
+    assert len(pool) == len(set(kept))
+
+
+def test_pool_is_weak():
+    pool = types.ASN.intern_pool
+    asn = types.ASN.intern(65000)
+    assert len(pool) == 1
+
+    del asn
+    gc.collect()
+    assert len(pool) == 0
+
+
+def test_pool_maxsize():
+    pool = types.ASN.intern_pool
+    pool.maxsize = 2
+    kept = [types.ASN.intern(number) for number in range(3)]
+    assert len(pool) == 2
+    assert types.ASN.intern(1) is kept[1]
+    assert types.ASN.intern(2) is not kept[2]
+    assert types.ASN.intern(2) == kept[2]
+
+
+def test_pool_clear():
+    pool = InternPool()
+    kept = pool.add(1, types.ASN(1))
+    assert pool.get(1) is kept
+    pool.clear()
+    assert (len(pool), pool.hits, pool.misses) == (0, 0, 0)
+    assert pool.get(1) is None
+
+
+def test_pool_add_keeps_first():
+    pool = InternPool()
+    first = pool.add(1, types.ASN(1))
+    assert pool.add(1, types.ASN(1)) is first
+
+
+@pytest.mark.parametrize(("maxsize", "exc"), (("1", TypeError), (-1, ValueError)))
+def test_pool_invalid_maxsize(maxsize, exc):
+    with pytest.raises(exc):
+        InternPool(maxsize)
@@ -0,0 +1,135 @@
+import threading
+
+import pytest
+
+import netsome
+from netsome import types
+
+
+CACHED = (
+    (types.IPv4Address, "10.0.0.1"),
+    (types.IPv6Address, "2001:db8::1"),
+    (types.IPv4Network, "10.0.0.0/8"),
+    (types.MacAddress, "001122334455"),
+    (types.Interface, "Gi0/1"),
+)
+
+
+@pytest.fixture(autouse=True)
+def parse_cache():
+    sizes = {cls.__name__: cls.parse_cache.maxsize for cls, _ in CACHED}
+    netsome.enable_parse_cache()
+    yield
+    netsome.enable_parse_cache(False, **sizes)
+
+
+@pytest.mark.parametrize(("cls", "string"), CACHED)
+def test_parse_cache_hit(cls, string):
+    first = cls(string)
+    second = cls(string)
+    assert first == second
+    assert first is not second
+    assert (cls.parse_cache.hits, cls.parse_cache.misses) == (1, 1)
+    assert netsome.parse_cache_stats()[cls.__name__]["hit_rate"] == 0.5
+
+
+@pytest.mark.parametrize(
+    ("cls", "string"),
+    (
+        (types.IPv4Address, "10.0.0.256"),
+        (types.IPv6Address, "2001:db8:::1"),
+        (types.IPv4Network, "10.0.0.1/8"),
+        (types.MacAddress, "00112233445"),
+        (types.Interface, "foo0/1"),
+    ),
+)
+def test_parse_cache_skips_invalid(cls, string):
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            cls(string)
+
+    assert len(cls.parse_cache) == 0
+
+
+def test_parse_cache_non_str():
+    with pytest.raises(TypeError):
+        types.IPv4Address(167772161)
+
+    with pytest.raises(TypeError):
+        types.Interface(["Gi0/1"])
+
+
+def test_parse_cache_lru():
+    cache = types.IPv4Address.parse_cache
+    cache.maxsize = 2
+    for string in ("10.0.0.1", "10.0.0.2", "10.0.0.1", "10.0.0.3"):
+        types.IPv4Address(string)
+
+    # 10.0.0.2 is the least recently used one
+    assert len(cache) == 2
+    types.IPv4Address("10.0.0.1")
+    types.IPv4Address("10.0.0.2")
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_parse_cache_shrink():
+    cache = types.MacAddress.parse_cache
+    for number in range(10):
+        types.MacAddress(f"{number:012x}")
+
+    cache.maxsize = 3
+    assert len(cache) == 3
+
+
+def test_parse_cache_disable():
+    types.IPv4Address("10.0.0.1")
+    netsome.enable_parse_cache(False)
+    types.IPv4Address("10.0.0.1")
+
+    stats = netsome.parse_cache_stats()["IPv4Address"]
+    assert stats["enabled"] is False
+    assert (stats["size"], stats["hits"], stats["misses"]) == (0, 0, 0)
+
+
+def test_parse_cache_per_type_size():
+    netsome.enable_parse_cache(Interface=10)
+    assert types.Interface.parse_cache.maxsize == 10
+    assert types.IPv4Address.parse_cache.enabled
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "exc"),
+    (
+        ({"Foo": 10}, ValueError),
+        ({"Interface": -1}, ValueError),
+        ({"Interface": "10"}, TypeError),
+    ),
+)
+def test_parse_cache_invalid_config(kwargs, exc):
+    with pytest.raises(exc):
+        netsome.enable_parse_cache(**kwargs)
+
+
+def test_parse_cache_threads():
+    cache = types.Interface.parse_cache
+    cache.maxsize = 16
+    names = [f"Gi0/{i}" for i in range(32)]
+    errors = []
+
+    def work():
+        try:
+            for _ in range(50):
+                for name in names:
+                    assert types.Interface(name).value == name[2:]
+        except AssertionError as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert len(cache) == 16
+    assert cache.hits + cache.misses == 4 * 50 * 32
@@ -0,0 +1,54 @@
+import pytest
+
+import netsome
+from netsome import types
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (
+        ("192.0.2.1", types.IPv4Address("192.0.2.1")),
+        ("192.0.2.0/24", types.IPv4Network("192.0.2.0/24")),
+        ("10/8", types.IPv4Network("10.0.0.0/8")),
+        ("2001:db8::1", types.IPv6Address("2001:db8::1")),
+        ("1:2:3:4:5:6:7:8", types.IPv6Address("1:2:3:4:5:6:7:8")),
+        ("::ffff:192.0.2.1", types.IPv6Address("::ffff:192.0.2.1")),
+        ("2001:db8::/32", types.IPv6Network("2001:db8::/32")),
+        ("00:11:22:33:44:55", types.MacAddress("001122334455")),
+        ("00-11-22-33-44-55", types.MacAddress("001122334455")),
+        ("0011.2233.4455", types.MacAddress("001122334455")),
+        ("aabb.ccdd.eeff", types.MacAddress("aabbccddeeff")),
+        ("001122334455", types.MacAddress("001122334455")),
+        ("65000", types.ASN(65000)),
+        ("4294967295", types.ASN(4_294_967_295)),
+        ("1.10", types.ASN(65546)),
+    ),
+)
+def test_parse_any(value, expected):
+    result = netsome.parse_any(value)
+    assert type(result) is type(expected)
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    (
+        "",
+        "foobar",
+        "256.0.0.1",
+        "10.0.0.1/8",
+        "2001:db8::g",
+        "00:11:22:33:44",
+        "4294967296",
+        "1.2.3.4.5",
+    ),
+)
+def test_parse_any_value_error(value):
+    with pytest.raises(ValueError):
+        netsome.parse_any(value)
+
+
+@pytest.mark.parametrize("value", (1, None, b"10.0.0.1"))
+def test_parse_any_type_error(value):
+    with pytest.raises(TypeError):
+        netsome.parse_any(value)
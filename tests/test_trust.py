@@ -0,0 +1,70 @@
+import threading
+
+import pytest
+
+import netsome
+from netsome import types
+
+
+@pytest.mark.parametrize(
+    ("factory", "args"),
+    (
+        (types.IPv4Address.from_int, (-1,)),
+        (types.IPv6Address.from_int, (-1,)),
+        (types.IPv4Network.from_int, (1, 8)),
+        (types.IPv6Network.from_int, (1, 64)),
+        (types.MacAddress.from_int, (-1,)),
+        (types.VlanSet.from_int, (-1,)),
+    ),
+)
+def test_trusted_skips_validation(factory, args):
+    with pytest.raises(ValueError):
+        factory(*args)
+
+    with netsome.trusted():
+        factory(*args)
+
+    with pytest.raises(ValueError):
+        factory(*args)
+
+
+def test_trusted_nested():
+    with netsome.trusted():
+        with netsome.trusted():
+            pass
+        types.IPv4Address.from_int(-1)
+
+
+def test_trusted_reset_on_error():
+    with pytest.raises(RuntimeError), netsome.trusted():
+        raise RuntimeError
+
+    with pytest.raises(ValueError):
+        types.IPv4Address.from_int(-1)
+
+
+def test_trusted_other_thread():
+    errors = []
+
+    def build():
+        try:
+            types.IPv4Address.from_int(-1)
+        except ValueError as e:
+            errors.append(e)
+
+    with netsome.trusted():
+        thread = threading.Thread(target=build)
+        thread.start()
+        thread.join()
+
+    assert len(errors) == 1
+
+
+def test_trusted_objects_equal_validated():
+    with netsome.trusted():
+        trusted = types.IPv4Network.from_int(0x0A000000, 8)
+
+    network = types.IPv4Network("10.0.0.0/8")
+    assert trusted == network
+    assert str(trusted) == "10.0.0.0/8"
+    assert trusted.broadcast == network.broadcast
@@ -204,3 +204,25 @@ def test_hash(asn):
 )
 def test_repr(asn, expected):
     assert repr(asn) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (
+        (65000, types.ASN(65000)),
+        ("65000", types.ASN(65000)),
+        ("4294967295", types.ASN(4_294_967_295)),
+        ("1.10", types.ASN(65546)),
+        ("65535.65535", types.ASN(4_294_967_295)),
+        (-1, None),
+        ("4294967296", None),
+        ("65536.0", None),
+        ("1.2.3", None),
+        ("foobar", None),
+        (" 1", None),
+        (None, None),
+    ),
+)
+def test_try_parse(value, expected):
+    assert types.ASN.try_parse(value) == expected
+    assert types.ASN.is_valid(value) is (expected is not None)
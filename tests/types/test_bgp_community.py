@@ -125,3 +125,20 @@ def test_hash(community):
 )
 def test_repr(community, expected):
     assert repr(community) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (
+        ("65000:100", types.Community.from_str("65000:100")),
+        ("0:0", types.Community(0)),
+        ("65536:0", None),
+        ("1:2:3", None),
+        ("100", None),
+        ("a:b", None),
+        (100, None),
+    ),
+)
+def test_try_parse(value, expected):
+    assert types.Community.try_parse(value) == expected
+    assert types.Community.is_valid(value) is (expected is not None)
@@ -220,3 +220,104 @@ def test_interface_comparison_with_other_types(basic_interface):
     assert basic_interface != "GigabitEthernet0/1"
     assert basic_interface != 123
     assert basic_interface is not None
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (
+        ("GigabitEthernet0/1", Interface("GigabitEthernet0/1")),
+        ("Gi0/1", Interface("Gi0/1")),
+        ("NotAnInterface", None),
+        ("", None),
+        (None, None),
+    ),
+)
+def test_try_parse(value, expected):
+    assert Interface.try_parse(value) == expected
+    assert Interface.is_valid(value) is (expected is not None)
+
+
+def _match_each(string):
+    # reference: dialects tried one by one in IFACE_PATTERNS order
+    for tp, pattern in c.IFACE_PATTERNS.items():
+        if match := pattern.match(string):
+            groups = match.groupdict()
+            return tp, groups["value"], groups.get("sub")
+
+    return None
+
+
+@pytest.mark.parametrize(
+    "prefix",
+    (
+        "Ethernet",
+        "eth",
+        "Eth",
+        "GigabitEthernet",
+        "GigE",
+        "Gig",
+        "GE",
+        "ge",
+        "Gi",
+        "FastEthernet",
+        "FastE",
+        "Fas",
+        "FE",
+        "Fa",
+        "Loopback",
+        "lo",
+        "Vlan",
+        "VLAN",
+        "mgmt",
+        "Management",
+        "Port-channel",
+        "portchannel",
+        "po",
+        "xe",
+        "ce",
+        "te",
+        "",
+        "G",
+        "Etherne",
+    ),
+)
+@pytest.mark.parametrize(
+    "value", ("0", "1/0/24", "0/1.100", "1/2/3/4", "1.", "/1", "12\n", "")
+)
+def test_combined_pattern_matches_dialects(prefix, value):
+    assert Interface._match(prefix + value) == _match_each(prefix + value)
+
+
+@pytest.mark.parametrize(
+    ("names", "expected"),
+    (
+        (("Gi1/0/10", "Gi1/0/2", "Gi1/0/1"), ("Gi1/0/1", "Gi1/0/2", "Gi1/0/10")),
+        (
+            ("Gi1/0/2.10", "Gi1/0/2.9", "Gi1/0/2"),
+            ("Gi1/0/2", "Gi1/0/2.9", "Gi1/0/2.10"),
+        ),
+        (("Gi2/1", "Gi1/0/3", "Gi10"), ("Gi1/0/3", "Gi2/1", "Gi10")),
+        (("Vlan1", "Gi1/0/1", "Eth9"), ("Eth9", "Gi1/0/1", "Vlan1")),
+    ),
+)
+def test_natural_order(names, expected):
+    assert sorted(map(Interface, names)) == [Interface(name) for name in expected]
+
+
+def test_sort_key():
+    iface = Interface("Gi1/0/24.100")
+    assert iface.sort_key == (1, (1, 0, 24), 100)
+    assert Interface("Gi1/0/24").sort_key == (1, (1, 0, 24), -1)
+    assert Interface.try_parse("Gi1/0/24.100").sort_key == iface.sort_key
+
+
+def test_rich_comparisons():
+    low, high = Interface("Gi1/0/2"), Interface("Gi1/0/10")
+    assert low < high
+    assert low <= high
+    assert high > low
+    assert high >= low
+    assert low <= Interface("Gi1/0/2")
+
+    with pytest.raises(TypeError):
+        assert low < "Gi1/0/10"
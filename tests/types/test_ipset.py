@@ -0,0 +1,163 @@
+import random
+
+import pytest
+
+from netsome import types
+
+
+def ipset(*items):
+    return types.IPSet(
+        types.IPv4Network.parse(i) if "." in i else types.IPv6Network.parse(i)
+        for i in items
+    )
+
+
+def test_init_merges_ranges():
+    s = ipset("10.0.0.0/25", "10.0.0.128/25", "10.0.1.0/24", "10.0.0.5/32")
+    assert list(s) == [types.IPv4Network("10.0.0.0/23")]
+    assert s.size == 512
+
+
+def test_init_addresses():
+    s = types.IPSet(
+        (
+            types.IPv4Address("10.0.0.1"),
+            types.IPv4Address("10.0.0.2"),
+            types.IPv6Address("2001:db8::"),
+        )
+    )
+    assert list(s) == [
+        types.IPv4Network("10.0.0.1/32"),
+        types.IPv4Network("10.0.0.2/32"),
+        types.IPv6Network("2001:db8::/128"),
+    ]
+
+
+@pytest.mark.parametrize("test_input", (["10.0.0.0/8"], [1], [None]))
+def test_init_type_error(test_input):
+    with pytest.raises(TypeError):
+        types.IPSet(test_input)
+
+
+def test_empty():
+    s = types.IPSet()
+    assert not s
+    assert list(s) == []
+    assert s.size == 0
+    assert types.IPv4Address("1.1.1.1") not in s
+
+
+@pytest.mark.parametrize(
+    ("items", "expected"),
+    (
+        (("10.0.0.0/8",), ["10.0.0.0/8"]),
+        (("0.0.0.0/0",), ["0.0.0.0/0"]),
+        (("::/0",), ["::/0"]),
+        (("10.0.0.0/24", "10.0.2.0/24"), ["10.0.0.0/24", "10.0.2.0/24"]),
+        (("10.0.0.0/8", "::/0"), ["10.0.0.0/8", "::/0"]),
+    ),
+)
+def test_iter(items, expected):
+    assert [str(network) for network in ipset(*items)] == expected
+
+
+def test_contains():
+    s = ipset("10.0.0.0/8", "192.168.0.0/24", "2001:db8::/32")
+    assert types.IPv4Address("10.255.255.255") in s
+    assert types.IPv4Address("11.0.0.0") not in s
+    assert types.IPv4Network("10.1.0.0/16") in s
+    assert types.IPv4Network("192.168.0.0/23") not in s
+    assert types.IPv6Address("2001:db8::1") in s
+    assert types.IPv6Network("2001:db8:1::/48") in s
+    assert types.IPv6Address("::1") not in s
+
+
+def test_contains_type_error():
+    with pytest.raises(TypeError):
+        "10.0.0.1" in ipset("10.0.0.0/8")
+
+
+def test_operations():
+    a = ipset("10.0.0.0/8", "2001:db8::/32")
+    b = ipset("10.1.0.0/16", "11.0.0.0/8", "2001:db8::/33")
+
+    assert a | b == ipset("10.0.0.0/7", "2001:db8::/32")
+    assert a & b == ipset("10.1.0.0/16", "2001:db8::/33")
+    assert a - b == ipset(
+        "10.0.0.0/16",
+        "10.2.0.0/15",
+        "10.4.0.0/14",
+        "10.8.0.0/13",
+        "10.16.0.0/12",
+        "10.32.0.0/11",
+        "10.64.0.0/10",
+        "10.128.0.0/9",
+        "2001:db8:8000::/33",
+    )
+    assert a ^ b == (a - b) | (b - a)
+    assert a.union(b) == a | b
+    assert a.intersection(b) == a & b
+    assert a.difference(b) == a - b
+    assert a.symmetric_difference(b) == a ^ b
+
+
+def test_operations_not_implemented():
+    with pytest.raises(TypeError):
+        ipset("10.0.0.0/8") | {types.IPv4Network("10.0.0.0/8")}
+
+
+def test_comparisons():
+    a = ipset("10.0.0.0/8")
+    b = ipset("10.1.0.0/16")
+    c = ipset("11.0.0.0/8")
+
+    assert b <= a and b < a
+    assert a >= b and a > b
+    assert a <= a and not a < a
+    assert a.isdisjoint(c)
+    assert not a.isdisjoint(b)
+    assert hash(a) == hash(ipset("10.0.0.0/9", "10.128.0.0/9"))
+
+
+def test_repr():
+    value = ipset("10.0.0.0/8", "::1/128")
+    assert repr(value) == ('IPSet([IPv4Network("10.0.0.0/8"), IPv6Network("::1/128")])')
+    assert eval(repr(value), vars(types)) == value
+
+
+def test_operations_match_python_sets():
+    rnd = random.Random(7)
+
+    def random_set():
+        networks = []
+        for _ in range(30):
+            prefixlen = rnd.randint(26, 32)
+            addr = rnd.randrange(1024) & (2**32 - 2 ** (32 - prefixlen))
+            networks.append(types.IPv4Network.from_int(addr, prefixlen))
+        return types.IPSet(networks)
+
+    def addresses(s):
+        return {
+            int(network.netaddress) + i
+            for network in s
+            for i in range(2 ** (32 - network.prefixlen))
+        }
+
+    for _ in range(20):
+        a, b = random_set(), random_set()
+        sa, sb = addresses(a), addresses(b)
+        assert addresses(a | b) == sa | sb
+        assert addresses(a & b) == sa & sb
+        assert addresses(a - b) == sa - sb
+        assert addresses(a ^ b) == sa ^ sb
+        assert (a | b).size == len(sa | sb)
+        for addr in range(1024):
+            assert (types.IPv4Address.from_int(addr) in a) == (addr in sa)
+
+
+def test_try_parse():
+    items = [types.IPv4Network("10.0.0.0/8"), types.IPv6Address("::1")]
+    assert types.IPSet.try_parse(iter(items)) == types.IPSet(items)
+    assert types.IPSet.is_valid(items)
+    assert types.IPSet.try_parse(["10.0.0.0/8"]) is None
+    assert types.IPSet.try_parse(None) is None
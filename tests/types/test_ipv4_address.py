@@ -213,3 +213,21 @@ def test_gt(addr):
 def test_ge(addr):
     assert addr >= types.IPv4Address.from_int(int(addr))
     assert addr >= types.IPv4Address.from_int(int(addr) - 1)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (
+        ("10.0.0.1", types.IPv4Address("10.0.0.1")),
+        ("255.255.255.255", types.IPv4Address("255.255.255.255")),
+        ("10.0.0.01", None),
+        ("10.0.0", None),
+        ("10.0.0.256", None),
+        ("foo", None),
+        (167772161, None),
+        (None, None),
+    ),
+)
+def test_try_parse(value, expected):
+    assert types.IPv4Address.try_parse(value) == expected
+    assert types.IPv4Address.is_valid(value) is (expected is not None)
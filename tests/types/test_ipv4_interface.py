@@ -187,3 +187,18 @@ def test_repr(ipv4_iface, expected):
 )
 def test_hash(ipv4_iface):
     assert hash(ipv4_iface) == hash((ipv4_iface._addr, ipv4_iface._network))
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (
+        ("10.0.0.1/24", types.IPv4Interface("10.0.0.1/24")),
+        ("10.0.0.1", None),
+        ("10.0.0.1/33", None),
+        ("foo/24", None),
+        (None, None),
+    ),
+)
+def test_try_parse(value, expected):
+    assert types.IPv4Interface.try_parse(value) == expected
+    assert types.IPv4Interface.is_valid(value) is (expected is not None)
@@ -1,6 +1,7 @@
 import pytest
 
 from netsome import types
+from netsome.types import views
 
 
 @pytest.mark.parametrize(
@@ -392,6 +393,70 @@ def test_subnets_ok(ipv4net, prefixlen, expected):
     assert tuple(ipv4net.subnets(prefixlen)) == expected
 
 
+def test_range_view_is_abstract():
+    with pytest.raises(TypeError):
+        views._RangeView(types.IPv4Address, range(10))
+
+
+def test_subnets_view():
+    net = types.IPv4Network("10.0.0.0/8")
+    subnets = net.subnets(24)
+    expected = list(subnets)
+
+    assert isinstance(subnets, types.SubnetView)
+    assert len(subnets) == len(expected) == 65536
+    assert subnets.prefixlen == 24
+    assert subnets[0] == expected[0]
+    assert subnets[-1] == types.IPv4Network("10.255.255.0/24")
+    assert list(subnets[10:300:7]) == expected[10:300:7]
+    assert list(subnets[300:10:-7]) == expected[300:10:-7]
+    assert list(subnets[::-4096]) == expected[::-4096]
+    assert list(reversed(subnets[:5])) == expected[4::-1]
+    assert subnets[5:5].size == 0
+    assert not subnets[5:5]
+
+
+@pytest.mark.parametrize(
+    ("network", "found"),
+    (
+        ("10.1.2.0/24", True),
+        ("10.255.255.0/24", True),
+        ("10.1.2.0/25", False),
+        ("10.1.0.0/16", False),
+        ("11.0.0.0/24", False),
+    ),
+)
+def test_subnets_view_contains(network, found):
+    subnets = types.IPv4Network("10.0.0.0/8").subnets(24)
+    network = types.IPv4Network(network)
+
+    assert (network in subnets) is found
+    assert subnets.count(network) == int(found)
+    if found:
+        assert subnets[subnets.index(network)] == network
+    else:
+        with pytest.raises(ValueError):
+            subnets.index(network)
+
+
+def test_subnets_view_index_bounds():
+    subnets = types.IPv4Network("10.0.0.0/16").subnets(24)
+    network = types.IPv4Network("10.0.5.0/24")
+
+    assert subnets.index(network, 5) == 5
+    assert subnets[::2].index(types.IPv4Network("10.0.6.0/24")) == 3
+    assert "10.0.5.0/24" not in subnets
+    assert types.IPv4Address("10.0.5.0") not in subnets
+    with pytest.raises(ValueError):
+        subnets.index(network, 6)
+    with pytest.raises(ValueError):
+        subnets[::2].index(network)
+    with pytest.raises(IndexError):
+        subnets[256]
+    with pytest.raises(IndexError):
+        subnets[-257]
+
+
 @pytest.mark.parametrize(
     ("ipv4net", "prefixlen"),
     (
@@ -513,6 +578,105 @@ def test_hosts(ipv4net, expected):
     assert tuple(ipv4net.hosts()) == expected
 
 
+@pytest.mark.parametrize(
+    ("network", "first", "last", "size"),
+    (
+        ("10.0.0.0/24", "10.0.0.1", "10.0.0.254", 254),
+        ("10.0.0.0/30", "10.0.0.1", "10.0.0.2", 2),
+        ("10.0.0.0/31", "10.0.0.0", "10.0.0.1", 2),
+        ("10.0.0.1/32", "10.0.0.1", "10.0.0.1", 1),
+        ("0.0.0.0/0", "0.0.0.1", "255.255.255.254", 2**32 - 2),
+    ),
+)
+def test_hosts_range(network, first, last, size):
+    hosts = types.IPv4Network(network).hosts()
+
+    assert isinstance(hosts, types.HostRange)
+    assert len(hosts) == hosts.size == size
+    assert hosts[0] == types.IPv4Address(first)
+    assert hosts[-1] == types.IPv4Address(last)
+    assert types.IPv4Address(first) in hosts
+    assert hosts.index(types.IPv4Address(last)) == size - 1
+    assert next(reversed(hosts)) == types.IPv4Address(last)
+
+
+def test_hosts_range_excludes_network_and_broadcast():
+    net = types.IPv4Network("10.0.0.0/24")
+    hosts = net.hosts()
+
+    assert net.netaddress not in hosts
+    assert net.broadcast not in hosts
+    assert types.IPv4Address("10.0.1.1") not in hosts
+    assert "10.0.0.1" not in hosts
+    with pytest.raises(IndexError):
+        hosts[254]
+    with pytest.raises(IndexError):
+        hosts[-255]
+
+
+def test_hosts_range_slicing():
+    hosts = types.IPv4Network("10.0.0.0/24").hosts()
+    expected = list(hosts)
+
+    assert list(hosts[10:200:9]) == expected[10:200:9]
+    assert list(hosts[::-50]) == expected[::-50]
+    assert list(reversed(hosts[-3:])) == expected[:-4:-1]
+    assert isinstance(hosts[1:3], types.HostRange)
+
+
+def test_hosts_range_batched():
+    hosts = types.IPv4Network("10.0.0.0/24").hosts()
+
+    batches = list(hosts.batched(100))
+    assert [len(batch) for batch in batches] == [100, 100, 54]
+    assert [host for batch in batches for host in batch] == list(hosts)
+    assert list(hosts.batched(100, raw=True))[-1] == range(0x0A0000C9, 0x0A0000FF)
+    with pytest.raises(ValueError):
+        next(hosts.batched(0))
+
+
+@pytest.mark.parametrize(
+    "network",
+    ("10.0.0.0/22", "10.0.0.0/24", "10.0.0.0/29", "10.0.0.0/31", "10.0.0.1/32"),
+)
+def test_permuted_hosts(network):
+    net = types.IPv4Network(network)
+    permuted = list(net.permuted_hosts(seed=7))
+
+    assert sorted(permuted) == list(net.hosts())
+    assert list(net.permuted_hosts(seed=7)) == permuted
+
+
+def test_permuted_hosts_seed():
+    net = types.IPv4Network("10.0.0.0/24")
+
+    assert list(net.permuted_hosts(seed=1)) != list(net.permuted_hosts(seed=2))
+    assert list(net.permuted_hosts(seed=1)) != list(net.hosts())
+
+
+def test_sample():
+    net = types.IPv4Network("10.0.0.0/8")
+    sample = net.sample(1000, seed=3)
+
+    assert len(set(sample)) == 1000
+    assert all(host in net.hosts() for host in sample)
+    assert net.sample(1000, seed=3) == sample
+    assert net.sample(0) == []
+    assert sorted(types.IPv4Network("10.0.0.0/30").sample(2)) == [
+        types.IPv4Address("10.0.0.1"),
+        types.IPv4Address("10.0.0.2"),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("k", "exc"),
+    ((-1, ValueError), (255, ValueError), (1.0, TypeError), ("1", TypeError)),
+)
+def test_sample_error(k, exc):
+    with pytest.raises(exc):
+        types.IPv4Network("10.0.0.0/24").sample(k)
+
+
 @pytest.mark.parametrize(
     ("ipv4net", "subnet", "expected"),
     (
@@ -813,3 +977,137 @@ def test_overlaps_type_error(net, other):
     """Test overlaps raises TypeError for non-IPv4Network argument."""
     with pytest.raises(TypeError):
         net.overlaps(other)
+
+
+@pytest.mark.parametrize(
+    ("net", "others", "expected"),
+    (
+        (
+            types.IPv4Network("10.0.0.0/24"),
+            (types.IPv4Network("10.0.0.64/26"),),
+            ("10.0.0.0/26", "10.0.0.128/25"),
+        ),
+        (
+            types.IPv4Network("10.0.0.0/30"),
+            (types.IPv4Network("10.0.0.3/32"),),
+            ("10.0.0.0/31", "10.0.0.2/32"),
+        ),
+        (
+            types.IPv4Network("10.0.0.0/24"),
+            (types.IPv4Network("10.0.0.0/24"),),
+            (),
+        ),
+        (
+            types.IPv4Network("10.0.0.0/24"),
+            (types.IPv4Network("10.0.0.0/8"),),
+            (),
+        ),
+        (
+            types.IPv4Network("10.0.0.0/24"),
+            (types.IPv4Network("10.0.1.0/24"),),
+            ("10.0.0.0/24",),
+        ),
+        (
+            types.IPv4Network("10.0.0.0/24"),
+            (),
+            ("10.0.0.0/24",),
+        ),
+        (
+            types.IPv4Network("10.0.0.0/24"),
+            (
+                types.IPv4Network("10.0.0.128/26"),
+                types.IPv4Network("10.0.0.0/26"),
+                types.IPv4Network("10.0.0.0/27"),
+            ),
+            ("10.0.0.64/26", "10.0.0.192/26"),
+        ),
+        (
+            types.IPv4Network("0.0.0.0/0"),
+            (types.IPv4Network("255.255.255.255/32"),),
+            (
+                "0.0.0.0/1",
+                "128.0.0.0/2",
+                "192.0.0.0/3",
+                "224.0.0.0/4",
+                "240.0.0.0/5",
+                "248.0.0.0/6",
+                "252.0.0.0/7",
+                "254.0.0.0/8",
+                "255.0.0.0/9",
+                "255.128.0.0/10",
+                "255.192.0.0/11",
+                "255.224.0.0/12",
+                "255.240.0.0/13",
+                "255.248.0.0/14",
+                "255.252.0.0/15",
+                "255.254.0.0/16",
+                "255.255.0.0/17",
+                "255.255.128.0/18",
+                "255.255.192.0/19",
+                "255.255.224.0/20",
+                "255.255.240.0/21",
+                "255.255.248.0/22",
+                "255.255.252.0/23",
+                "255.255.254.0/24",
+                "255.255.255.0/25",
+                "255.255.255.128/26",
+                "255.255.255.192/27",
+                "255.255.255.224/28",
+                "255.255.255.240/29",
+                "255.255.255.248/30",
+                "255.255.255.252/31",
+                "255.255.255.254/32",
+            ),
+        ),
+    ),
+)
+def test_exclude_ok(net, others, expected):
+    assert [str(subnet) for subnet in net.exclude(*others)] == list(expected)
+
+
+def test_exclude_is_lazy():
+    subnets = types.IPv4Network("10.0.0.0/8").exclude(types.IPv4Network("10.1.2.3/32"))
+    assert next(subnets) == types.IPv4Network("10.0.0.0/16")
+
+
+@pytest.mark.parametrize("other", ("10.0.0.0/24", None, types.IPv4Address("10.0.0.1")))
+def test_exclude_type_error(other):
+    with pytest.raises(TypeError):
+        list(types.IPv4Network("10.0.0.0/24").exclude(other))
+
+
+def test_masks_shared():
+    left = types.IPv4Network("10.0.0.0/8")
+    right = types.IPv4Network.from_int(0x0B000000, 8)
+    assert left.netmask is right.netmask
+    assert left.hostmask is right.hostmask
+    assert left._broadcast is None
+
+
+@pytest.mark.parametrize(
+    "string",
+    (
+        "10.0.0.0/8",
+        "10.0.0.1",
+        "10/8",
+        "10.0",
+        "10.1.2/24",
+        "10.0.0.0/32",
+        "10.1.0.0/8",
+        "10.0.0.0.0",
+        "10.0/24",
+        "10.0.0.0/33",
+        "10/",
+        "foo",
+        "",
+        256,
+    ),
+)
+def test_try_parse_matches_parse(string):
+    try:
+        expected = types.IPv4Network.parse(string)
+    except ValueError:
+        expected = None
+
+    assert types.IPv4Network.try_parse(string) == expected
+    assert types.IPv4Network.is_valid(string) is (expected is not None)
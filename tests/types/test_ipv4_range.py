@@ -0,0 +1,152 @@
+import pytest
+
+from netsome import types
+
+
+@pytest.mark.parametrize(
+    ("string", "first", "last"),
+    (
+        ("10.0.0.5-10.0.3.200", "10.0.0.5", "10.0.3.200"),
+        ("0.0.0.0-255.255.255.255", "0.0.0.0", "255.255.255.255"),
+        ("1.1.1.1-1.1.1.1", "1.1.1.1", "1.1.1.1"),
+    ),
+)
+def test_init_ok(string, first, last):
+    rng = types.IPv4Range(string)
+    assert rng.first == types.IPv4Address(first)
+    assert rng.last == types.IPv4Address(last)
+    assert str(rng) == string
+    assert repr(rng) == f'IPv4Range("{string}")'
+
+
+@pytest.mark.parametrize("test_input", (0, 1.1, [], None))
+def test_init_type_error(test_input):
+    with pytest.raises(TypeError):
+        types.IPv4Range(test_input)
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    (
+        "10.0.0.5",
+        "10.0.0.5-",
+        "10.0.0.5-10.0.0.256",
+        "10.0.0.5-10.0.0.4",
+        "10.0.0.5/24",
+    ),
+)
+def test_init_value_error(test_input):
+    with pytest.raises(ValueError):
+        types.IPv4Range(test_input)
+
+
+def test_from_addresses():
+    first = types.IPv4Address("10.0.0.1")
+    last = types.IPv4Address("10.0.0.9")
+    assert types.IPv4Range.from_addresses(first, last) == types.IPv4Range(
+        "10.0.0.1-10.0.0.9"
+    )
+
+    with pytest.raises(TypeError):
+        types.IPv4Range.from_addresses("10.0.0.1", last)
+
+    with pytest.raises(ValueError):
+        types.IPv4Range.from_addresses(last, first)
+
+
+def test_from_int():
+    assert types.IPv4Range.from_int(0, 255) == types.IPv4Range("0.0.0.0-0.0.0.255")
+
+
+def test_from_network():
+    assert types.IPv4Range.from_network(
+        types.IPv4Network("10.0.0.0/24")
+    ) == types.IPv4Range("10.0.0.0-10.0.0.255")
+
+    with pytest.raises(TypeError):
+        types.IPv4Range.from_network("10.0.0.0/24")
+
+
+@pytest.mark.parametrize(
+    ("string", "size"),
+    (
+        ("1.1.1.1-1.1.1.1", 1),
+        ("10.0.0.5-10.0.3.200", 964),
+        ("0.0.0.0-255.255.255.255", 2**32),
+    ),
+)
+def test_len(string, size):
+    assert len(types.IPv4Range(string)) == size
+    assert types.IPv4Range(string).size == size
+
+
+def test_contains():
+    rng = types.IPv4Range("10.0.0.5-10.0.3.200")
+    assert types.IPv4Address("10.0.0.5") in rng
+    assert types.IPv4Address("10.0.3.200") in rng
+    assert types.IPv4Address("10.0.2.0") in rng
+    assert types.IPv4Address("10.0.0.4") not in rng
+    assert types.IPv4Address("10.0.3.201") not in rng
+
+    with pytest.raises(TypeError):
+        "10.0.0.5" in rng
+
+
+@pytest.mark.parametrize(
+    ("left", "right", "expected"),
+    (
+        ("10.0.0.0-10.0.0.10", "10.0.0.10-10.0.0.20", True),
+        ("10.0.0.0-10.0.0.10", "10.0.0.11-10.0.0.20", False),
+        ("10.0.0.0-10.0.0.255", "10.0.0.5-10.0.0.6", True),
+        ("10.0.0.5-10.0.0.6", "10.0.0.0-10.0.0.255", True),
+    ),
+)
+def test_overlaps(left, right, expected):
+    assert types.IPv4Range(left).overlaps(types.IPv4Range(right)) is expected
+    assert types.IPv4Range(right).overlaps(types.IPv4Range(left)) is expected
+
+
+def test_overlaps_type_error():
+    with pytest.raises(TypeError):
+        types.IPv4Range("10.0.0.0-10.0.0.10").overlaps(types.IPv4Network("10.0.0.0/8"))
+
+
+@pytest.mark.parametrize(
+    ("string", "expected"),
+    (
+        ("10.0.0.0-10.0.0.255", ["10.0.0.0/24"]),
+        ("10.0.0.0-10.0.2.255", ["10.0.0.0/23", "10.0.2.0/24"]),
+        ("0.0.0.0-255.255.255.255", ["0.0.0.0/0"]),
+        ("255.255.255.255-255.255.255.255", ["255.255.255.255/32"]),
+        (
+            "10.0.0.5-10.0.0.10",
+            ["10.0.0.5/32", "10.0.0.6/31", "10.0.0.8/31", "10.0.0.10/32"],
+        ),
+    ),
+)
+def test_networks(string, expected):
+    assert [str(network) for network in types.IPv4Range(string).networks()] == expected
+
+
+def test_comparison():
+    low = types.IPv4Range("10.0.0.0-10.0.0.10")
+    high = types.IPv4Range("10.0.0.1-10.0.0.2")
+    assert low < high and low <= high
+    assert high > low and high >= low
+    assert hash(low) == hash(types.IPv4Range("10.0.0.0-10.0.0.10"))
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (
+        ("10.0.0.1-10.0.0.9", types.IPv4Range("10.0.0.1-10.0.0.9")),
+        ("10.0.0.1-10.0.0.1", types.IPv4Range("10.0.0.1-10.0.0.1")),
+        ("10.0.0.9-10.0.0.1", None),
+        ("10.0.0.1", None),
+        ("10.0.0.1-foo", None),
+        (None, None),
+    ),
+)
+def test_try_parse(value, expected):
+    assert types.IPv4Range.try_parse(value) == expected
+    assert types.IPv4Range.is_valid(value) is (expected is not None)
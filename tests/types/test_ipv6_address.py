@@ -246,3 +246,19 @@ def test_comparison_with_different_types():
         addr > "string"
     with pytest.raises(TypeError):
         addr >= "string"
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (
+        ("2001:db8::1", types.IPv6Address("2001:db8::1")),
+        ("::ffff:192.0.2.1", types.IPv6Address("::ffff:192.0.2.1")),
+        ("2001:db8::1::2", None),
+        ("2001:db8::g", None),
+        ("10.0.0.1", None),
+        (1, None),
+    ),
+)
+def test_try_parse(value, expected):
+    assert types.IPv6Address.try_parse(value) == expected
+    assert types.IPv6Address.is_valid(value) is (expected is not None)
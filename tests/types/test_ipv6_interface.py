@@ -147,3 +147,17 @@ def test_network_calculation():
     # For /64, network should be 2001:db8:1:2::/64
     assert str(iface.network) == "2001:db8:1:2::/64"
     assert iface.network.contains_address(iface.address)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (
+        ("2001:db8::1/64", types.IPv6Interface("2001:db8::1/64")),
+        ("2001:db8::1", None),
+        ("2001:db8::1/129", None),
+        (None, None),
+    ),
+)
+def test_try_parse(value, expected):
+    assert types.IPv6Interface.try_parse(value) == expected
+    assert types.IPv6Interface.is_valid(value) is (expected is not None)
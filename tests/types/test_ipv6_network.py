@@ -32,6 +32,7 @@ def test_init_type_error(test_input):
         "2001:db8::1/129",  # Invalid prefix length
         "2001:db8::1/32",  # Host bits set
         "2001:db8:1::/32",  # Host bits set
+        "2001:db8::1/0",  # Host bits set, every bit is a host bit at /0
     ),
 )
 def test_init_value_error(test_input):
@@ -59,16 +60,12 @@ def test_from_int_ok(int_addr, prefixlen, expected):
         (c.IPV6.ADDRESS_MAX + 1, 64),  # Address too large
         (0, -1),  # Invalid prefix length
         (0, 129),  # Prefix length too large
-        (1, 0),  # Host bits set for /0 should be OK actually
+        (1, 0),  # Host bits set, every bit is a host bit at /0
     ),
 )
 def test_from_int_error(int_addr, prefixlen):
-    if int_addr == 1 and prefixlen == 0:
-        # This should actually work since /0 includes all addresses
+    with pytest.raises((TypeError, ValueError)):
         types.IPv6Network.from_int(int_addr, prefixlen)
-    else:
-        with pytest.raises((TypeError, ValueError)):
-            types.IPv6Network.from_int(int_addr, prefixlen)
 
 
 @pytest.mark.parametrize(
@@ -137,6 +134,24 @@ def test_subnets_default():
     assert all(sub.prefixlen == 33 for sub in subnets)
 
 
+def test_subnets_view():
+    net = types.IPv6Network("::/0")
+    subnets = net.subnets(64)
+
+    assert subnets.size == 2**64
+    assert subnets[-1] == types.IPv6Network("ffff:ffff:ffff:ffff::/64")
+    assert subnets[2**63] == types.IPv6Network("8000::/64")
+    assert list(subnets[:: 2**62]) == [
+        types.IPv6Network(f"{i:x}000::/64") for i in range(0, 16, 4)
+    ]
+    assert next(reversed(subnets)) == subnets[-1]
+    assert types.IPv6Network("2001:db8::/64") in subnets
+    assert types.IPv6Network("2001:db8::/65") not in subnets
+    assert subnets.index(types.IPv6Network("0:0:0:1::/64")) == 1
+    with pytest.raises(OverflowError):
+        len(subnets)
+
+
 def test_subnets_error():
     net = types.IPv6Network("2001:db8::/32")
 
@@ -185,6 +200,67 @@ def test_hosts_small_network():
     assert str(hosts[3]) == "2001:db8::3"
 
 
+@pytest.mark.parametrize(
+    ("network", "size"),
+    (
+        ("2001:db8::1/128", 1),
+        ("2001:db8::/127", 2),
+        ("2001:db8::/64", 2**64),
+        ("::/0", 2**128),
+    ),
+)
+def test_hosts_range(network, size):
+    net = types.IPv6Network(network)
+    hosts = net.hosts()
+
+    assert isinstance(hosts, types.HostRange)
+    assert hosts.size == size
+    assert hosts[0] == net.netaddress
+    assert hosts[-1] == net.host_at(-1)
+    assert net.host_at(-1) in hosts
+    assert hosts.index(net.host_at(-1)) == size - 1
+    assert next(reversed(hosts)) == net.host_at(-1)
+
+
+def test_hosts_range_slicing_and_batches():
+    net = types.IPv6Network("2001:db8::/64")
+    hosts = net.hosts()
+
+    assert list(hosts[2**63 : 2**63 + 2]) == [
+        types.IPv6Address("2001:db8::8000:0:0:0"),
+        types.IPv6Address("2001:db8::8000:0:0:1"),
+    ]
+    assert hosts[:: 2**62].size == 4
+    assert types.IPv6Address("2001:db9::") not in hosts
+    assert next(hosts.batched(3)) == [net.host_at(i) for i in range(3)]
+    assert next(hosts.batched(2**40, raw=True)) == range(
+        int(net.netaddress), int(net.netaddress) + 2**40
+    )
+
+
+def test_permuted_hosts():
+    net = types.IPv6Network("2001:db8::/118")
+    permuted = list(net.permuted_hosts(seed=5))
+
+    assert sorted(permuted) == list(net.hosts())
+    assert list(net.permuted_hosts(seed=5)) == permuted
+    assert list(net.permuted_hosts(seed=6)) != permuted
+
+
+def test_sample():
+    net = types.IPv6Network("2001:db8::/64")
+    sample = net.sample(1000, seed=9)
+
+    assert len(set(sample)) == 1000
+    assert all(net.contains_address(address) for address in sample)
+    assert net.sample(1000, seed=9) == sample
+    assert types.IPv6Network("2001:db8::1/128").sample(1) == [
+        types.IPv6Address("2001:db8::1")
+    ]
+    with pytest.raises(ValueError):
+        types.IPv6Network("2001:db8::/127").sample(3)
+
+
 def test_contains_address():
     net = types.IPv6Network("2001:db8::/32")
 
@@ -609,3 +685,84 @@ def test_overlaps_type_error(net, other):
     """Test overlaps raises TypeError for non-IPv6Network argument."""
     with pytest.raises(TypeError):
         net.overlaps(other)
+
+
+@pytest.mark.parametrize(
+    ("net", "others", "expected"),
+    (
+        (
+            types.IPv6Network("2001:db8::/32"),
+            (types.IPv6Network("2001:db8:4000::/34"),),
+            ("2001:db8::/34", "2001:db8:8000::/33"),
+        ),
+        (
+            types.IPv6Network("2001:db8::/126"),
+            (types.IPv6Network("2001:db8::3/128"),),
+            ("2001:db8::/127", "2001:db8::2/128"),
+        ),
+        (
+            types.IPv6Network("2001:db8::/64"),
+            (types.IPv6Network("2001:db8::/32"),),
+            (),
+        ),
+        (
+            types.IPv6Network("2001:db8::/64"),
+            (types.IPv6Network("2001:db9::/64"),),
+            ("2001:db8::/64",),
+        ),
+        (
+            types.IPv6Network("2001:db8::/62"),
+            (
+                types.IPv6Network("2001:db8:0:3::/64"),
+                types.IPv6Network("2001:db8::/64"),
+            ),
+            ("2001:db8:0:1::/64", "2001:db8:0:2::/64"),
+        ),
+    ),
+)
+def test_exclude_ok(net, others, expected):
+    assert [str(subnet) for subnet in net.exclude(*others)] == list(expected)
+
+
+def test_exclude_large_network():
+    net = types.IPv6Network("::/0")
+    subnets = list(net.exclude(types.IPv6Network("2001:db8::1/128")))
+    assert len(subnets) == 128
+    assert subnets == sorted(subnets)
+
+
+@pytest.mark.parametrize(
+    "other", ("2001:db8::/64", None, types.IPv4Network("1.0.0.0/8"))
+)
+def test_exclude_type_error(other):
+    with pytest.raises(TypeError):
+        list(types.IPv6Network("2001:db8::/32").exclude(other))
+
+
+def test_masks_shared():
+    left = types.IPv6Network("2001:db8::/32")
+    right = types.IPv6Network.from_int(0x20010DB9 << 96, 32)
+    assert left.netmask is right.netmask
+    assert left.hostmask is right.hostmask
+
+
+@pytest.mark.parametrize(
+    "string",
+    (
+        "2001:db8::/32",
+        "2001:db8::1",
+        "2001:db8::1/32",
+        "2001:db8::/129",
+        "2001:db8::/",
+        "foo",
+        None,
+    ),
+)
+def test_try_parse_matches_parse(string):
+    try:
+        expected = types.IPv6Network.parse(string)
+    except ValueError:
+        expected = None
+
+    assert types.IPv6Network.try_parse(string) == expected
+    assert types.IPv6Network.is_valid(string) is (expected is not None)
@@ -0,0 +1,97 @@
+import pytest
+
+from netsome import types
+
+
+@pytest.mark.parametrize(
+    ("string", "first", "last"),
+    (
+        ("2001:db8::1-2001:db8::4", "2001:db8::1", "2001:db8::4"),
+        (
+            "::-ffff:ffff:ffff:ffff:ffff:ffff:ffff:ffff",
+            "::",
+            "ffff:ffff:ffff:ffff:ffff:ffff:ffff:ffff",
+        ),
+    ),
+)
+def test_init_ok(string, first, last):
+    rng = types.IPv6Range(string)
+    assert rng.first == types.IPv6Address(first)
+    assert rng.last == types.IPv6Address(last)
+    assert str(rng) == string
+
+
+@pytest.mark.parametrize("test_input", (0, 1.1, [], None))
+def test_init_type_error(test_input):
+    with pytest.raises(TypeError):
+        types.IPv6Range(test_input)
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    ("2001:db8::1", "2001:db8::4-2001:db8::1", "2001:db8::1-2001:db8::g"),
+)
+def test_init_value_error(test_input):
+    with pytest.raises(ValueError):
+        types.IPv6Range(test_input)
+
+
+def test_size():
+    rng = types.IPv6Range("::-ffff:ffff:ffff:ffff:ffff:ffff:ffff:ffff")
+    assert rng.size == 2**128
+
+    with pytest.raises(OverflowError):
+        len(rng)
+
+    assert len(types.IPv6Range("2001:db8::1-2001:db8::4")) == 4
+
+
+def test_contains():
+    rng = types.IPv6Range("2001:db8::1-2001:db8::4")
+    assert types.IPv6Address("2001:db8::1") in rng
+    assert types.IPv6Address("2001:db8::4") in rng
+    assert types.IPv6Address("2001:db8::5") not in rng
+
+    with pytest.raises(TypeError):
+        types.IPv4Address("1.1.1.1") in rng
+
+
+def test_overlaps():
+    rng = types.IPv6Range("2001:db8::1-2001:db8::4")
+    assert rng.overlaps(types.IPv6Range("2001:db8::4-2001:db8::8"))
+    assert not rng.overlaps(types.IPv6Range("2001:db8::5-2001:db8::8"))
+
+
+@pytest.mark.parametrize(
+    ("string", "expected"),
+    (
+        (
+            "2001:db8::1-2001:db8::4",
+            ["2001:db8::1/128", "2001:db8::2/127", "2001:db8::4/128"],
+        ),
+        ("::-ffff:ffff:ffff:ffff:ffff:ffff:ffff:ffff", ["::/0"]),
+        ("2001:db8::-2001:db8:ffff:ffff:ffff:ffff:ffff:ffff", ["2001:db8::/32"]),
+    ),
+)
+def test_networks(string, expected):
+    assert [str(network) for network in types.IPv6Range(string).networks()] == expected
+
+
+def test_from_network():
+    assert types.IPv6Range.from_network(
+        types.IPv6Network("2001:db8::/126")
+    ) == types.IPv6Range("2001:db8::-2001:db8::3")
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (
+        ("2001:db8::1-2001:db8::9", types.IPv6Range("2001:db8::1-2001:db8::9")),
+        ("2001:db8::9-2001:db8::1", None),
+        ("2001:db8::1", None),
+        (None, None),
+    ),
+)
+def test_try_parse(value, expected):
+    assert types.IPv6Range.try_parse(value) == expected
+    assert types.IPv6Range.is_valid(value) is (expected is not None)
@@ -347,3 +347,32 @@ def test_gt(mac):
 def test_ge(mac):
     assert mac >= types.MacAddress.from_int(mac._addr - 1)
     assert mac >= types.MacAddress.from_int(mac._addr)
+
+
+@pytest.mark.parametrize(
+    "value",
+    (
+        "aa:bb:cc:dd:ee:ff",
+        "aa-bb-cc-dd-ee-ff",
+        "aabb.ccdd.eeff",
+        "aabbccddeeff",
+        "AABBCCDDEEFF",
+        187723572702975,
+        "aa:bb-cc:dd:ee:ff",
+        "aabbccddeef",
+        "aabbccddeefg",
+        "0",
+        -1,
+        c.MAC.ADDRESS_MAX + 1,
+        1.1,
+        None,
+    ),
+)
+def test_try_parse_matches_parse(value):
+    try:
+        expected = types.MacAddress.parse(value)
+    except ValueError:
+        expected = None
+
+    assert types.MacAddress.try_parse(value) == expected
+    assert types.MacAddress.is_valid(value) is (expected is not None)
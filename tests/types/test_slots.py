@@ -0,0 +1,68 @@
+import sys
+
+import pytest
+
+from netsome import types
+
+
+@pytest.mark.parametrize(
+    "obj",
+    (
+        types.IPv4Address("10.0.0.1"),
+        types.IPv4Network("10.0.0.0/8"),
+        types.IPv4Interface("10.0.0.1/8"),
+        types.IPv4Range("10.0.0.1-10.0.0.9"),
+        types.IPv6Address("2001:db8::1"),
+        types.IPv6Network("2001:db8::/32"),
+        types.IPv6Interface("2001:db8::1/32"),
+        types.IPv6Range("2001:db8::1-2001:db8::9"),
+        types.MacAddress("001122334455"),
+        types.ASN(65000),
+        types.Community(65000),
+        types.VID(100),
+        types.VlanSet([100]),
+        types.Interface("GigabitEthernet0/1"),
+        types.IPSet(),
+    ),
+)
+def test_no_instance_dict(obj):
+    str(obj)
+    assert not hasattr(obj, "__dict__")
+
+
+class _DictLayout:
+    # layout of the types before __slots__, attributes in the instance dict
+    pass
+
+
+def _slot_values(obj):
+    return {
+        name: getattr(obj, name)
+        for klass in type(obj).__mro__
+        for name in getattr(klass, "__slots__", ())
+        if name != "__weakref__" and hasattr(obj, name)
+    }
+
+
+@pytest.mark.parametrize(
+    "obj",
+    (
+        types.IPv4Address("10.0.0.1"),
+        types.IPv4Network("10.0.0.0/8"),
+        types.IPv6Address("2001:db8::1"),
+        types.IPv6Network("2001:db8::/32"),
+        types.MacAddress("001122334455"),
+        types.ASN(65000),
+        types.VID(100),
+    ),
+)
+def test_footprint(obj):
+    # same attribute values in both layouts, only the per-instance storage
+    # is compared
+    str(obj)
+    old = _DictLayout()
+    old.__dict__.update(_slot_values(obj))
+    assert old.__dict__
+    slotted = sys.getsizeof(obj)
+    with_dict = sys.getsizeof(old) + sys.getsizeof(old.__dict__)
+    assert slotted < with_dict * 0.75
@@ -0,0 +1,101 @@
+import pytest
+
+from netsome import types
+
+
+def _vid(value):
+    if isinstance(value, str):
+        return types.VID.from_str(value)
+
+    return types.VID(value)
+
+
+# raising counterpart of every try_parse(), see docs/api.md
+PARSERS = (
+    (types.ASN, types.ASN.parse),
+    (types.Community, types.Community.from_str),
+    (types.VID, _vid),
+    (types.VlanSet, types.VlanSet.from_string),
+    (types.MacAddress, types.MacAddress.parse),
+    (types.Interface, types.Interface),
+    (types.IPv4Address, types.IPv4Address),
+    (types.IPv4Network, types.IPv4Network.parse),
+    (types.IPv4Interface, types.IPv4Interface),
+    (types.IPv4Range, types.IPv4Range),
+    (types.IPv6Address, types.IPv6Address),
+    (types.IPv6Network, types.IPv6Network.parse),
+    (types.IPv6Interface, types.IPv6Interface),
+    (types.IPv6Range, types.IPv6Range),
+)
+
+INPUTS = (
+    "",
+    " ",
+    "0",
+    "10",
+    " 10",
+    "10 ",
+    "+5",
+    "-1",
+    "1_0",
+    "١٠",
+    "65000",
+    " 65000",
+    "65_000",
+    "4294967296",
+    "1.10",
+    "1.65536",
+    "65536.0",
+    " 1.2",
+    "1:2",
+    " 1:2",
+    "1:+2",
+    "1:65536",
+    "1:2:3",
+    "1-10,20",
+    "4096",
+    "10.0.0.1",
+    "10.0.0.0/8",
+    "10.0.0.1/8",
+    "10.0.0.0/33",
+    "010.0.0.1",
+    "10.0.0.1-10.0.0.5",
+    "10.0.0.5-10.0.0.1",
+    "2001:db8::1",
+    "2001:db8::/32",
+    "2001:db8::1/0",
+    "::/0",
+    "2001:DB8::1",
+    "2001:db8::1-2001:db8::5",
+    "00:11:22:33:44:55",
+    "0011.2233.4455",
+    "00-11-22-33-44-55",
+    "00:11:22-33:44:55",
+    "GigabitEthernet0/1",
+    "Gi0/1",
+    0,
+    -1,
+    4096,
+    2**32,
+    1.0,
+    None,
+    b"10",
+)
+
+
+def _raises(parse, value):
+    try:
+        parse(value)
+    except (TypeError, ValueError):
+        return True
+
+    return False
+
+
+@pytest.mark.parametrize(("cls", "parse"), PARSERS)
+@pytest.mark.parametrize("value", INPUTS)
+def test_try_parse_matches_raising_path(cls, parse, value):
+    parsed = cls.try_parse(value)
+    assert (parsed is None) is _raises(parse, value)
+    if parsed is not None:
+        assert parsed == parse(value)
@@ -0,0 +1,153 @@
+import pytest
+
+from netsome import constants as c
+from netsome import types
+
+
+@pytest.fixture
+def vlan_set():
+    return types.VlanSet.from_string("1-10,20,4000-4094")
+
+
+def test_init():
+    vlans = types.VlanSet([types.VID(1), 2, 3, 4095])
+    assert vlans.bitmap == 0b1111 ^ 1 | 1 << 4095
+    assert len(vlans) == 4
+
+
+@pytest.mark.parametrize("vids", (["1"], [1.1], [None]))
+def test_init_type_error(vids):
+    with pytest.raises(TypeError):
+        types.VlanSet(vids)
+
+
+@pytest.mark.parametrize("vids", ([-1], [4096]))
+def test_init_value_error(vids):
+    with pytest.raises(ValueError):
+        types.VlanSet(vids)
+
+
+@pytest.mark.parametrize(
+    ("string", "expected"),
+    (
+        ("1-10,20,4000-4094", "1-10,20,4000-4094"),
+        ("20, 1-10,5", "1-10,20"),
+        ("[ 1-10 20 ]", "1-10,20"),
+        ("100", "100"),
+        ("1-1", "1"),
+        ("0,4095", "0,4095"),
+        ("all", "1-4094"),
+        ("none", "none"),
+        ("", "none"),
+        ("[ ]", "none"),
+    ),
+)
+def test_from_string(string, expected):
+    assert str(types.VlanSet.from_string(string)) == expected
+
+
+@pytest.mark.parametrize(
+    "string",
+    ("1-", "-1", "10-1", "4096", "1-4096", "a", "1,,x", "1--2", "+1", "²", "١٠", "1-²"),
+)
+def test_from_string_value_error(string):
+    with pytest.raises(ValueError):
+        types.VlanSet.from_string(string)
+
+
+@pytest.mark.parametrize("string", (1, None, b"1-10"))
+def test_from_string_type_error(string):
+    with pytest.raises(TypeError):
+        types.VlanSet.from_string(string)
+
+
+@pytest.mark.parametrize(
+    ("style", "expected"),
+    (
+        (c.VLAN_RANGE_STYLES.CISCO, "1-10,20,4000-4094"),
+        (c.VLAN_RANGE_STYLES.ARISTA, "1-10,20,4000-4094"),
+        (c.VLAN_RANGE_STYLES.JUNIPER, "[ 1-10 20 4000-4094 ]"),
+        ("juniper", "[ 1-10 20 4000-4094 ]"),
+    ),
+)
+def test_to_string(vlan_set, style, expected):
+    assert vlan_set.to_string(style) == expected
+
+
+def test_to_string_juniper_single():
+    vlans = types.VlanSet.from_string("100-200")
+    assert vlans.to_string(c.VLAN_RANGE_STYLES.JUNIPER) == "100-200"
+
+
+def test_ranges(vlan_set):
+    assert list(vlan_set.ranges()) == [(1, 10), (20, 20), (4000, 4094)]
+
+
+def test_from_int():
+    assert types.VlanSet.from_int(0b110).to_string() == "1-2"
+    with pytest.raises(ValueError):
+        types.VlanSet.from_int(1 << 4096)
+
+    with pytest.raises(TypeError):
+        types.VlanSet.from_int("1")
+
+
+def test_contains(vlan_set):
+    assert types.VID(1) in vlan_set
+    assert 4094 in vlan_set
+    assert types.VID(11) not in vlan_set
+    assert -1 not in vlan_set
+
+    with pytest.raises(TypeError):
+        "1" in vlan_set
+
+
+def test_iter(vlan_set):
+    vids = list(vlan_set)
+    assert vids[:3] == [types.VID(1), types.VID(2), types.VID(3)]
+    assert len(vids) == len(vlan_set) == 106
+
+
+def test_set_operations(vlan_set):
+    other = types.VlanSet.from_string("5-25")
+    assert str(vlan_set | other) == "1-25,4000-4094"
+    assert str(vlan_set & other) == "5-10,20"
+    assert str(vlan_set - other) == "1-4,4000-4094"
+    assert str(vlan_set ^ other) == "1-4,11-19,21-25,4000-4094"
+    assert not vlan_set.isdisjoint(other)
+    assert (vlan_set & other) <= other
+    assert (vlan_set & other) < other
+    assert vlan_set >= types.VlanSet([1, 20])
+    assert not vlan_set > vlan_set
+
+
+def test_eq_hash(vlan_set):
+    same = types.VlanSet.from_string("[ 1-10 20 4000-4094 ]")
+    assert vlan_set == same
+    assert hash(vlan_set) == hash(same)
+    assert vlan_set != types.VlanSet()
+    assert not types.VlanSet()
+
+
+def test_repr(vlan_set):
+    assert repr(vlan_set) == 'VlanSet.from_string("1-10,20,4000-4094")'
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (
+        ("1-10,20", types.VlanSet.from_string("1-10,20")),
+        ("[ 1-10 20 ]", types.VlanSet.from_string("1-10,20")),
+        ("none", types.VlanSet()),
+        ("10-1", None),
+        ("1-4096", None),
+        ("1,x", None),
+        ("²", None),
+        ("١٠", None),
+        ("1-١٠", None),
+        (None, None),
+    ),
+)
+def test_try_parse(value, expected):
+    assert types.VlanSet.try_parse(value) == expected
+    assert types.VlanSet.is_valid(value) is (expected is not None)
@@ -113,3 +113,43 @@ def test_init(vid, expected):
 )
 def test_str(vid, expected):
     assert str(vid) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (
+        (100, types.VID(100)),
+        ("4095", types.VID(4095)),
+        (4096, None),
+        ("-1", None),
+        ("10a", None),
+        (1.0, None),
+    ),
+)
+def test_try_parse(value, expected):
+    assert types.VID.try_parse(value) == expected
+    assert types.VID.is_valid(value) is (expected is not None)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (
+        ("0", types.VID(0)),
+        ("100", types.VID(100)),
+        ("4095", types.VID(4095)),
+    ),
+)
+def test_from_str(value, expected):
+    assert types.VID.from_str(value) == expected
+
+
+@pytest.mark.parametrize("value", ("4096", "-1", "+1", " 1", "1_0", "١٠", ""))
+def test_from_str_value_error(value):
+    with pytest.raises(ValueError):
+        types.VID.from_str(value)
+
+
+@pytest.mark.parametrize("value", (100, None, b"100"))
+def test_from_str_type_error(value):
+    with pytest.raises(TypeError):
+        types.VID.from_str(value)
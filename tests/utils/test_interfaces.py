@@ -0,0 +1,90 @@
+import pytest
+
+from netsome.types import Interface
+from netsome.utils import compact_interfaces
+from netsome.utils import expand_interfaces
+
+
+def interfaces(*names):
+    return [Interface(name) for name in names]
+
+
+@pytest.mark.parametrize(
+    ("names", "expected"),
+    (
+        ((), ()),
+        (("Gi1/0/1",), ("GigabitEthernet1/0/1",)),
+        (("Gi1/0/1", "Gi1/0/2", "Gi1/0/3"), ("GigabitEthernet1/0/1-3",)),
+        (("Gi1/0/1", "Gi1/0/1", "Gi1/0/2"), ("GigabitEthernet1/0/1-2",)),
+        (
+            ("Gi1/0/1", "Gi1/0/2", "Gi1/0/4"),
+            ("GigabitEthernet1/0/1-2", "GigabitEthernet1/0/4"),
+        ),
+        (
+            ("Gi1/0/48", "Gi1/1/1", "Gi2/0/1"),
+            ("GigabitEthernet1/0/48", "GigabitEthernet1/1/1", "GigabitEthernet2/0/1"),
+        ),
+        (
+            ("Gi1/0/1.10", "Gi1/0/1.11"),
+            ("GigabitEthernet1/0/1.10", "GigabitEthernet1/0/1.11"),
+        ),
+        (("Fa0/1", "Gi0/2"), ("FastEthernet0/1", "GigabitEthernet0/2")),
+        (("Po1", "Po2", "Vlan10", "Vlan11"), ("PortChannel1-2", "Vlan10-11")),
+    ),
+)
+def test_compact_interfaces(names, expected):
+    assert tuple(compact_interfaces(interfaces(*names))) == expected
+
+
+def test_compact_interfaces_abbreviated():
+    ports = interfaces(*(f"GigabitEthernet1/0/{i}" for i in range(1, 25)))
+    assert list(compact_interfaces(ports, abbreviated=True)) == ["GE1/0/1-24"]
+
+
+def test_compact_interfaces_invalid():
+    with pytest.raises(TypeError):
+        list(compact_interfaces(["Gi1/0/1"]))
+
+
+@pytest.mark.parametrize(
+    ("string", "expected"),
+    (
+        ("", ()),
+        ("Gi1/0/1", ("Gi1/0/1",)),
+        ("Gi1/0/1-3", ("Gi1/0/1", "Gi1/0/2", "Gi1/0/3")),
+        ("Gi1/0/1 - 2, Gi2/0/5", ("Gi1/0/1", "Gi1/0/2", "Gi2/0/5")),
+        ("Gi1/0/7-7", ("Gi1/0/7",)),
+        ("Port-channel1", ("Po1",)),
+        ("Port-channel1-2", ("Po1", "Po2")),
+        ("Vlan9-11,", ("Vlan9", "Vlan10", "Vlan11")),
+        ("Gi1/0/1.100", ("Gi1/0/1.100",)),
+    ),
+)
+def test_expand_interfaces(string, expected):
+    assert list(expand_interfaces(string)) == interfaces(*expected)
+
+
+def test_expand_interfaces_lazy():
+    ranges = expand_interfaces("Eth1/1-1000000000")
+    assert next(ranges) == Interface("Eth1/1")
+    assert next(ranges) == Interface("Eth1/2")
+
+
+def test_expand_compact_roundtrip():
+    string = "GE1/0/1-24, GE2/0/1-48, Po1-4, Vlan10"
+    assert ", ".join(compact_interfaces(expand_interfaces(string), True)) == string
+
+
+@pytest.mark.parametrize(
+    ("string", "exc"),
+    (
+        (None, TypeError),
+        ("Gi1/0/5-3", ValueError),
+        ("Gi1/0/1.100-200", ValueError),
+        ("Gi1/0/1-x", ValueError),
+        ("foo1-3", ValueError),
+    ),
+)
+def test_expand_interfaces_invalid(string, exc):
+    with pytest.raises(exc):
+        list(expand_interfaces(string))
@@ -0,0 +1,124 @@
+import ipaddress
+import random
+
+import pytest
+
+from netsome import types
+from netsome.utils import collapse_networks
+from netsome.utils import summarize_range
+
+
+def networks(*items):
+    return [
+        types.IPv4Network.parse(i) if "." in i else types.IPv6Network.parse(i)
+        for i in items
+    ]
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    (
+        ((), ()),
+        (("10.0.0.0/24",), ("10.0.0.0/24",)),
+        (("10.0.0.0/25", "10.0.0.128/25"), ("10.0.0.0/24",)),
+        (("10.0.0.128/25", "10.0.0.0/25"), ("10.0.0.0/24",)),
+        (("10.0.1.0/24", "10.0.2.0/24"), ("10.0.1.0/24", "10.0.2.0/24")),
+        (("10.0.0.0/8", "10.1.0.0/16", "10.1.1.0/24"), ("10.0.0.0/8",)),
+        (("10.1.1.0/24", "10.0.0.0/8"), ("10.0.0.0/8",)),
+        (("10.0.0.0/24", "10.0.0.0/24"), ("10.0.0.0/24",)),
+        (
+            ("10.0.0.0/24", "10.0.1.0/25", "10.0.1.128/26", "10.0.1.192/26"),
+            ("10.0.0.0/23",),
+        ),
+        (("0.0.0.0/1", "128.0.0.0/1"), ("0.0.0.0/0",)),
+        (("2001:db8::/33", "2001:db8:8000::/33"), ("2001:db8::/32",)),
+        (("::/1", "8000::/1", "10.0.0.0/8"), ("10.0.0.0/8", "::/0")),
+    ),
+)
+def test_collapse_networks(test_input, expected):
+    assert collapse_networks(networks(*test_input)) == networks(*expected)
+
+
+def test_collapse_networks_generator():
+    subnets = types.IPv4Network("10.0.0.0/16").subnets(prefixlen=24)
+    assert collapse_networks(subnets) == networks("10.0.0.0/16")
+
+
+@pytest.mark.parametrize("test_input", (["10.0.0.0/8"], [types.IPv4Address("1.1.1.1")]))
+def test_collapse_networks_type_error(test_input):
+    with pytest.raises(TypeError):
+        collapse_networks(test_input)
+
+
+def test_collapse_networks_matches_stdlib():
+    rnd = random.Random(4)
+    items = []
+    for _ in range(2000):
+        prefixlen = rnd.randint(20, 28)
+        addr = rnd.randrange(2**20) & (2**32 - 2 ** (32 - prefixlen))
+        items.append(types.IPv4Network.from_int(addr, prefixlen))
+
+    expected = ipaddress.collapse_addresses(
+        ipaddress.IPv4Network(str(i)) for i in items
+    )
+    assert [str(i) for i in collapse_networks(items)] == [str(i) for i in expected]
+
+
+@pytest.mark.parametrize(
+    ("first", "last", "expected"),
+    (
+        (
+            types.IPv4Address("10.0.0.5"),
+            types.IPv4Address("10.0.3.200"),
+            networks(
+                "10.0.0.5/32",
+                "10.0.0.6/31",
+                "10.0.0.8/29",
+                "10.0.0.16/28",
+                "10.0.0.32/27",
+                "10.0.0.64/26",
+                "10.0.0.128/25",
+                "10.0.1.0/24",
+                "10.0.2.0/24",
+                "10.0.3.0/25",
+                "10.0.3.128/26",
+                "10.0.3.192/29",
+                "10.0.3.200/32",
+            ),
+        ),
+        (
+            types.IPv6Address("2001:db8::"),
+            types.IPv6Address("2001:db8::ff"),
+            networks("2001:db8::/120"),
+        ),
+    ),
+)
+def test_summarize_range(first, last, expected):
+    assert list(summarize_range(first, last)) == expected
+
+
+def test_summarize_range_matches_stdlib():
+    first, last = "10.0.0.5", "10.200.3.201"
+    expected = ipaddress.summarize_address_range(
+        ipaddress.IPv4Address(first), ipaddress.IPv4Address(last)
+    )
+    result = summarize_range(types.IPv4Address(first), types.IPv4Address(last))
+    assert [str(i) for i in result] == [str(i) for i in expected]
+
+
+@pytest.mark.parametrize(
+    ("first", "last"),
+    (
+        ("10.0.0.1", "10.0.0.2"),
+        (types.IPv4Address("10.0.0.1"), types.IPv6Address("::1")),
+        (types.IPv6Address("::1"), types.IPv4Address("10.0.0.1")),
+    ),
+)
+def test_summarize_range_type_error(first, last):
+    with pytest.raises(TypeError):
+        list(summarize_range(first, last))
+
+
+def test_summarize_range_value_error():
+    with pytest.raises(ValueError):
+        summarize_range(types.IPv4Address("10.0.0.2"), types.IPv4Address("10.0.0.1"))
@@ -0,0 +1,199 @@
+import pytest
+
+from netsome import types
+from netsome.utils import AddressPool
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def pool(clock):
+    return AddressPool(types.IPv4Network("192.168.0.0/24"), clock=clock)
+
+
+def test_allocate_order(pool):
+    assert pool.size == 256
+    # network and broadcast addresses are reserved
+    assert pool.allocated == 2
+    assert pool.allocate() == types.IPv4Address("192.168.0.1")
+    assert pool.allocate() == types.IPv4Address("192.168.0.2")
+    assert len(pool) == 4
+    assert pool.free == 252
+
+
+def test_allocate_exhausted(pool):
+    allocated = [pool.allocate() for _ in range(254)]
+    assert allocated[-1] == types.IPv4Address("192.168.0.254")
+    with pytest.raises(ValueError):
+        pool.allocate()
+
+
+@pytest.mark.parametrize(
+    ("network", "first", "size"),
+    (
+        ("10.0.0.0/31", "10.0.0.0", 2),
+        ("10.0.0.1/32", "10.0.0.1", 1),
+        ("10.0.0.0/8", "10.0.0.1", 2**24 - 2),
+    ),
+)
+def test_host_rules(network, first, size):
+    pool = AddressPool(types.IPv4Network(network))
+    assert pool.allocate() == types.IPv4Address(first)
+    assert pool.free == size - 1
+
+
+def test_allocate_specific(pool):
+    address = types.IPv4Address("192.168.0.1")
+    assert pool.allocate_specific(address) == address
+    assert address in pool
+    assert pool.allocate() == types.IPv4Address("192.168.0.2")
+
+    with pytest.raises(ValueError):
+        pool.allocate_specific(address)
+
+    with pytest.raises(ValueError):
+        pool.allocate_specific(types.IPv4Address("192.168.1.1"))
+
+
+def test_release(pool):
+    addresses = [pool.allocate() for _ in range(100)]
+    pool.release(addresses[10])
+    assert not pool.is_allocated(addresses[10])
+    assert pool.allocate() == addresses[10]
+
+    with pytest.raises(ValueError):
+        pool.release(types.IPv4Address("192.168.0.200"))
+
+
+def test_release_full_word():
+    pool = AddressPool(types.IPv4Network("10.0.0.0/16"))
+    pool.reserve(types.IPv4Network("10.0.0.0/17"))
+    pool.release(types.IPv4Address("10.0.64.7"))
+    assert pool.allocate() == types.IPv4Address("10.0.64.7")
+    assert pool.allocate() == types.IPv4Address("10.0.128.0")
+
+
+@pytest.mark.parametrize(
+    ("item", "allocated"),
+    (
+        (types.IPv4Address("192.168.0.1"), 3),
+        (types.IPv4Network("192.168.0.0/25"), 129),
+        (types.IPv4Range("192.168.0.1-192.168.0.10"), 12),
+    ),
+)
+def test_reserve(pool, item, allocated):
+    pool.reserve(item)
+    assert pool.allocated == allocated
+
+
+def test_reserve_outside(pool):
+    with pytest.raises(ValueError):
+        pool.reserve(types.IPv4Network("192.168.0.0/23"))
+
+
+def test_ipv6_pool():
+    pool = AddressPool(types.IPv6Network("2001:db8::/64"))
+    assert pool.size == 2**64
+    assert pool.allocate() == types.IPv6Address("2001:db8::")
+    pool.reserve(types.IPv6Network("2001:db8::/112"))
+    assert pool.allocate() == types.IPv6Address("2001:db8::1:0")
+    assert pool.allocated == 2**16 + 1
+
+
+def test_ipv6_reserve_large():
+    pool = AddressPool(types.IPv6Network("2001:db8::/64"))
+    pool.reserve(types.IPv6Network("2001:db8::/72"))
+    pool.reserve(types.IPv6Range("2001:db8::100:0:0:3-2001:db8::7fff:ffff:ffff:fff0"))
+    assert pool.allocated == 2**63 - 18
+    assert pool.allocate() == types.IPv6Address("2001:db8::100:0:0:0")
+
+    address = types.IPv6Address("2001:db8::12:3456:789a")
+    pool.release(address)
+    assert not pool.is_allocated(address)
+    assert pool.is_allocated(types.IPv6Address("2001:db8::12:3456:789b"))
+    assert pool.allocated == 2**63 - 18
+
+    restored = AddressPool.restore(pool.snapshot())
+    assert restored.allocated == pool.allocated
+    assert restored.allocate() == address
+    assert restored.allocate() == types.IPv6Address("2001:db8::100:0:0:1")
+
+
+def test_leases(pool, clock):
+    address = pool.allocate(lease=10)
+    other = pool.allocate(lease=30)
+    clock.now = 5
+    assert pool.expire() == []
+
+    clock.now = 11
+    assert pool.expire() == [address]
+    assert not pool.is_allocated(address)
+    assert pool.is_allocated(other)
+
+    pool.renew(other, 60)
+    clock.now = 40
+    assert pool.expire() == []
+    clock.now = 75
+    assert pool.expire() == [other]
+
+
+def test_lease_expired_on_allocate(pool, clock):
+    address = pool.allocate(lease=1)
+    clock.now = 100
+    assert pool.allocate() == address
+
+
+def test_renew_not_allocated(pool):
+    with pytest.raises(ValueError):
+        pool.renew(types.IPv4Address("192.168.0.1"), 10)
+
+
+def test_snapshot_restore(clock):
+    pool = AddressPool(types.IPv6Network("2001:db8::/120"), clock=clock)
+    pool.reserve(types.IPv6Network("2001:db8::/122"))
+    leased = pool.allocate(lease=10)
+    kept = pool.allocate()
+
+    restored = AddressPool.restore(pool.snapshot(), clock=clock)
+    assert restored.network == pool.network
+    assert restored.allocated == pool.allocated
+    assert restored.is_allocated(kept)
+
+    clock.now = 20
+    assert restored.expire() == [leased]
+
+
+def test_restore_invalid():
+    data = AddressPool(types.IPv4Network("10.0.0.0/24")).snapshot()
+    with pytest.raises(ValueError):
+        AddressPool.restore(data[:-1])
+
+    with pytest.raises(ValueError):
+        AddressPool.restore(b"XXXX" + data[4:])
+
+    with pytest.raises(TypeError):
+        AddressPool.restore("data")
+
+
+@pytest.mark.parametrize(
+    "network", ("10.0.0.0/24", types.IPv4Address("10.0.0.0"), None)
+)
+def test_network_type_error(network):
+    with pytest.raises(TypeError):
+        AddressPool(network)
+
+
+def test_address_type_error(pool):
+    with pytest.raises(TypeError):
+        pool.allocate_specific(types.IPv6Address("::1"))
@@ -0,0 +1,128 @@
+import random
+
+import pytest
+
+from netsome import types
+from netsome.utils import PrefixAllocator
+
+
+@pytest.fixture
+def allocator():
+    return PrefixAllocator(types.IPv6Network("2001:db8::/32"))
+
+
+def test_allocate_lowest_first(allocator):
+    assert allocator.allocate(56) == types.IPv6Network("2001:db8::/56")
+    assert allocator.allocate(60) == types.IPv6Network("2001:db8:0:100::/60")
+    assert allocator.allocate(60) == types.IPv6Network("2001:db8:0:110::/60")
+    assert allocator.allocate(56) == types.IPv6Network("2001:db8:0:200::/56")
+    assert len(allocator) == 4
+
+
+def test_allocate_exhausted():
+    allocator = PrefixAllocator(types.IPv4Network("10.0.0.0/24"))
+    assert allocator.allocate(25) == types.IPv4Network("10.0.0.0/25")
+    assert allocator.allocate(26) == types.IPv4Network("10.0.0.128/26")
+    assert allocator.allocate(26) == types.IPv4Network("10.0.0.192/26")
+    assert allocator.utilization == 1.0
+
+    with pytest.raises(ValueError):
+        allocator.allocate(32)
+
+
+@pytest.mark.parametrize("prefixlen", (31, 129))
+def test_allocate_prefixlen_value_error(allocator, prefixlen):
+    with pytest.raises(ValueError):
+        allocator.allocate(prefixlen)
+
+
+@pytest.mark.parametrize("prefixlen", ("56", 56.0, None))
+def test_allocate_prefixlen_type_error(allocator, prefixlen):
+    with pytest.raises(TypeError):
+        allocator.allocate(prefixlen)
+
+
+def test_free_coalesces(allocator):
+    subnets = [allocator.allocate(60) for _ in range(16)]
+    assert allocator.stats()[60] == (16, 0)
+
+    for subnet in subnets:
+        allocator.free(subnet)
+
+    assert len(allocator) == 0
+    assert allocator.stats() == {32: (0, 1)}
+
+
+def test_free_not_allocated(allocator):
+    allocator.allocate(56)
+    with pytest.raises(ValueError):
+        allocator.free(types.IPv6Network("2001:db8::/60"))
+
+    with pytest.raises(ValueError):
+        allocator.free(types.IPv6Network("2001:db9::/56"))
+
+
+def test_allocate_specific(allocator):
+    subnet = types.IPv6Network("2001:db8:0:ff00::/56")
+    assert allocator.allocate_specific(subnet) == subnet
+    assert subnet in allocator
+    # buddy of the specific subnet is used before splitting larger blocks
+    assert allocator.allocate(56) == types.IPv6Network("2001:db8:0:fe00::/56")
+
+    with pytest.raises(ValueError):
+        allocator.allocate_specific(types.IPv6Network("2001:db8:0:ff00::/60"))
+
+    with pytest.raises(ValueError):
+        allocator.allocate_specific(types.IPv6Network("2001:db8::/48"))
+
+    allocator.free(subnet)
+    assert not allocator.is_allocated(subnet)
+
+
+def test_whole_network():
+    network = types.IPv4Network("10.0.0.0/24")
+    allocator = PrefixAllocator(network)
+
+    assert allocator.allocate(24) == network
+    assert allocator.is_allocated(network)
+    assert network in allocator
+    allocator.free(network)
+    assert not allocator.is_allocated(network)
+    assert allocator.allocate_specific(network) == network
+    assert allocator.utilization == 1.0
+
+    with pytest.raises(ValueError):
+        allocator.free(types.IPv4Network("10.0.0.0/23"))
+
+
+def test_type_error(allocator):
+    with pytest.raises(TypeError):
+        allocator.free(types.IPv4Network("10.0.0.0/8"))
+
+    with pytest.raises(TypeError):
+        PrefixAllocator("2001:db8::/32")
+
+
+def test_random_allocations_do_not_overlap():
+    rnd = random.Random(0)
+    allocator = PrefixAllocator(types.IPv4Network("10.0.0.0/16"))
+    allocated = []
+    for _ in range(2000):
+        if allocated and rnd.random() < 0.4:
+            allocator.free(allocated.pop(rnd.randrange(len(allocated))))
+            continue
+
+        try:
+            allocated.append(allocator.allocate(rnd.randint(20, 30)))
+        except ValueError:
+            pass
+
+    assert sorted(allocated) == list(allocator)
+    assert allocator.allocated == sum(2 ** (32 - n.prefixlen) for n in allocated)
+    for left, right in zip(sorted(allocated), sorted(allocated)[1:]):
+        assert int(left.broadcast) < int(right.netaddress)
+
+    for subnet in allocated:
+        allocator.free(subnet)
+
+    assert allocator.stats() == {16: (0, 1)}
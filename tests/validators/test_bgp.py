@@ -48,13 +48,39 @@ def test_validate_asdotplus_type_error(test_input):
 
 @pytest.mark.parametrize(
     "test_input",
-    ("0.0.0.1", "-100", "100"),
+    ("0.0.0.1", "-100", "100", "1.65536", "65536.0", "1.-1", "a.1"),
 )
 def test_validate_asdotplus_value_error(test_input):
     with pytest.raises(ValueError):
         valids.validate_asdotplus(test_input)
 
 
+@pytest.mark.parametrize(
+    "test_input",
+    ("0", "65535", "4294967295"),
+)
+def test_validate_asplain_str_ok(test_input):
+    valids.validate_asplain_str(test_input) is None
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    (65535, 0.1, [], None),
+)
+def test_validate_asplain_str_type_error(test_input):
+    with pytest.raises(TypeError):
+        valids.validate_asplain_str(test_input)
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    ("", "-1", "+5", " 65000", "65000 ", "65_000", "١٠", "4294967296"),
+)
+def test_validate_asplain_str_value_error(test_input):
+    with pytest.raises(ValueError):
+        valids.validate_asplain_str(test_input)
+
+
 @pytest.mark.parametrize(
     "test_input",
     ("65535.0", "0.0", "0.1", "1.0", "1", "0", "65535"),
@@ -74,7 +100,7 @@ def test_validate_asdot_type_error(test_input):
 
 @pytest.mark.parametrize(
     "test_input",
-    ("0.0.0.1", "-100", "65536", "4294967296"),
+    ("0.0.0.1", "-100", "65536", "4294967296", " 1", "+1", "1_0"),
 )
 def test_validate_asdot_value_error(test_input):
     with pytest.raises(ValueError):
@@ -100,7 +126,19 @@ def test_validate_community_type_error(test_input):
 
 @pytest.mark.parametrize(
     "test_input",
-    ("0.0.0.1", "-100", "65536", "4294967296", "65535:0:0", "65700:0", "0:65700"),
+    (
+        "0.0.0.1",
+        "-100",
+        "65536",
+        "4294967296",
+        "65535:0:0",
+        "65700:0",
+        "0:65700",
+        " 1:2",
+        "1:+2",
+        "1_0:2",
+        "1:",
+    ),
 )
 def test_validate_community_value_error(test_input):
     with pytest.raises(ValueError):
@@ -0,0 +1,165 @@
+import pytest
+
+from netsome import constants as c
+from netsome import types
+from netsome.validators import validate_many
+
+
+E = c.VALIDATION_ERRORS
+
+
+@pytest.mark.parametrize(
+    ("kind", "values", "expected"),
+    (
+        (
+            c.VALIDATION_KINDS.IPV4_ADDRESS,
+            ["10.0.0.1", "10.0.0.256", None],
+            [(1, "10.0.0.256", E.FORMAT), (2, None, E.TYPE)],
+        ),
+        (
+            "ipv4_network",
+            ["10.0.0.0/8", "10.0.0.1/8", "10.0.0.0/33"],
+            [(1, "10.0.0.1/8", E.HOST_BITS), (2, "10.0.0.0/33", E.FORMAT)],
+        ),
+        (
+            "ipv6_address",
+            ["2001:db8::1", "2001:db8::g"],
+            [(1, "2001:db8::g", E.FORMAT)],
+        ),
+        (
+            "ipv6_network",
+            ["2001:db8::/32", "2001:db8::1/32", 1],
+            [(1, "2001:db8::1/32", E.HOST_BITS), (2, 1, E.TYPE)],
+        ),
+        (
+            "mac",
+            ["00:11:22:33:44:55", "0011.2233.4455", "00:11:22:33:44"],
+            [(2, "00:11:22:33:44", E.FORMAT)],
+        ),
+        (
+            "vlan",
+            ["100", 4095, "4096", "ten", 1.0],
+            [(2, "4096", E.RANGE), (3, "ten", E.FORMAT), (4, 1.0, E.TYPE)],
+        ),
+        (
+            "asn",
+            ["65000", "1.10", 4_294_967_296, "65000a", "1.65536", "65536.0"],
+            [
+                (2, 4_294_967_296, E.RANGE),
+                (3, "65000a", E.FORMAT),
+                (4, "1.65536", E.RANGE),
+                (5, "65536.0", E.RANGE),
+            ],
+        ),
+        (
+            "interface",
+            ["GigabitEthernet0/1", "Gi0/1", "Foo0/1", None],
+            [(2, "Foo0/1", E.FORMAT), (3, None, E.TYPE)],
+        ),
+    ),
+)
+def test_validate_many(kind, values, expected):
+    assert list(validate_many(kind, iter(values))) == expected
+
+
+def _vid(value):
+    if isinstance(value, str):
+        return types.VID.from_str(value)
+
+    return types.VID(value)
+
+
+# type a kind stands for, see validate_many()
+CONSTRUCTORS = (
+    ("ipv4_address", types.IPv4Address),
+    ("ipv4_network", types.IPv4Network),
+    ("ipv6_address", types.IPv6Address),
+    ("ipv6_network", types.IPv6Network),
+    ("mac", types.MacAddress.parse),
+    ("vlan", _vid),
+    ("asn", types.ASN.parse),
+    ("interface", types.Interface),
+)
+
+PARITY_INPUTS = (
+    "",
+    "0",
+    "100",
+    " 100",
+    "+5",
+    "1_0",
+    "١٠",
+    "4096",
+    "65000",
+    " 65000",
+    "4294967296",
+    "1.10",
+    "1.65536",
+    "65536.0",
+    "10.0.0.1",
+    "010.0.0.1",
+    "10.0.0.0/8",
+    "10.0.0.1/8",
+    "10.0.0.0/33",
+    "2001:db8::1",
+    "2001:db8::/32",
+    "2001:db8::1/0",
+    "2001:db8::1/129",
+    "00:11:22:33:44:55",
+    "0011.2233.4455",
+    "00-11-22-33-44-55",
+    "001122334455",
+    "00:11:22:33:44",
+    "GigabitEthernet0/1",
+    "Gi0/1",
+    "Foo0/1",
+    0,
+    -1,
+    4095,
+    2**32,
+    2**48,
+    1.0,
+    None,
+)
+
+
+def _raises(constructor, value):
+    try:
+        constructor(value)
+    except (TypeError, ValueError):
+        return True
+
+    return False
+
+
+@pytest.mark.parametrize(("kind", "constructor"), CONSTRUCTORS)
+def test_validate_many_matches_constructor(kind, constructor):
+    reports = validate_many(kind, PARITY_INPUTS, errors_only=False)
+    for _, value, code in reports:
+        assert (code is not None) is _raises(constructor, value), value
+
+
+def test_validate_many_all_rows():
+    reports = list(validate_many("vlan", ["1", "x"], errors_only=False))
+    assert reports == [(0, "1", None), (1, "x", E.FORMAT)]
+
+
+def test_validate_many_workers():
+    values = [f"10.0.{i % 300}.0/24" for i in range(1000)]
+    expected = list(validate_many("ipv4_network", values))
+    assert len(expected) == 132
+    reports = validate_many("ipv4_network", iter(values), workers=2, chunksize=64)
+    assert list(reports) == expected
+
+
+@pytest.mark.parametrize(
+    ("kind", "kwargs"),
+    (
+        ("foo", {}),
+        ("vlan", {"workers": 0}),
+        ("vlan", {"chunksize": 0}),
+    ),
+)
+def test_validate_many_value_error(kind, kwargs):
+    with pytest.raises(ValueError):
+        validate_many(kind, [], **kwargs)
@@ -170,7 +170,7 @@ def test_validate_network_int_ok(address, prefixlen):
 
 @pytest.mark.parametrize(
     ("address", "prefixlen"),
-    ((255, 24),),
+    ((255, 24), (0, 33), (0, -1)),
 )
 def test_validate_network_int_value_error(address, prefixlen):
     with pytest.raises(ValueError):
@@ -47,6 +47,8 @@ class TestValidateAddressStr:
             "fe80::1",
             "ff02::1",
             "::ffff:192.0.2.1",
+            "::192.0.2.1",
+            "64:ff9b::192.0.2.1",
         ),
     )
     def test_ok(self, test_input):
@@ -67,6 +69,8 @@ class TestValidateAddressStr:
             "2001:db8::12345",  # Group too long
             "2001:db8:1:2:3:4:5:6:7:8:9",  # Too many groups
             "::ffff:256.1.1.1",  # Invalid IPv4 in mapped
+            ":1::",  # Empty group
+            "1.2.3.4::",  # IPv4 not in the last 32 bits
         ),
     )
     def test_value_error(self, test_input):
@@ -262,12 +266,18 @@ class TestValidateNetworkInt:
                 0x20010DB8000000000000000000000001,
                 64,
             ),  # Host bits set (host portion has bit set)
+            (0x20010DB8000000000000000000000001, 0),  # 2001:db8::1/0
         ),
     )
     def test_host_bits_set_error(self, address, prefixlen):
         with pytest.raises(ValueError, match="Host bits set"):
             valids.validate_network_int(address, prefixlen)
 
+    @pytest.mark.parametrize("prefixlen", (-1, 129))
+    def test_prefixlen_value_error(self, prefixlen):
+        with pytest.raises(ValueError):
+            valids.validate_network_int(0, prefixlen)
+
 
 class TestValidateIpv4InIpv6:
     @pytest.mark.parametrize(
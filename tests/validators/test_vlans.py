@@ -27,3 +27,29 @@ def test_validate_vid_type_error(test_input):
 def test_validate_vid_value_error(test_input):
     with pytest.raises(ValueError):
         valids.validate_vid(test_input)
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    ("0", "1", "4095"),
+)
+def test_validate_vid_str_ok(test_input):
+    valids.validate_vid_str(test_input) is None
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    (1, 1.0, [], None),
+)
+def test_validate_vid_str_type_error(test_input):
+    with pytest.raises(TypeError):
+        valids.validate_vid_str(test_input)
+
+
+@pytest.mark.parametrize(
+    "test_input",
+    ("", "-1", "+1", " 1", "1_0", "١٠", "4096"),
+)
+def test_validate_vid_str_value_error(test_input):
+    with pytest.raises(ValueError):
+        valids.validate_vid_str(test_input)